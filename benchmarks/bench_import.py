@@ -0,0 +1,88 @@
+"""Benchmarks the import time of the groups package against a budget
+
+The package is imported in a fresh interpreter with python -X importtime, the CLI pays this cost on every run.
+The budget applies to the self time of the src.groups modules, the total also includes attrs and the
+standard library, which take most of it and vary a lot between machines.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N] [--budget-ms MS]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Modules that importing the package must not pull in
+UNEXPECTED_MODULES = ("unittest", "asyncio", "ipfs_api", "multihash", "base58", "cbor2")
+
+# The first import writes the bytecode cache, which PYTHONDONTWRITEBYTECODE would turn off
+ENV = {name: value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+
+
+def _import_time() -> tuple[int, int, dict[str, int]]:
+    """Imports the package once
+
+    Returns:
+        tuple[int, int, dict[str, int]]: The cumulative import time, the self time of the src.groups modules,
+            and the self time of each module, in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import src.groups'],
+        cwd=ROOT, env=ENV, capture_output=True, text=True, check=True)
+
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(self_us)
+
+    total: int = int(result.stderr.splitlines()[-1].split('|')[1])
+    own: int = sum(self_us for name, self_us in modules.items() if name == 'src' or name.startswith('src.'))
+    return total, own, modules
+
+
+def _unexpected_modules() -> list[str]:
+    code = f'import sys, src.groups; print(",".join(m for m in {UNEXPECTED_MODULES!r} if m in sys.modules))'
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=ENV, capture_output=True, text=True, check=True)
+    return [name for name in result.stdout.strip().split(',') if name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Package import time benchmark')
+    parser.add_argument('--runs', type=int, default=10, help='Number of fresh interpreters to import in')
+    parser.add_argument('--budget-ms', type=float, default=50.0, help='Median self time of the src.groups modules to stay under')
+    args = parser.parse_args()
+
+    # The first run compiles the bytecode cache
+    _import_time()
+    totals: list[int] = []
+    owns: list[int] = []
+    modules: dict[str, int] = {}
+    for _ in range(args.runs):
+        total, own, modules = _import_time()
+        totals.append(total)
+        owns.append(own)
+
+    median_ms = statistics.median(owns) / 1000
+    print(f'import src.groups: median {statistics.median(totals) / 1000:7.1f}ms, min {min(totals) / 1000:7.1f}ms over {args.runs} runs')
+    print(f'src.groups modules: median {median_ms:7.1f}ms, min {min(owns) / 1000:7.1f}ms')
+    print('slowest modules (self time):')
+    for name, self_us in sorted(modules.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f'    {self_us / 1000:7.2f}ms  {name}')
+
+    unexpected = _unexpected_modules()
+    if unexpected:
+        print(f'unexpected modules imported: {", ".join(unexpected)}')
+
+    if median_ms > args.budget_ms or unexpected:
+        print(f'over budget of {args.budget_ms:.1f}ms' if median_ms > args.budget_ms else 'unexpected imports')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Benchmarks for building a MerkleTree with each backend
+
+Usage:
+    python benchmarks/bench_merkle_tree.py [--leaves N]
+"""
+import argparse
+import hashlib
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from src.groups.utils.crypto import MerkleTree
+
+
+def _leaves(count: int) -> tuple[bytes, ...]:
+    return tuple(hashlib.sha256(i.to_bytes(8, 'big')).digest() for i in range(count))
+
+
+def bench_build(leaves: tuple[bytes, ...], backend: str) -> tuple[float, int, str]:
+    """Times building a tree and measures the memory it holds on to"""
+    start = time.perf_counter()
+    MerkleTree(leaves, backend=backend)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    tree = MerkleTree(leaves, backend=backend)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, size, tree.root()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MerkleTree construction benchmark')
+    parser.add_argument('--leaves', type=int, default=100_000, help='Number of leaves in the tree')
+    args = parser.parse_args()
+
+    leaves = _leaves(args.leaves)
+    roots = set()
+    for backend in ('flat', 'levels'):
+        elapsed, size, root = bench_build(leaves, backend)
+        roots.add(root)
+        print(f'{backend:<6}: {args.leaves:>9} leaves in {elapsed:8.3f}s, {size / args.leaves:8.1f} bytes/leaf')
+
+    assert len(roots) == 1, 'backends built different roots'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""Benchmarks for inserting Group Units into a Pool
+
+The Pool is grown to each of the sizes, the per-insert times at every size show whether an insert
+stays constant as the Pool grows. The Group Units are hashed before they are timed, so only the Pool is measured.
+
+Usage:
+    python benchmarks/bench_pool.py [--sizes N,N,...] [--window N] [--tuple-inserts N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from src.groups.base.container import BaseContainer
+from src.groups.base.value import BaseValue
+from src.groups.pool import Pool, GroupUnitEntry
+from src.groups.unit import GroupUnit, Credential, Data, Owner, Nonce
+
+
+def _group_units(start: int, stop: int) -> list[GroupUnit]:
+    owner = Owner()
+    credential = Credential()
+    group_units = [
+        GroupUnit(
+            Nonce(BaseContainer((i, ), "tuple")),
+            owner,
+            credential,
+            Data(BaseContainer((BaseValue(f"user_{i}"), BaseValue(i)), "tuple")))
+        for i in range(start, stop)
+    ]
+
+    # The hashes are cached on the Group Units, the Pool then reuses them
+    for group_unit in group_units:
+        group_unit.data._hash_root()
+        group_unit.nonce._hash_root()
+
+    return group_units
+
+
+def bench_pool_growth(sizes: list[int], window: int) -> list[tuple[int, float, float]]:
+    """Grows a single Pool to each size and times the inserts on the way
+
+    Up to window inserts before each size, the Pool is filled with Pool.add_group_units, which adds
+    the whole batch in one step. The last window inserts go through Pool.add_group_unit, one at a time.
+
+    Returns:
+        list[tuple[int, float, float]]: The size, then the seconds per insert of the batch and of the single inserts
+    """
+    pool = Pool()
+    results: list[tuple[int, float, float]] = []
+
+    for size in sizes:
+        count: int = len(pool.group_units)
+        group_units = _group_units(count + 1, max(size - window, count) + 1)
+        start = time.perf_counter()
+        pool.add_group_units(group_units)
+        batch_elapsed = time.perf_counter() - start
+        batch_per_insert = batch_elapsed / len(group_units) if len(group_units) > 0 else 0.0
+
+        count = len(pool.group_units)
+        group_units = _group_units(count + 1, size + 1)
+        start = time.perf_counter()
+        for group_unit in group_units:
+            pool.add_group_unit(group_unit)
+        elapsed = time.perf_counter() - start
+
+        assert len(pool.group_units) == size
+        results.append((size, batch_per_insert, elapsed / len(group_units) if len(group_units) > 0 else 0.0))
+
+    return results
+
+
+def bench_tuple_concatenation(count: int) -> float:
+    """Times the previous storage, which re-concatenated the tuple of entries on every insert"""
+    entries = [
+        GroupUnitEntry(group_unit.data._hash_root(), group_unit.nonce._hash_root(), group_unit)
+        for group_unit in _group_units(1, count + 1)
+    ]
+    group_units: tuple = ()
+
+    start = time.perf_counter()
+    for entry in entries:
+        group_units += (entry, )
+    elapsed = time.perf_counter() - start
+
+    assert len(group_units) == count
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pool insert benchmark')
+    parser.add_argument('--sizes', type=lambda value: [int(size) for size in value.split(',')], default=[10_000, 100_000, 1_000_000],
+                        help='Comma separated sizes the Pool is grown to')
+    parser.add_argument('--window', type=int, default=10_000, help='Number of single inserts timed before each size')
+    parser.add_argument('--tuple-inserts', type=int, default=20_000, help='Number of entries for the tuple concatenation baseline')
+    args = parser.parse_args()
+
+    for size, batch_per_insert, per_insert in bench_pool_growth(sorted(args.sizes), args.window):
+        print(f'Pool of {size:>9}: add_group_units {batch_per_insert * 1e6:8.3f} us/insert, add_group_unit {per_insert * 1e6:8.3f} us/insert')
+
+    elapsed = bench_tuple_concatenation(args.tuple_inserts)
+    print(f'tuple concat:    {args.tuple_inserts:>9} inserts in {elapsed:8.3f}s ({elapsed / args.tuple_inserts * 1e6:.3f} us/insert)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Benchmarks the binary Pool snapshot against the JSON state, and the lazily decoded memory-mapped snapshot
+
+Usage:
+    python benchmarks/bench_snapshot.py [--units N]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from src.groups.base.container import BaseContainer
+from src.groups.base.value import BaseValue
+from src.groups.pool import Pool
+from src.groups.unit import GroupUnit, Credential, Data, Owner, Nonce
+
+
+def _pool(count: int) -> Pool:
+    pool = Pool()
+    pool.add_group_units(
+        GroupUnit(
+            Nonce(BaseContainer((i, ), "tuple")),
+            Owner(),
+            Credential(),
+            Data(BaseContainer((BaseValue(f"user_{i}"), BaseValue(i), BaseValue(i * 0.5)), "tuple")))
+        for i in range(1, count + 1))
+    return pool
+
+
+def _timed(function, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pool snapshot benchmark')
+    parser.add_argument('--units', type=int, default=10_000, help='Number of Group Units in the Pool')
+    args = parser.parse_args()
+
+    pool = _pool(args.units)
+
+    json_dump, json_data = _timed(lambda: json.dumps(pool.to_dict(), indent=4))
+    json_load, _ = _timed(lambda: Pool.from_dict(json.loads(json_data)))
+
+    binary_dump, binary_data = _timed(pool.to_bytes)
+    binary_load, _ = _timed(Pool.from_bytes, binary_data)
+
+    print(f'json:   {len(json_data.encode()):>11} bytes, dump {json_dump:7.3f}s, load {json_load:7.3f}s')
+    print(f'binary: {len(binary_data):>11} bytes, dump {binary_dump:7.3f}s, load {binary_load:7.3f}s')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'pool.snapshot')
+        pool.write_snapshot(path)
+        mmap_open, opened = _timed(Pool.open_snapshot, path)
+        with opened:
+            mmap_iterate, _ = _timed(lambda: sum(1 for _ in opened))
+        print(f'mmap:   {len(binary_data):>11} bytes, open {mmap_open:7.3f}s, decode all {mmap_iterate:7.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,49 @@
 from attrs import define, field, Factory, validators, asdict
 import os
 import json
+import logging
 from io import open
+from typing import Iterator, Optional
 
 
 from .controller import Controller
+from .journal import Journal
+from .persistence import PersistenceWorker
+from .pool import Pool, GroupUnitEntry
+from .utils.crypto import MerkleTrie
 from .unit import GroupUnit
 
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
 @define(slots=True, weakref_slot=False)
 class Groups:
+    """The Groups class holds the Controller and persists its Pool to a state file
+
+    Notes:
+        A state_file ending with '.jsonl' is written and read as JSON Lines, one Group Unit at a time:
+            {"root": str | None, "count": int}
+            {"package_hash": str, "nonce_hash": str, "group_unit": dict}
+            ...
+        Dropping a Groups never writes its state file, save it with save_state(), flush() or close() first.
+        Only the journal file is closed, the changes still pending on the persistence worker are dropped with
+        a warning. Persistence workers that are still open at interpreter exit are closed, which saves their changes.
+        The persistence worker saves a snapshot of the Pool and the active Group Unit, see Controller._snapshot().
+
+    Args:
+        state_file (str): The path of the state file. Defaults to 'groups.json'.
+        log_level (Optional[int | str]): The level of the groups logger. Defaults to None.
+        journal (bool): Append each added Group Unit to '<state_file>.journal' instead of
+            rewriting the state file. Defaults to False.
+        sync_every (int): The number of journal records between two fsyncs. Defaults to 64.
+        compact_every (Optional[int]): The number of journal records after which the
+            state file is rewritten and the journal truncated. Defaults to 1024.
+        background_save (bool): Save the state file on a PersistenceWorker thread whenever Group Units
+            are added. Defaults to False.
+        save_delay (float): The seconds the worker waits to save more changes at once. Defaults to 0.1.
+    """
     controller: Controller = field(
         validator=validators.instance_of(Controller),
         default=Factory(Controller))
@@ -18,24 +52,228 @@ class Groups:
         validator=validators.instance_of(str),
         default='groups.json')
 
-    def __init__(self, state_file='groups.json'):
+    journal: Optional[Journal] = field(
+        validator=validators.optional(validators.instance_of(Journal)),
+        default=None)
+
+    worker: Optional[PersistenceWorker] = field(
+        validator=validators.optional(validators.instance_of(PersistenceWorker)),
+        default=None)
+
+    def __init__(
+        self,
+        state_file='groups.json',
+        log_level: Optional[int | str] = None,
+        journal: bool = False,
+        sync_every: int = 64,
+        compact_every: Optional[int] = 1024,
+        background_save: bool = False,
+        save_delay: float = 0.1
+    ):
+        if log_level is not None:
+            self.set_log_level(log_level)
+
         self.controller = Controller()
         self.state_file = state_file
+        self.journal = None
+        self.worker = None
+        if journal:
+            self.journal = Journal(f'{state_file}.journal', sync_every, compact_every, self.save_state)
+        if background_save:
+            self.worker = PersistenceWorker(self.save_state, save_delay)
+        self._attach_pool()
         # self.load_state()
 
-    def load_state(self):
+    def _attach_pool(self) -> None:
+        """Hooks the journal and the persistence worker to the Pool of the controller
+        """
+        pool: Pool = self.controller.pool
+        if self.journal is not None:
+            pool.attach_journal(self.journal)
+        if self.worker is not None:
+            pool.set_on_change(self.worker.mark_dirty)
+
+    @staticmethod
+    def set_log_level(level: int | str) -> None:
+        """Sets the level of the groups logger
+
+        Debug output of the hashing is only formatted when the level is DEBUG, it is off by default.
+
+        Args:
+            level (int | str): The logging level, e.g. logging.DEBUG or "DEBUG"
+        """
+        logger.setLevel(level.upper() if isinstance(level, str) else level)
+
+        if not any(type(handler) is logging.StreamHandler for handler in logger.handlers):
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter('%(asctime)s %(name)s %(levelname)s: %(message)s'))
+            logger.addHandler(handler)
+
+    def load_state(self, trusted: bool = False):
+        """Loads the state file
+
+        The whole Pool is restored from its stored entries, and the stored hashes of each entry are checked
+        against its Group Unit.
+        JSON state files also restore the saved active Group Unit.
+        State files written before the Pool was persisted only restore the active Group Unit.
+
+        Args:
+            trusted (bool): Rebuild the Group Units without their converters and validators, and verify
+                them once against the stored root instead. Defaults to False.
+
+        Raises:
+            ValueError: If a stored hash does not match its Group Unit, or the entries do not match the stored root
+        """
+        if self._is_json_lines() and (self.journal is None or os.path.exists(self.state_file)):
+            pool = Pool()
+            pool._append_group_unit_entries(self.iter_state(trusted))
+            self.controller = Controller(pool)
+
+        elif self.journal is None or os.path.exists(self.state_file):
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+                pool_state = state.get('pool')
+                active_state = state.get('active')
+                if pool_state:
+                    self.controller = Controller(Pool.from_dict(pool_state, trusted))
+                    if active_state:
+                        self.controller.active = self._restore_active(GroupUnit.from_dict(active_state, trusted))
+                elif active_state:
+                    self.controller._add_group_unit(GroupUnit.from_dict(active_state))
+
+        if self.journal is not None:
+            self.controller.pool.replay_journal(self.journal)
+
+        self._attach_pool()
+
+    def _restore_active(self, active: GroupUnit) -> GroupUnit:
+        """Gets the saved active Group Unit from the Pool, so it is the same object as its entry
+
+        Args:
+            active (GroupUnit): The active Group Unit read from the state file
+
+        Returns:
+            GroupUnit: The Group Unit of the Pool with the nonce of the active Group Unit, or the active
+                Group Unit itself if the Pool does not hold it
+        """
+        position: int | None = self.controller.pool._find_position(active.nonce._hash_root(), lookup='nonce')
+        if position is None:
+            return active
+
+        return self.controller.pool.group_units[position][2]
+
+    def _is_json_lines(self) -> bool:
+        return self.state_file.endswith('.jsonl')
+
+    def iter_state(self, trusted: bool = False) -> Iterator[GroupUnitEntry]:
+        """Iterates over the entries of the state file
+
+        JSON Lines state files are parsed one Group Unit at a time, and checked against the
+        stored count and root once the last entry is read. JSON state files are loaded whole.
+
+        Args:
+            trusted (bool): Rebuild the Group Units without their converters and validators, the root
+                is then checked against the hashes of the Group Units themselves. Defaults to False.
+
+        Yields:
+            GroupUnitEntry: The (package_hash, nonce_hash, GroupUnit) of each entry
+
+        Raises:
+            ValueError: If the number of entries does not match the stored count, or the entries do not match the stored root
+        """
+        if not self._is_json_lines():
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+            yield from Pool.from_dict(state.get('pool') or {}, trusted)
+            return None
+
         with open(self.state_file, 'r') as f:
-            state = json.load(f)
-            active_state = state.get('active')
-            if active_state:
-                self.controller._add_group_unit(GroupUnit.from_dict(active_state))
+            header: dict = json.loads(f.readline())
+            leaves: list[bytes] = []
+            for line in f:
+                entry: GroupUnitEntry = Pool._entry_from_dict(json.loads(line), trusted)
+                leaves.append(Pool._hash_group_unit(entry[2]) if trusted else Pool._hash_group_unit_entry(entry))
+                yield entry
+
+        if len(leaves) != header['count']:
+            raise ValueError(f'Expected {header["count"]} state entries, got {len(leaves)}')
+
+        tree = MerkleTrie(leaves)
+        if tree.root() != header['root']:
+            raise ValueError(f'Expected state root {header["root"]}, got {tree.root()}')
+
+    def _save_state_lines(self, f) -> None:
+        entries, root = self.controller.pool._snapshot()
+        f.write(json.dumps({'root': root, 'count': len(entries)}) + '\n')
+        for item in entries:
+            f.write(json.dumps(Pool._entry_to_dict(item), separators=(',', ':')) + '\n')
 
     def save_state(self):
+        """Saves the active Group Unit and the whole Pool to the state file
+
+        JSON Lines state files are written one Group Unit at a time.
+        """
+        if self._is_json_lines():
+            return self._write_state(self._save_state_lines)
+
+        entries, root, active = self.controller._snapshot()
         state = {
-            'active': self.controller.active
+            'active': active,
+            'pool': Pool._snapshot_to_dict(entries, root),
         }
-        with open(self.state_file, 'w') as f:
-            json.dump(state, f, indent=4, default=self.json_encoder)
+
+        self._write_state(lambda f: json.dump(state, f, indent=4, default=self.json_encoder))
+
+    def _write_state(self, write) -> None:
+        # Write next to the state file and swap it in, a crash never leaves a partial state file
+        temp_file: str = f'{self.state_file}.tmp'
+        with open(temp_file, 'w') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.state_file)
+
+    def compact(self):
+        """Rewrites the state file and truncates the journal, without a journal it only saves the state
+        """
+        if self.journal is None:
+            return self.save_state()
+
+        self.journal.compact()
+
+    def flush(self, timeout: Optional[float] = None):
+        """Waits until the changes made so far are on disk
+
+        Args:
+            timeout (Optional[float]): The seconds to wait for the persistence worker. Defaults to None.
+        """
+        if self.journal is not None:
+            self.journal.flush()
+        if self.worker is not None:
+            self.worker.flush(timeout)
+
+    async def aflush(self, timeout: Optional[float] = None):
+        """Waits until the changes made so far are on disk, without blocking the event loop
+
+        Args:
+            timeout (Optional[float]): The seconds to wait for the persistence worker. Defaults to None.
+        """
+        if self.journal is not None:
+            self.journal.flush()
+        if self.worker is not None:
+            await self.worker.aflush(timeout)
+
+    def close(self):
+        """Saves the last changes and stops the persistence worker
+
+        Without a journal or a persistence worker, the state file is saved.
+        """
+        if self.worker is not None:
+            self.worker.close()
+        if self.journal is not None:
+            self.journal.close()
+        if self.worker is None and self.journal is None:
+            self.save_state()
 
     def json_encoder(self, obj):
         if isinstance(obj, GroupUnit):
@@ -43,7 +281,10 @@ class Groups:
         return obj
 
     def __del__(self):
-        self.save_state()
+        # The state file is only written by save_state(), flush() and close(), the persistence worker
+        # stops on its own once it is collected
+        if self.journal is not None:
+            self.journal.close()
 
     
 
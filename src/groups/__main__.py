@@ -11,8 +11,12 @@ def main():
     parser = argparse.ArgumentParser(description='Forme Groups CLI & SDK')
     parser.add_argument('-b', '--beep', help='Description of argument 2', required=False)
     parser.add_argument('-c', '--create', help='Description of argument 3', required=False)
+    parser.add_argument('-l', '--log-level', help='Logging level, e.g. DEBUG to log hashing', required=False)
 
     args = parser.parse_args()
+
+    if args.log_level:
+        groups.set_log_level(args.log_level)
     print(args)
    
     if args.beep:
@@ -24,7 +28,7 @@ def main():
         data: Data = Data(BaseContainer((args.create), "tuple"))
         groups.controller._create_group_unit(data=data)
         print(groups.controller.active)
-        # groups.save_state()
+        groups.save_state()
 
 
 if __name__ == '__main__':
@@ -1,5 +1,5 @@
 from .container import BaseContainer
-from .interface import BaseInterface
+from .interface import BaseInterface, set_hash_root_cache
 from .types import BaseTypes
 from .schema import BaseSchema, SchemaEntry
 from .value import BaseValue
@@ -11,5 +11,6 @@ __all__ = [
     "BaseValue",
     "BaseContainer",
     "BaseSchema",
-    "SchemaEntry"
+    "SchemaEntry",
+    "set_hash_root_cache"
 ]
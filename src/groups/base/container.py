@@ -5,14 +5,22 @@ from .interface import BaseInterface
 from .types import BaseTypes, BaseValueType, BaseContainerType, BaseContainerTypesTuple
 from .value import BaseValue
 from .exceptions import GroupBaseContainerException
+from ..utils.converters import __CONTAINER_PACKERS__
 from ..utils.crypto import MerkleTree
+from ..utils.encoding import ByteReader, write_container_type, write_varint
 from ..utils.validators import contains_sub_container, is_linear_container, is_named_container, is_base_container_type
 
 
+_CONTAINER_TYPES_BY_NAME: dict[str, type] = {type_.__name__: type_ for type_ in BaseContainerTypesTuple}
+
+
 def _base_container_type_converter(item: BaseContainerType | str | type) -> BaseContainerType:
     """
-    Converter function for _type field
+    Converter function for _type field, a type registered with register_container_packer() is kept as is
     """
+    if isinstance(item, type) and item in __CONTAINER_PACKERS__:
+        return item
+
     type_from_alias: TypeAlias | type = None
     if isinstance(item, str) and len(item) > 0:
         type_from_alias = BaseTypes._get_type_from_alias(item)
@@ -120,25 +128,18 @@ class BaseContainer(BaseInterface):
     @staticmethod
     def _unpack(item: BaseContainerType, type_: TypeAlias | type) -> BaseContainerType:
         """
-        Repackages the container
+        Repackages the container, type_ is a BaseTypes alias or a type registered with register_container_packer()
         """
-        type_from_alias: TypeAlias | type = BaseTypes._get_type_from_alias(type_)
-
-        match (str(type_from_alias)):
-            case("<class 'list'>"):
-                return [value.value for value in item]
-            case("<class 'tuple'>"):
-                return tuple([value.value for value in item])
-            case("<class 'set'>"):
-                return {value.value for value in item}
-            case("<class 'frozenset'>"):
-                return frozenset({value.value for value in item})
-            case("<class 'dict'>"):
-                keys: tuple[BaseValue] = item[::2]
-                values: tuple[BaseValue] = item[1::2]
-                return {key.value: value.value for key, value in zip(keys, values)}
-            case _:
-                raise GroupBaseContainerException(f"Expected a container, but received {type_}")
+        if isinstance(type_, type) and type_ in __CONTAINER_PACKERS__:
+            type_from_alias: TypeAlias | type = type_
+        else:
+            type_from_alias = BaseTypes._get_type_from_alias(type_)
+
+        packer = __CONTAINER_PACKERS__.get(type_from_alias)
+        if packer is None:
+            raise GroupBaseContainerException(f"Expected a container, but received {type_}")
+
+        return packer(tuple(value.value for value in item))
 
     @override
     def __repr__(self) -> str:
@@ -167,7 +168,7 @@ class BaseContainer(BaseInterface):
             >>> str(container)
             '(1, 2, 3)'
         """
-        return str(self._unpack(item=self.items, type_=self.type))
+        return str(self._unpack(item=self.items, type_=self._type))
 
     def __iter_items__(self, slot_name: str = "_items"):
         """Returns an iterator over all items.
@@ -208,7 +209,7 @@ class BaseContainer(BaseInterface):
         """
         hashed_items: tuple[str, ...] = ()
         for item in self.__iter_items__():
-            hashed_items = hashed_items + (item._hash().root(), )
+            hashed_items = hashed_items + (item._hash_root(), )
 
         return MerkleTree(hashed_items)
 
@@ -220,8 +221,16 @@ class BaseContainer(BaseInterface):
         """
         return MerkleTree((self._hash_type(), self._hash_items().root(), ))
 
+    def _items_proof_root(self) -> str | None:
+        """The root item proofs are checked against, store it next to _hash_root() to verify items later
+
+        Returns:
+            str | None: The proof root of _hash_items(), see MerkleTree.proof_root()
+        """
+        return self._hash_items().proof_root()
+
     def _verify_item(self, item: BaseValue) -> bool:
-        """Verifies the item of the BaseContainer
+        """Verifies the item of the BaseContainer with its audit path, see _verify_item_proof()
 
         Args:
             item (BaseValue): The item to verify
@@ -231,10 +240,39 @@ class BaseContainer(BaseInterface):
         """
         assert isinstance(item, BaseValue), f"Expected a BaseValue, but received {type(item)}"
 
-        leaf_hash: str | None = item._hash().root()
-        tree = self._hash_items()
+        hashed_items: tuple[str, ...] = tuple(each._hash_root() for each in self.__iter_items__())
+        if item._hash_root() not in hashed_items:
+            return False
+
+        tree: MerkleTree = MerkleTree(hashed_items)
+        return self._verify_item_proof(item, tree.proof(hashed_items.index(item._hash_root())), tree.proof_root())
+
+    def _item_proof(self, index: int) -> Tuple[Tuple[str, bool], ...]:
+        """Returns the audit path of an item up to the proof root of _hash_items()
+
+        Args:
+            index (int): The position of the item in the iterated items
+
+        Returns:
+            Tuple[Tuple[str, bool], ...]: The audit path of the item
+        """
+        return self._hash_items().proof(index)
 
-        return tree.verify(leaf_hash)
+    @staticmethod
+    def _verify_item_proof(item: BaseValue, proof: Tuple[Tuple[str, bool], ...], items_root: str) -> bool:
+        """Verifies an item against a stored proof root of _hash_items(), without the rest of the items
+
+        Args:
+            item (BaseValue): The item to verify
+            proof (Tuple[Tuple[str, bool], ...]): The audit path returned by _item_proof()
+            items_root (str): The proof root of _hash_items(), see _items_proof_root()
+
+        Returns:
+            bool: True if the item is verified, False otherwise
+        """
+        assert isinstance(item, BaseValue), f"Expected a BaseValue, but received {type(item)}"
+
+        return MerkleTree.verify_proof(item._hash_root(), proof, items_root)
     
     def _to_dict(self):
         return {
@@ -243,14 +281,30 @@ class BaseContainer(BaseInterface):
         }
     
     @classmethod
-    def _from_dict(cls, _dict: dict) -> 'BaseContainer':
-        container_tuple: tuple[BaseValue, ...] = tuple()
+    def _from_dict(cls, _dict: dict, trusted: bool = False) -> 'BaseContainer':
         if _dict is None:
             return BaseContainer(("null", ), "tuple")
         # for item in _dict["items"]:
         #     assert isinstance(item, dict), f"Expected a dict, but received {type(item)}"
         #     assert "value" in item, f"Expected a value, but received {item}"
         #     assert "type" in item, f"Expected a type, but received {item}"
-        container_tuple += tuple(BaseValue._from_dict(item) for item in _dict["items"])
+        container_tuple: tuple[BaseValue, ...] = tuple(BaseValue._from_dict(item, trusted) for item in _dict["items"])
+        type_name: str = _dict["type"] if isinstance(_dict["type"], str) else _dict["type"].__name__
+
+        if trusted and type_name in _CONTAINER_TYPES_BY_NAME:
+            return cls._from_trusted(_items=container_tuple, _type=_CONTAINER_TYPES_BY_NAME[type_name])
+
+        return cls(container_tuple, type_name)
+
+    def _write_bytes(self, buffer: bytearray) -> None:
+        write_container_type(buffer, self.type)
+        write_varint(buffer, len(self.items))
+        for item in self.items:
+            item._write_bytes(buffer)
+
+    @classmethod
+    def _read_bytes(cls, reader: ByteReader) -> 'BaseContainer':
+        type_name: str = reader.read_container_type()
+        items: tuple[BaseValue, ...] = tuple(BaseValue._read_bytes(reader) for _ in range(reader.read_varint()))
 
-        return cls(tuple(BaseValue._from_dict(item) for item in _dict["items"]), _dict["type"] if isinstance(_dict["type"], str) else _dict["type"].__name__)
\ No newline at end of file
+        return cls(items, type_name)
@@ -98,13 +98,46 @@ NOTES:
             c. Next, each private slot is hashed into a leaf.
             d. Then, hashes the private leaves into a tree.
             e. Finally, the public and private trees are hashed together into a tree representing the package.
+        5. Caching the Root Hash
+            a. Classes defining _hash() can call _hash_root() to get the root of the hash tree.
+            b. The root is computed once and stored in the _hash_root_cache slot of the BaseInterface.
+            c. The classes are frozen, so the cached root never needs to be invalidated.
+            d. The cache slot is declared on the BaseInterface, so it is not part of a subclass' __slots__,
+               and is not included in its repr, hashes or equality.
+            e. set_hash_root_cache(False) turns the cache off for memory-constrained runs. Roots are then not stored,
+               which saves the root string of each hashed object (about 100 bytes). The slot itself is part of the
+               class layout and stays allocated, 8 bytes per object, whether or not the cache is on.
+        6. Trusted Loading
+            a. _from_dict(data, trusted=True) rebuilds an object with _from_trusted(), skipping its converters and validators.
+            b. Only use it on data whose recorded root hash is verified once the objects are rebuilt.
+        7. Binary Encoding
+            a. Classes write themselves into a bytearray with _write_bytes() and read back with _read_bytes().
+            b. _to_bytes() and _from_bytes() wrap them, see utils/encoding.py for the format.
 
 """
 from abc import ABC
-from attrs import define
+from attrs import define, field
+from typing import Optional
 
 from .exceptions import GroupBaseException
 from ..utils.crypto import MerkleTree
+from ..utils.encoding import ByteReader
+
+
+__CACHE_HASH_ROOTS__ = True
+
+
+def set_hash_root_cache(enabled: bool) -> None:
+    """Turns the per-instance cache of _hash_root() on or off
+
+    Turning it off stops storing the root strings, about 100 bytes per hashed object. The _hash_root_cache slot
+    is still allocated on every instance, and roots are recomputed on every call.
+
+    Args:
+        enabled (bool): Whether the root hashes are cached
+    """
+    global __CACHE_HASH_ROOTS__
+    __CACHE_HASH_ROOTS__ = bool(enabled)
 
 
 @define(frozen=True, slots=True, weakref_slot=False)
@@ -112,6 +145,11 @@ class BaseInterface(ABC):
     """
     Base interface for all classes
     """
+    _hash_root_cache: Optional[str] = field(
+        init=False,
+        default=None,
+        repr=False,
+        eq=False)
 
     def __iter_slots__(self, include_underscored_slots: bool = False, private_only: bool = False):
         """Returns an iterator over all slots."""
@@ -312,19 +350,147 @@ class BaseInterface(ABC):
 
         return merkle_tree
 
-    def _verify_item_in_hash_package(self, item: str) -> bool:
-        """Returns the hash of the full representation of the object.
+    def _hash_root(self) -> str | None:
+        """Returns the root of the hash tree returned by _hash(), computing it only once.
 
         Returns:
-            str: The hash of the representation of the object.
+            str | None: The root of the hash tree of the object.
+
+        """
+        if not __CACHE_HASH_ROOTS__:
+            return self._hash().root()
+
+        root: str | None = self._hash_root_cache
+        if root is None:
+            root = self._hash().root()
+            object.__setattr__(self, "_hash_root_cache", root)
+
+        return root
+
+    def _proof_root(self) -> str | None:
+        """Returns the root that slot proofs are checked against, store it next to _hash_root() to verify slots later.
+
+        Content hashes are built from _hash_root(), which slot proofs can not be checked against.
+
+        Returns:
+            str | None: The proof root of _proof_package().
 
         """
-        leaf_hash: str = MerkleTree._hash_func(repr(getattr(self, item)))
-        public_tree = self._hash_public_slots()
-        private_tree = self._hash_private_slots()
+        return self._proof_package().proof_root()
+
+    def _proof_package(self) -> MerkleTree:
+        """Returns the tree over the proof roots of the public and private slots, that slot proofs lead to.
+
+        Returns:
+            MerkleTree: The tree whose proof root a slot proof is checked against.
+
+        """
+        return MerkleTree(tuple(
+            root for root in (self._hash_public_slots().proof_root(), self._hash_private_slots().proof_root())
+            if root is not None))
+
+    def _slot_proof(self, slot: str) -> tuple[tuple[tuple[str, bool], ...], tuple[tuple[str, bool], ...]]:
+        """Returns the audit paths of a slot up to the proof root of _proof_package().
+
+        Returns:
+            tuple[tuple[tuple[str, bool], ...], tuple[tuple[str, bool], ...]]: The audit path of the slot
+                in its slots tree, and the audit path of that tree in _proof_package().
 
-        return public_tree.verify(leaf_hash) or private_tree.verify(leaf_hash)
+        """
+        private: bool = slot.startswith("_")
+        slots: tuple[str, ...] = tuple(self.__iter_slots__(include_underscored_slots=private, private_only=private))
+        slots_tree: MerkleTree = self._hash_private_slots() if private else self._hash_public_slots()
+
+        package_index: int = 1 if private and self._hash_public_slots().root() is not None else 0
+
+        return slots_tree.proof(slots.index(slot)), self._proof_package().proof(package_index)
+
+    def _verify_slot_proof(self, slot: str, proof: tuple[tuple[tuple[str, bool], ...], tuple[tuple[str, bool], ...]], package_root: str) -> bool:
+        """Verifies a slot against a stored proof root of _proof_package() with the audit paths of the slot.
+
+        Returns:
+            bool: True if the slot is verified, False otherwise.
+
+        """
+        slots_path, package_path = proof
+        slots_root: bytes = MerkleTree._fold_proof(self._hash_slot(slot), slots_path)
+
+        return MerkleTree.verify_proof(slots_root, package_path, package_root)
+
+    def _verify_item_in_hash_package(self, item: str) -> bool:
+        """Verifies a slot of the object with its audit paths, see _verify_slot_proof().
+
+        Returns:
+            bool: True if the slot is verified, False otherwise.
+
+        """
+        return self._verify_slot_proof(item, self._slot_proof(item), self._proof_root())
     
+    @classmethod
+    def _from_trusted(cls, **fields) -> 'BaseInterface':
+        """Creates an object from already converted field values, skipping the converters and validators.
+
+        Args:
+            **fields: The value of every attrs field, by attribute name (e.g. _value).
+
+        Returns:
+            BaseInterface: The object, with an empty root hash cache.
+
+        """
+        item = object.__new__(cls)
+        for name, value in fields.items():
+            object.__setattr__(item, name, value)
+        object.__setattr__(item, "_hash_root_cache", None)
+
+        return item
+
+    def _write_bytes(self, buffer: bytearray) -> None:
+        """Writes the binary encoding of the object into a buffer.
+
+        Every class a GroupUnit is made of overrides this and _read_bytes().
+
+        Raises:
+            NotImplementedError: If the class has no binary encoding.
+
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} has no binary encoding")
+
+    @classmethod
+    def _read_bytes(cls, reader: ByteReader) -> 'BaseInterface':
+        """Reads an object back from its binary encoding.
+
+        Raises:
+            NotImplementedError: If the class has no binary encoding.
+
+        """
+        raise NotImplementedError(f"{cls.__name__} has no binary encoding")
+
+    def _to_bytes(self) -> bytes:
+        """Returns the binary encoding of the object.
+
+        Returns:
+            bytes: The binary encoding of the object.
+
+        """
+        buffer = bytearray()
+        self._write_bytes(buffer)
+        return bytes(buffer)
+
+    @classmethod
+    def _from_bytes(cls, data: bytes | bytearray | memoryview) -> 'BaseInterface':
+        """Returns an object from its binary encoding.
+
+        Raises:
+            ValueError: If the data is not a single encoded object.
+
+        """
+        reader = ByteReader(data)
+        item = cls._read_bytes(reader)
+        if not reader.at_end():
+            raise ValueError(f"Expected the data to end at offset {reader.offset}, it has {len(reader.data)} bytes")
+
+        return item
+
     # def _to_dict(self) -> dict:
     #     """Returns a dictionary representation of the object.
 
@@ -10,6 +10,7 @@ from typing import TypeAlias, override, Tuple
 from .interface import BaseInterface
 from .types import BaseTypes, BaseContainerType
 from ..utils.crypto import MerkleTree
+from ..utils.encoding import ByteReader, write_str, write_varint
 
 
 def _validate_schema_entry_key(instance, attribute, value):
@@ -152,8 +153,18 @@ class SchemaEntry(BaseInterface):
         }
     
     @classmethod
-    def _from_dict(cls, _dict: dict) -> 'SchemaEntry':
+    def _from_dict(cls, _dict: dict, trusted: bool = False) -> 'SchemaEntry':
+        if trusted:
+            return cls._from_trusted(_key=_dict['key'], _value=_base_type_converter(_dict['value']))
         return cls(key=_dict['key'], value=_dict['value'])
+
+    def _write_bytes(self, buffer: bytearray) -> None:
+        write_str(buffer, self._key)
+        write_str(buffer, self._str_value(self._value))
+
+    @classmethod
+    def _read_bytes(cls, reader: ByteReader) -> 'SchemaEntry':
+        return cls(key=reader.read_str(), value=reader.read_str())
     
 
 def _key_is_duplicate(key: str, entries: Tuple[SchemaEntry, ...]) -> bool:
@@ -296,7 +307,7 @@ class BaseSchema(BaseInterface):
         """
         hashed_entries: Tuple[str | None, ...] = tuple()
         for entry in self.entries:
-            hashed_entries += (entry._hash().root(), )
+            hashed_entries += (entry._hash_root(), )
             
         return MerkleTree(hashed_data=hashed_entries)
     
@@ -306,5 +317,17 @@ class BaseSchema(BaseInterface):
         }
     
     @classmethod
-    def _from_dict(cls, _dict: dict) -> 'BaseSchema':
-        return cls(entries=tuple(SchemaEntry._from_dict(entry) for entry in _dict['entries']))
+    def _from_dict(cls, _dict: dict, trusted: bool = False) -> 'BaseSchema':
+        entries: Tuple[SchemaEntry, ...] = tuple(SchemaEntry._from_dict(entry, trusted) for entry in _dict['entries'])
+        if trusted:
+            return cls._from_trusted(_entries=entries)
+        return cls(entries=entries)
+
+    def _write_bytes(self, buffer: bytearray) -> None:
+        write_varint(buffer, len(self.entries))
+        for entry in self.entries:
+            entry._write_bytes(buffer)
+
+    @classmethod
+    def _read_bytes(cls, reader: ByteReader) -> 'BaseSchema':
+        return cls(entries=tuple(SchemaEntry._read_bytes(reader) for _ in range(reader.read_varint())))
@@ -1,8 +1,8 @@
 from abc import ABC
 from enum import Enum
 from attrs import define, field, validators
-from types import NoneType
-from typing import Any, Union, TypeAlias, TypeVar, Type, Tuple, Optional, Callable, override, List, Set, FrozenSet, Dict
+from types import MappingProxyType, NoneType
+from typing import Any, Mapping, Union, TypeAlias, TypeVar, Type, Tuple, Optional, Callable, override, List, Set, FrozenSet, Dict
 
 from .interface import BaseInterface
 from .exceptions import GroupBaseTypeException
@@ -163,6 +163,24 @@ class BaseType(BaseInterface):
         return super().__repr_private__(include_underscored_slots=False)
     
 
+# The lookup tables of the system BaseTypes, built on first use by _get_base_types_cache()
+__BASE_TYPES_CACHE__: Optional[dict[tuple[str, ...], Any]] = None
+
+
+def _get_base_types_cache() -> dict[tuple[str, ...], Any]:
+    """The lookup tables of the system BaseTypes
+
+    They are built on the first lookup rather than at import, see _BaseTypes._build_cache().
+
+    Returns:
+        dict[tuple[str, ...], Any]: The cached objects
+    """
+    global __BASE_TYPES_CACHE__
+    if __BASE_TYPES_CACHE__ is None:
+        __BASE_TYPES_CACHE__ = BaseTypes._build_cache()
+    return __BASE_TYPES_CACHE__
+
+
 @define(frozen=True, slots=True, weakref_slot=False)
 class _BaseTypes(BaseInterface):
 # class _BaseTypes:
@@ -304,6 +322,8 @@ class _BaseTypes(BaseInterface):
     def all(self, type_: Optional[str] = None, format_: Optional[str] = None) -> Union[type | TypeAlias, tuple[type | TypeAlias, ...]]:
         """All the system types
 
+        The categories of the system BaseTypes are built once, and the same objects are returned on every call.
+
         Returns:
             type | TypeAlias: All the system types
         """
@@ -316,6 +336,21 @@ class _BaseTypes(BaseInterface):
         if format_ is None:
             format_ = "union"
 
+        if self is BaseTypes:
+            return _get_base_types_cache()[("all", type_, format_)]
+
+        return self._build_category(type_, format_)
+
+    def _build_category(self, type_: str, format_: str) -> Union[type | TypeAlias, tuple[type | TypeAlias, ...]]:
+        """Builds the union or tuple of the types in a category
+
+        Args:
+            type_ (str): The category, "all" or one of the categories of all()
+            format_ (str): "union" or "tuple"
+
+        Returns:
+            type | TypeAlias | tuple[type | TypeAlias, ...]: The types of the category
+        """
         match (type_, format_):
             case ("value", "union"):
                 return Union[
@@ -424,11 +459,13 @@ class _BaseTypes(BaseInterface):
 
     @property
     def all_base_types(self) -> tuple[BaseType, ...]:
-        system_types: Tuple[BaseType, ...] = ()
-        for slot in self.__slots__:
-            base_type: BaseType = getattr(self, slot)
-            system_types += (base_type,)
-        return system_types
+        if self is BaseTypes:
+            return _get_base_types_cache()[("all_base_types", )]
+
+        return self._build_base_types()
+
+    def _build_base_types(self) -> tuple[BaseType, ...]:
+        return tuple(getattr(self, slot) for slot in self.__slots__)
 
     @property
     def value_types(self) -> type | TypeAlias:
@@ -445,11 +482,42 @@ class _BaseTypes(BaseInterface):
         Returns:
             tuple[str, ...]: All the aliases for the base types
         """
+        if self is BaseTypes:
+            return _get_base_types_cache()[("aliases", )]
+
+        return self._build_aliases()
+
+    def _build_aliases(self) -> tuple[str, ...]:
         aliases: Tuple[str, ...] = ()
-        for base_type in self.all_base_types:
+        for base_type in self._build_base_types():
             aliases += base_type.aliases
         return aliases
 
+    def _build_cache(self) -> dict[tuple[str, ...], Any]:
+        """Builds every category of all(), the all_base_types and aliases properties and the lookup tables
+
+        Returns:
+            dict[tuple[str, ...], Any]: The cached objects, keyed by ("all", type_, format_), ("all_base_types", ),
+                ("aliases", ), ("by_alias", ) for the base type of each alias, ("names", ) for the name of each type_class,
+                and ("owners_by_alias", ), ("owners_by_type", ) for _validate_new_type(). ("alias_substrings", ) is
+                added by _validate_new_type() on its first call.
+        """
+        cache: dict[tuple[str, ...], Any] = {
+            ("all", type_, format_): self._build_category(type_, format_)
+            for type_ in ("all", "value", "container", "linear", "named", "text", "number")
+            for format_ in ("union", "tuple")
+        }
+        base_types: tuple[BaseType, ...] = self._build_base_types()
+        cache[("all_base_types", )] = base_types
+        cache[("aliases", )] = self._build_aliases()
+        cache[("by_alias", )] = MappingProxyType(self._build_alias_table())
+        cache[("names", )] = MappingProxyType({base_type.type_class: base_type.aliases[0] for base_type in base_types})
+        cache[("owners_by_alias", )] = MappingProxyType(
+            {alias: base_type for base_type in reversed(base_types) for alias in base_type.aliases})
+        cache[("owners_by_type", )] = MappingProxyType(
+            {base_type._type_to_string(base_type.type_class): base_type for base_type in base_types})
+        return cache
+
     def _already_exists(self, property: str, query_value: str) -> bool:
         """Checks if a property of a base type already exists
 
@@ -471,26 +539,101 @@ class _BaseTypes(BaseInterface):
     
     def _validate_types(self) -> bool:
         """Validates the types of the base types
+
+        Base Types cannot share an alias or a type_class. Each alias and type_class is checked
+        once against the ones seen so far, so the whole pass is linear in the number of aliases.
+
+        Raises:
+            GroupBaseTypeException: If a base type is malformed, or shares an alias or a type_class
         """
+        owners_by_alias: dict[str, BaseType] = {}
+        owners_by_type: dict[str, BaseType] = {}
         for base_type in self.all_base_types:
 
             # Check for errors in the base type
             base_type._check_for_errors()
+            self._check_unique(base_type, owners_by_alias, owners_by_type)
+
+            owners_by_type[base_type._type_to_string(base_type.type_class)] = base_type
+            for alias in base_type.aliases:
+                owners_by_alias.setdefault(alias, base_type)
+        return True
+
+    def _build_alias_substrings(self) -> dict[str, tuple[tuple[str, BaseType], ...]]:
+        """Indexes every substring of the aliases of the base types
 
-            # Check if certain properties of the base type already exist
-            # Base Types cannot share the same aliases ("int" and "set" are excluded from throwing an error, as they clash with FloatingPoint and FrozenSet)
-            # Base Types cannot share the same type_class
-            for base_type_ in self.all_base_types:
-                if base_type is not base_type_:
-                    # Check that the type_class is not already used
-                    if base_type._type_to_string(base_type.type_class) == base_type_._type_to_string(base_type_.type_class):
-                        raise GroupBaseTypeException(f"Type {base_type.type_class} is already used by {base_type_}")
-                    
-                    # Check that the aliases are not already used
-                    for alias in base_type.aliases:
-                        # system reserved types "int" and "set" are excluded from throwing an error
-                        if base_type_._contains_alias(alias, exclude=("int", "INT", str("Set"), str("set"), "SET")):
-                            raise GroupBaseTypeException(f"Alias {alias} is already used by {base_type_}")
+        Returns:
+            dict[str, tuple[tuple[str, BaseType], ...]]: The first alias containing the substring, and its base type,
+                for each base type with such an alias
+        """
+        index: dict[str, dict[int, tuple[str, BaseType]]] = {}
+        for base_type in self._build_base_types():
+            for alias in base_type.aliases:
+                for start in range(len(alias)):
+                    for stop in range(start + 1, len(alias) + 1):
+                        index.setdefault(alias[start:stop], {}).setdefault(id(base_type), (alias, base_type))
+        return {substring: tuple(owners.values()) for substring, owners in index.items()}
+
+    @staticmethod
+    def _check_unique(
+        base_type: BaseType,
+        owners_by_alias: Mapping[str, BaseType],
+        owners_by_type: Mapping[Any, BaseType],
+        alias_substrings: Optional[Mapping[str, tuple[tuple[str, BaseType], ...]]] = None
+    ) -> None:
+        """Checks that the aliases and type_class of a base type are not used by another base type
+
+        Args:
+            base_type (BaseType): The base type to check
+            owners_by_alias (Mapping[str, BaseType]): The base type of each alias already in use
+            owners_by_type (Mapping[Any, BaseType]): The base type of each type_class name already in use
+            alias_substrings (Optional[Mapping[str, tuple[tuple[str, BaseType], ...]]]): The aliases in use containing
+                each substring, see _build_alias_substrings(). When given, aliases that are a substring of an alias in use
+                are rejected too, _get_type() can not resolve them for a base type registered after it. Defaults to None.
+
+        Raises:
+            GroupBaseTypeException: If an alias or the type_class is already used
+        """
+        owner: Optional[BaseType] = owners_by_type.get(base_type._type_to_string(base_type.type_class))
+        if owner is not None and owner is not base_type:
+            raise GroupBaseTypeException(f"Type {base_type.type_class} is already used by {owner.aliases[0]}")
+
+        for alias in base_type.aliases:
+            owner = owners_by_alias.get(alias)
+            if owner is not None and owner is not base_type:
+                raise GroupBaseTypeException(f"Alias {alias} is already used by {owner.aliases[0]}")
+
+        if alias_substrings is None:
+            return None
+
+        for alias in base_type.aliases:
+            for used_alias, owner in alias_substrings.get(alias, ()):
+                if owner is not base_type:
+                    raise GroupBaseTypeException(f"Alias {alias} is a substring of {used_alias}, used by {owner.aliases[0]}")
+
+    def _validate_new_type(self, base_type: BaseType) -> bool:
+        """Validates a base type before it is registered next to the system base types
+
+        Only the aliases of the new base type are looked up, the system base types are not checked again.
+        An alias that is a substring of a system alias is rejected too, _get_type() could never resolve it.
+        The substrings of the system aliases are indexed on the first call, after that each alias is one lookup.
+
+        Args:
+            base_type (BaseType): The base type to register
+
+        Raises:
+            GroupBaseTypeException: If the base type is malformed, or shares an alias or a type_class with a system base type,
+                or one of its aliases is a substring of a system alias
+        """
+        if not isinstance(base_type, BaseType):
+            raise GroupBaseTypeException(f"Expected a BaseType, but received {type(base_type)}")
+
+        base_type._check_for_errors()
+        cache: dict[tuple[str, ...], Any] = _get_base_types_cache()
+        if ("alias_substrings", ) not in cache:
+            cache[("alias_substrings", )] = MappingProxyType(BaseTypes._build_alias_substrings())
+
+        self._check_unique(base_type, cache[("owners_by_alias", )], cache[("owners_by_type", )], cache[("alias_substrings", )])
         return True
 
     def _get_type(self, property: str, query_value: str) -> BaseType:
@@ -503,8 +646,56 @@ class _BaseTypes(BaseInterface):
     
     def _get_type_from_alias(self, alias: str) -> Type:
         """Gets a base type from an alias
+
+        The system BaseTypes resolve aliases from a lookup table in O(1).
+
+        Raises:
+            GroupBaseTypeException: If no base type has the alias
         """
+        if self is BaseTypes:
+            base_type: Optional[BaseType] = _get_base_types_cache()[("by_alias", )].get(alias)
+            if base_type is None:
+                raise GroupBaseTypeException(f"BaseType with aliases {alias} does not exist")
+            return base_type.type_class
+
         return self._get_type("aliases", alias).type_class
+
+    def _get_name_from_type(self, type_: type | TypeAlias) -> str:
+        """Gets the canonical name, the first alias, of a base type from its type_class
+
+        Raises:
+            GroupBaseTypeException: If no base type has the type_class
+        """
+        if self is BaseTypes:
+            name: Optional[str] = _get_base_types_cache()[("names", )].get(type_)
+        else:
+            name = next((base_type.aliases[0] for base_type in self.all_base_types if base_type.type_class is type_), None)
+
+        if name is None:
+            raise GroupBaseTypeException(f"BaseType with type_class {type_} does not exist")
+        return name
+
+    def _build_alias_table(self) -> dict[str, BaseType]:
+        """Resolves every alias of the base types once, the way _get_type() does
+
+        The first base type with the alias wins. Aliases that _get_type() rejects, for being a substring
+        of the alias of an earlier base type, are left out so that they are still rejected.
+
+        Returns:
+            dict[str, BaseType]: The base type of each alias
+        """
+        base_types: tuple[BaseType, ...] = self._build_base_types()
+        table: dict[str, BaseType] = {}
+        for alias in self._build_aliases():
+            if alias in table:
+                continue
+            for base_type in base_types:
+                if alias in base_type.aliases:
+                    table[alias] = base_type
+                    break
+                if any(alias in other for other in base_type.aliases):
+                    break
+        return table
     
     def _hash_types(self) -> MerkleTree:
         """Hashes the types
@@ -591,8 +782,8 @@ Text: TypeAlias = BaseValueTypes.TEXT.value
 Number: TypeAlias = BaseValueTypes.NUMBER.value
 
 # Base Type Aliases in Tuple Format
-BaseValueTypesTuple: Tuple[type | TypeAlias, ...] = BaseTypes.all("value", "tuple")
-BaseContainerTypesTuple: Tuple[type | TypeAlias, ...] = BaseTypes.all("container", "tuple")
+BaseValueTypesTuple: Tuple[type | TypeAlias, ...] = BaseTypes._build_category("value", "tuple")
+BaseContainerTypesTuple: Tuple[type | TypeAlias, ...] = BaseTypes._build_category("container", "tuple")
 
 # Base Object Types
 Object = object | None
@@ -2,7 +2,6 @@ import struct
 from enum import Enum
 from types import NoneType
 from typing import TypeAlias, override, Any, Union
-from unittest.mock import Base
 from attrs import define, field, Factory
 
 
@@ -11,7 +10,8 @@ from .interface import BaseInterface
 from .exceptions import GroupBaseValueException
 from ..utils.crypto import MerkleTree
 from ..utils.converters import force_value_type, convert_none_to_default_value
-from ..utils.validators import validate_base_value_type
+from ..utils.encoding import ByteReader, write_value
+from ..utils.validators import validate_base_value_type, _is_base_value_type
 
 
 __ALLOW_NONE_VALUE__ = True
@@ -104,7 +104,7 @@ class BaseValue(BaseInterface):
         """
         if isinstance(value, BaseValue):
             value = value.value
-        elif not isinstance(value, BaseValueType):
+        elif not _is_base_value_type(value):
             raise TypeError(f"Expected a value, but received {type(value)}")
 
         # if value is None:
@@ -242,7 +242,7 @@ class BaseValue(BaseInterface):
                 >>> value._verify_hash('5b1980a185761ca08c85b7ae8d9d98176814e6161f86df9bbc0b5ae4311ba46a')
                 True
         """
-        return self._hash().root() == hash_
+        return self._hash_root() == hash_
     
     def _to_dict(self) -> dict:
         return {
@@ -251,5 +251,14 @@ class BaseValue(BaseInterface):
         }
     
     @classmethod
-    def _from_dict(cls, data: dict) -> 'BaseValue':
+    def _from_dict(cls, data: dict, trusted: bool = False) -> 'BaseValue':
+        if trusted and type(data["value"]).__name__ == data["type"]:
+            return cls._from_trusted(_value=data["value"])
         return cls._force_type(data["value"], data["type"])
+
+    def _write_bytes(self, buffer: bytearray) -> None:
+        write_value(buffer, self._value)
+
+    @classmethod
+    def _read_bytes(cls, reader: ByteReader) -> 'BaseValue':
+        return cls(reader.read_value())
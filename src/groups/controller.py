@@ -1,5 +1,5 @@
 from attrs import define, field, validators, Factory
-from typing import Optional, Any
+from typing import Optional, Any, Iterable, Tuple
 
 # from src.groups.base.value import BaseValue
 
@@ -18,6 +18,16 @@ __DEFAULT_GROUP_UNIT__ = GroupUnit(
 class Controller:
     """The Controller class holds a Pool of Group Units and is used to manage the Group Units
 
+    Notes:
+        The active GroupUnit is the last GroupUnit created outside a sub Unit, unless it is set explicitly.
+        Creating sub Units leaves it in place, so the next GroupUnit continues its own nonce level.
+        Entries added to the Pool outside the Controller, like a loaded Pool, make the last top level
+        GroupUnit among them active. Sub Units among them only become active when there is no active GroupUnit.
+        The Controller also tracks the GroupUnit with the highest nonce of each nonce level, see active_for(),
+        so the next nonce never collides with one already in the Pool, whatever order the entries were added in.
+        These entries are picked up on the next read, in O(new entries).
+        The Controller is updated under the lock of its Pool, so another thread can read it, see _snapshot().
+
     Args:
         pool (Optional[Pool]): The Pool of Group Units
     """
@@ -29,22 +39,150 @@ class Controller:
         default=None,
         validator=validators.optional(validators.instance_of(GroupUnit)))
 
+    _heads: Optional[dict[tuple, GroupUnit]] = field(
+        init=False,
+        default=None,
+        repr=False,
+        eq=False)
+
+    _tracked: int = field(
+        init=False,
+        default=0,
+        repr=False,
+        eq=False)
+
     def __init__(self, pool: Optional[Pool] = None):
         if pool is not None:
             self.pool = pool
         else:
-            self.pool = Pool(((__DEFAULT_GROUP_UNIT__.data._hash().root(), __DEFAULT_GROUP_UNIT__.nonce._hash().root(), __DEFAULT_GROUP_UNIT__),), )
+            self.pool = Pool(((__DEFAULT_GROUP_UNIT__.data._hash_root(), __DEFAULT_GROUP_UNIT__.nonce._hash_root(), __DEFAULT_GROUP_UNIT__),), )
+
+        self._active = None
+        self._heads = None
+        self._tracked = 0
+        self._track_pool()
+
+    def _track_pool(self) -> None:
+        """Catch up with the entries added to the Pool since the last call
+
+        The active GroupUnit becomes the last new entry at the top level of the nonce chains,
+        and the heads of the nonce levels are updated once they are built.
+        """
+        with self.pool._lock:
+            group_units = self.pool.group_units
+            count: int = len(group_units)
+            if count == self._tracked:
+                return None
+
+            if self._heads is not None:
+                for position in range(self._tracked, count):
+                    self._track_head(group_units[position][2])
+
+            self._active = self._latest_active(group_units, self._tracked, self._active)
+            self._tracked = count
+
+    @staticmethod
+    def _latest_active(group_units, start: int, active: GroupUnit | None) -> GroupUnit | None:
+        """Find the active GroupUnit once the entries from a position on are tracked, without tracking them
+
+        Args:
+            group_units: The entries of the Pool
+            start (int): The position of the first entry that is not tracked
+            active (GroupUnit | None): The active GroupUnit before those entries
+
+        Returns:
+            GroupUnit | None: The last top level GroupUnit among the entries, or active if there is none
+        """
+        # A sub Unit is only active when there is nothing else to continue from
+        for position in range(len(group_units) - 1, start - 1, -1):
+            if len(group_units[position][2].nonce._chain.items) == 1:
+                return group_units[position][2]
+
+        if active is None and len(group_units) > start:
+            return group_units[-1][2]
+        return active
+
+    def _snapshot(self) -> tuple[list, str | None, GroupUnit | None]:
+        """The entries of the Pool, their root and the active GroupUnit, taken together under the Pool lock
 
-        self._active = self.pool.group_units[-1][2]
+        The Controller is not updated, so the snapshot can be taken from another thread, like a persistence worker.
+
+        Returns:
+            tuple[list[GroupUnitEntry], str | None, GroupUnit | None]: A copy of the entries, the root over them
+                and the active GroupUnit
+        """
+        with self.pool._lock:
+            entries, root = self.pool._snapshot()
+            return entries, root, self._latest_active(entries, self._tracked, self._active)
+
+    def _track_head(self, group_unit: GroupUnit) -> None:
+        """Make a GroupUnit the head of its nonce level, if its nonce is the highest of the level
+
+        Args:
+            group_unit (GroupUnit): The GroupUnit added to the Pool
+        """
+        level: tuple = Pool._nonce_key(group_unit.nonce)[:-1]
+        head: GroupUnit | None = self._heads.get(level)
+        if head is None or Pool._nonce_sort_key(group_unit.nonce) > Pool._nonce_sort_key(head.nonce):
+            self._heads[level] = group_unit
 
     @property
     def active(self) -> GroupUnit | None:
-        self._active = self.pool.group_units[-1][2]
+        self._track_pool()
         return self._active
     
     @active.setter
     def active(self, group_unit: GroupUnit) -> None:
-        self._active = group_unit
+        with self.pool._lock:
+            self._track_pool()
+            self._active = group_unit
+
+    def active_for(self, nonce_prefix: Optional[Nonce] = None) -> GroupUnit | None:
+        """Gets the active GroupUnit one level below a nonce chain
+
+        The heads of the nonce levels are built from the Pool on the first call and updated
+        as GroupUnits are added, after that each call is O(1).
+
+        Args:
+            nonce_prefix (Optional[Nonce]): The Nonce of the super Unit. Defaults to None, the top level.
+
+        Returns:
+            GroupUnit | None: The GroupUnit with the highest nonce under the nonce chain, None if there is none
+
+        Examples:
+            >>> controller.active_for(Nonce(BaseContainer((3, ))))
+        """
+        if nonce_prefix is not None and not isinstance(nonce_prefix, Nonce):
+            raise TypeError(f'Expected Nonce, got {type(nonce_prefix)}')
+
+        key: tuple = () if nonce_prefix is None else Pool._nonce_key(nonce_prefix)
+        return self._get_heads().get(key)
+
+    def _get_heads(self) -> dict[tuple, GroupUnit]:
+        """Gets the active GroupUnit of each nonce level, building them from the Pool on the first call
+
+        Returns:
+            dict[tuple, GroupUnit]: The GroupUnit with the highest nonce under each nonce chain
+        """
+        with self.pool._lock:
+            self._track_pool()
+            if self._heads is None:
+                self._heads = {}
+                group_units = self.pool.group_units
+                for position in range(self._tracked):
+                    self._track_head(group_units[position][2])
+
+            return self._heads
+
+    def root(self) -> str | None:
+        """The Merkle root of the Pool
+
+        The root is over the set of entries, it does not depend on the order they were added in.
+
+        Returns:
+            str | None: The root over the entries of the Pool, see Pool.root()
+        """
+        return self.pool.root()
 
     def _add_group_unit(self, group_unit: GroupUnit) -> None:
         """Adds a GroupUnit to the Pool
@@ -79,37 +217,130 @@ class Controller:
             super_unit_hash (Optional[str]): The hash of the super Unit. Defaults to None.
             override_sub_unit (bool): Whether to override the sub Unit. Defaults to False.
         """
-        schema_to_enforce: Optional[BaseSchema] = None
-        next_nonce: Optional[Nonce] = None
+        next_nonce: Optional[Nonce] = self._get_next_nonce(is_sub_unit, override_nonce)
+        schema_to_enforce: Optional[BaseSchema] = self._get_schema_to_enforce(super_unit_schema, super_unit_hash)
+
+        new_data = Data._from(data.entry, data.schema, schema_to_enforce)
+
+        credential = Credential()
+        owner = Owner()
+        group_unit = GroupUnit(next_nonce, owner, credential, new_data)
+        self._add_created(group_unit, is_sub_unit, override_nonce)
+        return group_unit
+
+    def _add_created(self, group_unit: GroupUnit, is_sub_unit: Optional[bool] = None, override_nonce: Optional[Nonce] = None) -> None:
+        """Adds a GroupUnit created by the Controller and moves the active GroupUnit
+
+        Sub Units and overridden nonces leave the active GroupUnit in place.
+
+        Args:
+            group_unit (GroupUnit): The GroupUnit to add
+            is_sub_unit (Optional[bool]): Whether the GroupUnit is a sub Unit. Defaults to None.
+            override_nonce (Optional[Nonce]): The nonce used instead. Defaults to None.
+        """
+        with self.pool._lock:
+            active: GroupUnit | None = self.active
+            self._add_group_unit(group_unit)
+            self._track_pool()
+            if is_sub_unit is True or override_nonce is not None:
+                self._active = active
+            else:
+                self._active = group_unit
+
+    def create_group_units(
+        self,
+        datas: Iterable[Data],
+        is_sub_unit: Optional[bool] = None,
+        super_unit_schema: Optional[BaseSchema] = None,
+        super_unit_hash: Optional[str] = None
+    ) -> Tuple[GroupUnit, ...]:
+        """Creates a batch of GroupUnits
+
+        The schema to enforce is resolved once for the batch, and the nonces are assigned in sequence
+        starting from the active nonce. The batch is added to the Pool in one step.
+
+        Args:
+            datas (Iterable[Data]): The Data of the GroupUnits
+            is_sub_unit (Optional[bool]): Whether the GroupUnits are sub Units. Defaults to None.
+            super_unit_schema (Optional[BaseSchema]): The Schema of the super Unit. Defaults to None.
+            super_unit_hash (Optional[str]): The hash of the super Unit. Defaults to None.
+
+        Returns:
+            Tuple[GroupUnit, ...]: The GroupUnits created
+        """
+        next_nonce: Optional[Nonce] = self._get_next_nonce(is_sub_unit)
+        schema_to_enforce: Optional[BaseSchema] = self._get_schema_to_enforce(super_unit_schema, super_unit_hash)
 
+        credential = Credential()
+        owner = Owner()
+        group_units: list[GroupUnit] = []
+        for data in datas:
+            new_data = Data._from(data.entry, data.schema, schema_to_enforce)
+            group_units.append(GroupUnit(next_nonce, owner, credential, new_data))
+            next_nonce = next_nonce._next_active_nonce()
+
+        with self.pool._lock:
+            active: GroupUnit | None = self.active
+            self.pool.add_group_units(group_units)
+            self._track_pool()
+            if is_sub_unit is not True and len(group_units) > 0:
+                active = group_units[-1]
+            self._active = active
+        return tuple(group_units)
+
+    def _get_next_nonce(self, is_sub_unit: Optional[bool] = None, override_nonce: Optional[Nonce] = None) -> Optional[Nonce]:
+        """Gets the nonce of the next GroupUnit
+
+        Args:
+            is_sub_unit (Optional[bool]): Whether the next GroupUnit is a sub Unit. Defaults to None.
+            override_nonce (Optional[Nonce]): The nonce to use instead. Defaults to None.
+
+        Returns:
+            Optional[Nonce]: The nonce of the next GroupUnit
+        """
+        active: GroupUnit = self.active
         if is_sub_unit is None or is_sub_unit is False:
-            next_nonce = self.active.nonce._next_active_nonce()
+            # Continue after the last GroupUnit on the level of the active GroupUnit
+            head: GroupUnit | None = self._get_heads().get(Pool._nonce_key(active.nonce)[:-1])
+            if head is None:
+                head = active
+            return head.nonce._next_active_nonce()
 
         elif is_sub_unit is True and override_nonce is None:
-            if self.active.data.schema is None:
+            if active.data.schema is None:
                 raise AttributeError("Cannot create a sub Unit without a schema")
-            next_nonce = self.active.nonce._next_sub_nonce()
 
-        elif override_nonce is not None:
-            next_nonce = override_nonce
+            # Continue after the existing sub Units of the active GroupUnit
+            head: GroupUnit | None = self.active_for(active.nonce)
+            if head is not None:
+                return head.nonce._next_active_nonce()
+            return active.nonce._next_sub_nonce()
+
+        return override_nonce
+
+    def _get_schema_to_enforce(
+        self,
+        super_unit_schema: Optional[BaseSchema] = None,
+        super_unit_hash: Optional[str] = None
+    ) -> Optional[BaseSchema]:
+        """Gets the Schema the Data of the next GroupUnit must match
 
+        Args:
+            super_unit_schema (Optional[BaseSchema]): The Schema of the super Unit. Defaults to None.
+            super_unit_hash (Optional[str]): The hash of the super Unit. Defaults to None.
+
+        Returns:
+            Optional[BaseSchema]: The Schema to enforce
+        """
         if super_unit_schema is not None and super_unit_hash is not None:
             raise ValueError("Cannot set both super_unit_schema and super_unit_hash")
         elif super_unit_schema is None and super_unit_hash is None:
-            schema_to_enforce = self.active.data.schema
+            return self.active.data.schema
         elif super_unit_schema is None and super_unit_hash is not None:
             super_unit = self._get_group_unit(super_unit_hash)
-            schema_to_enforce = super_unit.data.schema
-        elif super_unit_schema is not None and super_unit_hash is None:
-            schema_to_enforce = super_unit_schema
+            return super_unit.data.schema
 
-        new_data = Data._from(data.entry, data.schema, schema_to_enforce)
-
-        credential = Credential()
-        owner = Owner()
-        group_unit = GroupUnit(next_nonce, owner, credential, new_data)
-        self._add_group_unit(group_unit)
-        return group_unit
+        return super_unit_schema
 
     def _get_group_unit(self, hash_: str) -> GroupUnit:
         """Gets a GroupUnit from the Pool
@@ -131,7 +362,7 @@ class Controller:
         Returns:
             GroupUnit: The GroupUnit from the Pool
         """
-        return self._get_group_unit(nonce._hash().root())
+        return self._get_group_unit(nonce._hash_root())
     
     def _group_unit_from_dict(self, data: dict[str, Any]) -> GroupUnit:
         """Creates a GroupUnit from a dict
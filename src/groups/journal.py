@@ -0,0 +1,184 @@
+from attrs import define, field, validators
+import os
+import json
+import logging
+from typing import Callable, IO, Iterable, Iterator, Optional
+
+from .unit import GroupUnit
+
+
+logger = logging.getLogger(__name__)
+
+
+@define(slots=True, weakref_slot=False)
+class Journal:
+    """The Journal class is an append-only write-ahead log of the entries added to a Pool
+
+    Notes:
+        Each entry is written as one compact JSON line:
+            {"package_hash": str, "nonce_hash": str, "group_unit": dict}
+        The file is fsynced once every sync_every records, a crash can only lose the records
+        written since the last sync. A torn last line is cut off on replay.
+
+    Args:
+        path (str): The path of the journal file
+        sync_every (int): The number of records written between two fsyncs. Defaults to 64.
+        compact_every (Optional[int]): The number of records after which compactor is called. Defaults to None.
+        compactor (Optional[Callable[[], None]]): Writes a snapshot of the Pool, the journal is truncated after it
+
+    Examples:
+        >>> journal = Journal('groups.json.journal')
+        >>> pool.attach_journal(journal)
+    """
+    path: str = field(
+        validator=validators.instance_of(str))
+
+    sync_every: int = field(
+        default=64,
+        validator=validators.instance_of(int))
+
+    compact_every: Optional[int] = field(
+        default=None,
+        validator=validators.optional(validators.instance_of(int)))
+
+    compactor: Optional[Callable[[], None]] = field(
+        default=None,
+        repr=False,
+        validator=validators.optional(validators.is_callable()))
+
+    _file: Optional[IO[bytes]] = field(
+        init=False,
+        default=None,
+        repr=False,
+        eq=False)
+
+    _unsynced: int = field(
+        init=False,
+        default=0,
+        repr=False,
+        eq=False)
+
+    _records: int = field(
+        init=False,
+        default=0,
+        repr=False,
+        eq=False)
+
+    def _open(self) -> IO[bytes]:
+        if self._file is None or self._file.closed:
+            self._file = open(self.path, 'ab')
+        return self._file
+
+    @staticmethod
+    def _encode(package_hash: str, nonce_hash: str, group_unit: GroupUnit) -> bytes:
+        record = {
+            "package_hash": package_hash,
+            "nonce_hash": nonce_hash,
+            "group_unit": group_unit.to_dict(),
+        }
+        return json.dumps(record, separators=(',', ':')).encode() + b'\n'
+
+    def append(self, package_hash: str, nonce_hash: str, group_unit: GroupUnit) -> None:
+        """Append the record of an entry added to the Pool
+
+        Args:
+            package_hash (str): The package_hash of the entry
+            nonce_hash (str): The nonce_hash of the entry
+            group_unit (GroupUnit): The GroupUnit of the entry
+        """
+        self.extend(((package_hash, nonce_hash, group_unit), ))
+
+    def extend(self, entries: Iterable[tuple[str, str, GroupUnit]]) -> None:
+        """Append the records of a batch of entries added to the Pool
+
+        The journal is synced and compacted at most once per batch, after the whole batch is written.
+
+        Args:
+            entries (Iterable[tuple[str, str, GroupUnit]]): The (package_hash, nonce_hash, GroupUnit) of each entry
+        """
+        file: IO[bytes] = self._open()
+        for package_hash, nonce_hash, group_unit in entries:
+            file.write(self._encode(package_hash, nonce_hash, group_unit))
+            self._unsynced += 1
+            self._records += 1
+
+        if self._unsynced >= self.sync_every:
+            self.flush()
+
+        if self.compact_every is not None and self.compactor is not None and self._records >= self.compact_every:
+            self.compact()
+
+    def flush(self) -> None:
+        """Write the buffered records to disk and fsync the journal
+        """
+        if self._file is None or self._file.closed:
+            return None
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def compact(self) -> None:
+        """Write a snapshot with the compactor and truncate the journal
+
+        The snapshot is written first, a crash before the truncation only leaves records
+        that are already in the snapshot, which replay skips.
+        """
+        if self.compactor is None:
+            raise ValueError('Expected a compactor to compact the journal')
+
+        self.flush()
+        self.compactor()
+        self.truncate()
+
+    def truncate(self) -> None:
+        """Remove every record from the journal
+        """
+        self.close()
+        with open(self.path, 'wb') as f:
+            os.fsync(f.fileno())
+        self._records = 0
+
+    def replay(self) -> Iterator[tuple[str, str, GroupUnit]]:
+        """Read the records of the journal back
+
+        A torn last record, left by a crash in the middle of a write, is cut off the journal
+        so that the next record starts on its own line.
+
+        Yields:
+            tuple[str, str, GroupUnit]: The (package_hash, nonce_hash, GroupUnit) of each record
+
+        Raises:
+            ValueError: If a record other than the last one is corrupt
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        self.flush()
+        with open(self.path, 'r+b') as f:
+            offset: int = 0
+            for line in iter(f.readline, b''):
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError('Expected the record to end with a newline')
+                    record = json.loads(line)
+                except ValueError as e:
+                    # Only the last record can be torn by a crash, a corrupt record followed by others is not cut off
+                    if f.readline() != b'':
+                        raise ValueError(f'{self.path}: corrupt record at offset {offset}, followed by more records') from e
+
+                    logger.warning('%s: cutting off torn record at offset %d', self.path, offset)
+                    f.truncate(offset)
+                    return None
+
+                offset += len(line)
+                yield record["package_hash"], record["nonce_hash"], GroupUnit.from_dict(record["group_unit"])
+
+    def close(self) -> None:
+        """Flush and close the journal file
+        """
+        if self._file is None or self._file.closed:
+            return None
+
+        self.flush()
+        self._file.close()
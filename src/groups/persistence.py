@@ -0,0 +1,219 @@
+from attrs import define, field, validators
+import atexit
+import logging
+import threading
+import weakref
+from typing import Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# The workers that are not closed yet, closed by a single atexit hook
+_workers: 'weakref.WeakSet[PersistenceWorker]' = weakref.WeakSet()
+
+
+def _close_workers() -> None:
+    for worker in list(_workers):
+        worker.close()
+
+
+atexit.register(_close_workers)
+
+
+@define(slots=True, weakref_slot=True, eq=False)
+class PersistenceWorker:
+    """The PersistenceWorker class saves the state on a background thread
+
+    Notes:
+        Changes are marked with mark_dirty(), the worker waits for delay seconds after the first
+        unsaved change so that the changes arriving in the meantime are saved by a single call to save.
+        flush() and aflush() wait until every change marked before the call is saved.
+        Workers that are not closed are closed on interpreter shutdown, which saves their last changes.
+        The thread only holds the worker while it saves, a worker that is no longer referenced is
+        collected and its thread stops. The changes still pending are not saved then, a warning is logged instead.
+
+    Args:
+        save (Callable[[], None]): Saves the whole state, called on the worker thread
+        delay (float): The seconds to wait for more changes before saving. Defaults to 0.1.
+
+    Examples:
+        >>> worker = PersistenceWorker(groups.save_state)
+        >>> worker.mark_dirty()
+        >>> worker.flush()
+    """
+    save: Callable[[], None] = field(
+        validator=validators.is_callable())
+
+    delay: float = field(
+        default=0.1,
+        validator=validators.instance_of((int, float)))
+
+    _condition: threading.Condition = field(
+        init=False,
+        factory=threading.Condition,
+        repr=False,
+        eq=False)
+
+    _thread: Optional[threading.Thread] = field(
+        init=False,
+        default=None,
+        repr=False,
+        eq=False)
+
+    _changes: int = field(
+        init=False,
+        default=0,
+        repr=False,
+        eq=False)
+
+    _saved: int = field(
+        init=False,
+        default=0,
+        repr=False,
+        eq=False)
+
+    _flushes: int = field(
+        init=False,
+        default=0,
+        repr=False,
+        eq=False)
+
+    _closed: bool = field(
+        init=False,
+        default=False,
+        repr=False,
+        eq=False)
+
+    _error: Optional[BaseException] = field(
+        init=False,
+        default=None,
+        repr=False,
+        eq=False)
+
+    def __attrs_post_init__(self):
+        condition: threading.Condition = self._condition
+
+        def wake(_ref: weakref.ref) -> None:
+            with condition:
+                condition.notify_all()
+
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(weakref.ref(self, wake), condition),
+            name='groups-persistence',
+            daemon=True)
+        self._thread.start()
+        _workers.add(self)
+
+    @staticmethod
+    def _run(ref: weakref.ref, condition: threading.Condition) -> None:
+        # The worker is dropped before each wait, so the thread never keeps it alive
+        while True:
+            with condition:
+                worker: Optional[PersistenceWorker] = ref()
+                while worker is not None and worker._changes == worker._saved and not worker._closed:
+                    worker = None
+                    condition.wait()
+                    worker = ref()
+
+                if worker is None or worker._changes == worker._saved:
+                    return None
+
+                # Let more changes arrive, unless a flush or close is waiting on this save
+                if worker._flushes == 0 and not worker._closed:
+                    delay: float = worker.delay
+                    worker = None
+                    condition.wait(delay)
+                    worker = ref()
+                    if worker is None:
+                        return None
+
+                target: int = worker._changes
+
+            error: Optional[BaseException] = None
+            try:
+                worker.save()
+            except Exception as e:
+                logger.exception('Saving the state failed')
+                error = e
+
+            with condition:
+                worker._saved = target
+                worker._error = error
+                condition.notify_all()
+                worker = None
+
+    def __del__(self):
+        # Only reports the changes that are lost, saving is left to close() and the atexit hook
+        if not self._closed and self._changes != self._saved:
+            logger.warning('Dropping %d unsaved changes, close() or flush() the PersistenceWorker before releasing it',
+                           self._changes - self._saved)
+
+    def mark_dirty(self) -> None:
+        """Mark a change of the state to be saved in the background
+
+        Once the worker is closed, the state is saved right away instead.
+        """
+        with self._condition:
+            if not self._closed:
+                self._changes += 1
+                if self._changes == self._saved + 1:
+                    self._condition.notify_all()
+                return None
+
+        self.save()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until every change marked so far is saved
+
+        Args:
+            timeout (Optional[float]): The seconds to wait. Defaults to None, waiting until saved.
+
+        Raises:
+            TimeoutError: If the changes are not saved within timeout
+            Exception: The error raised by the last save, if it failed
+        """
+        with self._condition:
+            target: int = self._changes
+            self._flushes += 1
+            self._condition.notify_all()
+            try:
+                if not self._condition.wait_for(lambda: self._saved >= target, timeout):
+                    raise TimeoutError(f'Expected the state to be saved within {timeout}s')
+            finally:
+                self._flushes -= 1
+
+            error, self._error = self._error, None
+
+        if error is not None:
+            raise error
+
+    async def aflush(self, timeout: Optional[float] = None) -> None:
+        """Wait until every change marked so far is saved, without blocking the event loop
+
+        Args:
+            timeout (Optional[float]): The seconds to wait. Defaults to None, waiting until saved.
+        """
+        # asyncio is only imported by callers that already run an event loop
+        import asyncio
+
+        await asyncio.to_thread(self.flush, timeout)
+
+    def close(self) -> None:
+        """Save the last changes and stop the worker thread
+        """
+        with self._condition:
+            if self._closed:
+                return None
+            self._closed = True
+            self._condition.notify_all()
+
+        _workers.discard(self)
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+        with self._condition:
+            error, self._error = self._error, None
+
+        if error is not None:
+            raise error
@@ -1,8 +1,22 @@
 from attrs import define, field, validators, Factory
-from typing import NamedTuple, Tuple, Optional, override
+import os
+import mmap
+import threading
+from bisect import bisect_left, insort
+from operator import itemgetter
+from collections.abc import Sequence
+from typing import Callable, Iterator, NamedTuple, Tuple, Optional, Iterable, override
 
 from .base import BaseContainer, BaseSchema, BaseValue
 from .unit import GroupUnit, Nonce
+from .utils.crypto import MerkleTree, MerkleTrie
+from .utils.encoding import ByteReader, write_hash, write_varint
+from .journal import Journal
+
+
+__SNAPSHOT_MAGIC__ = b'GRPS'
+__SNAPSHOT_VERSION__ = 3
+__SNAPSHOT_FOOTER_SIZE__ = 8 + len(__SNAPSHOT_MAGIC__)
 
 
 class SHA256Hash(str):
@@ -38,10 +52,138 @@ def _validate_group_unit_entry(instance, attr, value: GroupUnitEntry) -> GroupUn
     return value
 
 
+class GroupUnitEntries(Sequence):
+    """A read-only view over the GroupUnitEntries held by a Pool
+
+    The view is live, entries appended to the Pool show up in the view without copying.
+    It compares equal to a tuple holding the same entries.
+    """
+    __slots__ = ('_entries', )
+
+    def __init__(self, entries: list[GroupUnitEntry]) -> None:
+        self._entries = entries
+
+    def __getitem__(self, index: int | slice) -> GroupUnitEntry | Tuple[GroupUnitEntry, ...]:
+        if isinstance(index, slice):
+            return tuple(self._entries[index])
+        return self._entries[index]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GroupUnitEntries):
+            return self._entries == other._entries
+        if isinstance(other, tuple):
+            return len(self._entries) == len(other) and all(a == b for a, b in zip(self._entries, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(tuple(self._entries))
+
+
+class _SnapshotGroupUnitEntries(list):
+    """The GroupUnitEntries of a memory-mapped Pool snapshot, decoded on first access
+
+    The hashes of every entry are read up front from the index of the snapshot, each GroupUnit
+    is only decoded from the snapshot when its entry is first read, and is then kept in place
+    of the undecoded entry. Once closed, the entries that were not read can not be decoded.
+
+    Args:
+        snapshot (mmap.mmap | bytes): The snapshot the entries are read from
+    """
+    __slots__ = ('_snapshot', '_offsets')
+
+    def __init__(self, snapshot: mmap.mmap | bytes) -> None:
+        super().__init__()
+        self._snapshot = snapshot
+        self._offsets: list[int] = []
+
+    def _append_undecoded(self, package_hash: str, nonce_hash: str, offset: int) -> None:
+        super().append(GroupUnitEntry(package_hash, nonce_hash, None))
+        self._offsets.append(offset)
+
+    def _iter_hashes(self) -> Iterable[tuple[str, str]]:
+        """Iterate over the (package_hash, nonce_hash) of the entries without decoding them"""
+        for item in super().__iter__():
+            yield item[0], item[1]
+
+    def _decode(self, index: int) -> GroupUnitEntry:
+        item: GroupUnitEntry = super().__getitem__(index)
+        if item[2] is None:
+            if self._snapshot is None:
+                raise ValueError(f'Expected an open snapshot to decode the GroupUnit at position {index}')
+
+            reader = ByteReader(self._snapshot, self._offsets[index])
+            reader.read_varint()
+            item = GroupUnitEntry(item[0], item[1], GroupUnit._read_bytes(reader))
+            super().__setitem__(index, item)
+        return item
+
+    def close(self) -> None:
+        """Close the memory-mapped snapshot"""
+        if self._snapshot is not None and hasattr(self._snapshot, 'close'):
+            self._snapshot.close()
+        self._snapshot = None
+
+    def append(self, item: GroupUnitEntry) -> None:
+        super().append(item)
+        self._offsets.append(-1)
+
+    def __getitem__(self, index: int | slice) -> GroupUnitEntry | list[GroupUnitEntry]:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(len(self)))]
+        return self._decode(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._decode(index)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, list):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def _convert_group_units(value: Iterable[GroupUnitEntry] | None) -> list[GroupUnitEntry]:
+    """Copies the GroupUnitEntries given to a Pool into its append-only storage
+
+    Raises:
+        TypeError: If the entries are not held in a tuple
+    """
+    if value is None:
+        return []
+
+    if not isinstance(value, (tuple, GroupUnitEntries)):
+        raise TypeError(f'Expected tuple, got {type(value)}')
+
+    return list(value)
+
+
 @define(slots=True, weakref_slot=False)
 class Pool:
     """The Pool class holds the Group Units
 
+    Notes:
+        The entries are stored append-only in a list, so adding a GroupUnit is amortized O(1).
+        group_units returns a read-only view over the entries.
+        A Merkle Trie over the entries is kept up to date as they are added, see root(). The root is over the set
+        of entries and does not depend on the insertion order, so replicas that receive the same entries in a
+        different order, like after sync_from(), still agree on it, and diff() can walk their tries side by side.
+        Snapshots and state files store the entries in insertion order, and check them against this root.
+        The nonce tree index maps each nonce chain to the positions of its sub-units, it is built
+        on the first call to children(), parent() or subtree() and kept up to date after that.
+        In the same way, a sorted index of the nonce chains backs range() and prefix().
+        A Pool opened with open_snapshot() only decodes a GroupUnit when it is read.
+        Entries are appended under a lock, so a snapshot of the Pool can be taken from another thread.
+        With a Journal attached, every added entry is also appended to the journal.
+
     Args:
         group_units (tuple[tuple[str, str, GroupUnit]]): The Group Units held by the Pool
             structure: ((package_hash, nonce_hash, GroupUnit), ...)
@@ -49,11 +191,319 @@ class Pool:
     Examples:
         >>> pool = Pool(group_units=(('package_hash', 'nonce_hash', GroupUnit()),))
     """
-    group_units: Tuple[GroupUnitEntry, ...] = field(
+    _group_units: list[GroupUnitEntry] = field(
+        alias="group_units",
         default=Factory(tuple),
-        validator=validators.optional(validators.deep_iterable(_validate_group_unit_entry,
-        iterable_validator=validators.instance_of(tuple))))
-    
+        converter=_convert_group_units,
+        validator=validators.deep_iterable(_validate_group_unit_entry,
+        iterable_validator=validators.instance_of(list)))
+
+    _package_index: dict[str, int] = field(
+        init=False,
+        factory=dict,
+        repr=False,
+        eq=False)
+
+    _nonce_index: dict[str, int] = field(
+        init=False,
+        factory=dict,
+        repr=False,
+        eq=False)
+
+    _nonce_tree: Optional[dict[tuple, list[int]]] = field(
+        init=False,
+        default=None,
+        repr=False,
+        eq=False)
+
+    _nonce_order: Optional[list[tuple[tuple, int]]] = field(
+        init=False,
+        default=None,
+        repr=False,
+        eq=False)
+
+    _tree: MerkleTrie = field(
+        init=False,
+        factory=MerkleTrie,
+        repr=False,
+        eq=False)
+
+    _journal: Optional[Journal] = field(
+        init=False,
+        default=None,
+        repr=False,
+        eq=False)
+
+    _on_change: Optional[Callable[[], None]] = field(
+        init=False,
+        default=None,
+        repr=False,
+        eq=False)
+
+    _lock: threading.RLock = field(
+        init=False,
+        factory=threading.RLock,
+        repr=False,
+        eq=False)
+
+    def __attrs_post_init__(self):
+        for position, item in enumerate(self._group_units):
+            self._index_group_unit_entry(item, position)
+
+        self._tree.extend(self._hash_group_unit_entry(item) for item in self._group_units)
+
+    @staticmethod
+    def _hash_group_unit_entry(item: GroupUnitEntry) -> bytes:
+        """Hash the package_hash and nonce_hash of a GroupUnitEntry into a leaf of the Pool's Merkle Trie
+
+        Args:
+            item (GroupUnitEntry): The entry to hash
+
+        Returns:
+            bytes: The digest of the package_hash followed by the nonce_hash
+        """
+        return MerkleTree._hash_func(item[0] + item[1])
+
+    def root(self) -> str | None:
+        """The Merkle root over the (package_hash, nonce_hash) of the entries
+
+        The root does not depend on the insertion order, two Pools holding the same entries
+        have the same root, see MerkleTrie. It does not check the order of the entries.
+
+        Returns:
+            str | None: The root of the Pool, or None if the Pool is empty
+        """
+        return self._tree.root()
+
+    @property
+    def group_units(self) -> GroupUnitEntries:
+        """The Group Units held by the Pool
+
+        Returns:
+            GroupUnitEntries: A read-only view of the ((package_hash, nonce_hash, GroupUnit), ...) entries
+        """
+        return GroupUnitEntries(self._group_units)
+
+    def _index_group_unit_entry(self, item: GroupUnitEntry, position: int) -> None:
+        """Index a GroupUnitEntry by its package_hash and nonce_hash
+
+        Args:
+            item (GroupUnitEntry): The entry to index
+            position (int): The position of the entry in group_units
+        """
+        self._package_index.setdefault(item[0], position)
+        self._nonce_index.setdefault(item[1], position)
+
+        if self._nonce_tree is not None:
+            self._index_nonce(item[2].nonce, position)
+        if self._nonce_order is not None:
+            insort(self._nonce_order, (self._nonce_sort_key(item[2].nonce), position), key=itemgetter(0))
+
+    @staticmethod
+    def _nonce_key(nonce: Nonce) -> tuple:
+        """The key of a Nonce in the nonce tree index
+
+        Args:
+            nonce (Nonce): The Nonce
+
+        Returns:
+            tuple: The values of the nonce chain
+        """
+        return tuple(item.value for item in nonce._chain.items)
+
+    def _index_nonce(self, nonce: Nonce, position: int) -> None:
+        """Index the position of a GroupUnit under the nonce chain of its super-unit
+
+        Args:
+            nonce (Nonce): The Nonce of the GroupUnit
+            position (int): The position of the entry in group_units
+        """
+        self._nonce_tree.setdefault(self._nonce_key(nonce)[:-1], []).append(position)
+
+    def _get_nonce_tree(self) -> dict[tuple, list[int]]:
+        """The nonce tree index, built from the entries on first use
+
+        Returns:
+            dict[tuple, list[int]]: The positions of the sub-units of each nonce chain, in insertion order
+        """
+        with self._lock:
+            if self._nonce_tree is None:
+                self._nonce_tree = {}
+                for position, item in enumerate(self._group_units):
+                    self._index_nonce(item[2].nonce, position)
+
+            return self._nonce_tree
+
+    @staticmethod
+    def _nonce_sort_key(nonce: Nonce) -> tuple:
+        """The key of a Nonce in the sorted nonce index
+
+        int and str nonce values do not compare, each value is paired with the rank of its type,
+        so ints sort before strs at the same depth of the chain.
+
+        Args:
+            nonce (Nonce): The Nonce
+
+        Returns:
+            tuple: The (type rank, value) of each value of the nonce chain
+        """
+        return tuple((0, item.value) if isinstance(item.value, int) else (1, item.value) for item in nonce._chain.items)
+
+    def _get_nonce_order(self) -> list[tuple[tuple, int]]:
+        """The sorted nonce index, built from the entries on first use
+
+        Returns:
+            list[tuple[tuple, int]]: The (sort key, position) of each entry, sorted by nonce chain
+        """
+        with self._lock:
+            if self._nonce_order is None:
+                self._nonce_order = sorted(
+                    ((self._nonce_sort_key(item[2].nonce), position) for position, item in enumerate(self._group_units)),
+                    key=itemgetter(0))
+
+            return self._nonce_order
+
+    def _iter_nonce_order(self, start_key: tuple, end_key: tuple) -> Iterator[GroupUnit]:
+        """Iterate over the GroupUnits with a nonce chain from start_key up to, but excluding, end_key
+
+        The bounds are looked up once, the GroupUnits are read as the generator advances.
+
+        Args:
+            start_key (tuple): The sort key of the first nonce chain
+            end_key (tuple): The sort key past the last nonce chain
+
+        Yields:
+            GroupUnit: The GroupUnits, sorted by nonce chain
+        """
+        with self._lock:
+            nonce_order: list[tuple[tuple, int]] = self._get_nonce_order()
+            low: int = bisect_left(nonce_order, start_key, key=itemgetter(0))
+            high: int = bisect_left(nonce_order, end_key, lo=low, key=itemgetter(0))
+            positions: list[int] = [position for _, position in nonce_order[low:high]]
+
+        for position in positions:
+            yield self._group_units[position][2]
+
+    def range(self, start_nonce: Nonce, end_nonce: Nonce) -> Iterator[GroupUnit]:
+        """Iterate over the GroupUnits with a nonce chain from start_nonce up to, but excluding, end_nonce
+
+        Nonce chains compare value by value, a sub-unit sorts right after its super-unit.
+
+        Args:
+            start_nonce (Nonce): The first Nonce of the range
+            end_nonce (Nonce): The Nonce past the end of the range
+
+        Yields:
+            GroupUnit: The GroupUnits, sorted by nonce chain
+
+        Examples:
+            >>> pool.range(Nonce(BaseContainer((100, ))), Nonce(BaseContainer((200, ))))
+        """
+        assert isinstance(start_nonce, Nonce), f'Expected start_nonce to be Nonce, got {type(start_nonce)}'
+        assert isinstance(end_nonce, Nonce), f'Expected end_nonce to be Nonce, got {type(end_nonce)}'
+
+        return self._iter_nonce_order(self._nonce_sort_key(start_nonce), self._nonce_sort_key(end_nonce))
+
+    def prefix(self, nonce: Nonce) -> Iterator[GroupUnit]:
+        """Iterate over the GroupUnits with a nonce chain starting with the chain of a Nonce
+
+        Args:
+            nonce (Nonce): The Nonce of the prefix, its own GroupUnit is included
+
+        Yields:
+            GroupUnit: The GroupUnits, sorted by nonce chain
+
+        Examples:
+            >>> pool.prefix(Nonce(BaseContainer((3, ))))
+        """
+        assert isinstance(nonce, Nonce), f'Expected nonce to be Nonce, got {type(nonce)}'
+
+        start_key: tuple = self._nonce_sort_key(nonce)
+        # (2, ) sorts after the (type rank, value) of every nonce value
+        return self._iter_nonce_order(start_key, start_key + ((2, ), ))
+
+    def children(self, nonce: Nonce) -> Tuple[GroupUnit, ...]:
+        """Get the sub-units of a Nonce, one level down the nonce chain
+
+        Args:
+            nonce (Nonce): The Nonce of the super-unit
+
+        Returns:
+            Tuple[GroupUnit, ...]: The sub-units, in insertion order
+        """
+        assert isinstance(nonce, Nonce), f'Expected nonce to be Nonce, got {type(nonce)}'
+
+        positions: list[int] = self._get_nonce_tree().get(self._nonce_key(nonce), [])
+        return tuple(self._group_units[position][2] for position in positions)
+
+    def parent(self, nonce: Nonce) -> GroupUnit | None:
+        """Get the super-unit of a Nonce, one level up the nonce chain
+
+        Args:
+            nonce (Nonce): The Nonce of the sub-unit
+
+        Returns:
+            GroupUnit | None: The super-unit, None if the Nonce is at the top level or its super-unit is not in the Pool
+        """
+        assert isinstance(nonce, Nonce), f'Expected nonce to be Nonce, got {type(nonce)}'
+
+        if len(nonce._chain.items) < 2:
+            return None
+
+        position: int | None = self._find_position(self._get_super_nonce(nonce)._hash_root(), lookup='nonce')
+        if position is None:
+            return None
+
+        return self._group_units[position][2]
+
+    def subtree(self, nonce: Nonce) -> Iterator[GroupUnit]:
+        """Iterate over a GroupUnit and all of its sub-units, depth-first
+
+        Args:
+            nonce (Nonce): The Nonce at the top of the subtree
+
+        Yields:
+            GroupUnit: The GroupUnit of the Nonce, if it is in the Pool, then each sub-unit followed by its own sub-units
+        """
+        assert isinstance(nonce, Nonce), f'Expected nonce to be Nonce, got {type(nonce)}'
+
+        nonce_tree: dict[tuple, list[int]] = self._get_nonce_tree()
+        key: tuple = self._nonce_key(nonce)
+
+        position: int | None = self._find_position(nonce._hash_root(), lookup='nonce')
+        if position is not None:
+            yield self._group_units[position][2]
+
+        stack: list[Iterator[int]] = [iter(nonce_tree.get(key, ()))]
+        while len(stack) > 0:
+            position = next(stack[-1], None)
+            if position is None:
+                stack.pop()
+                continue
+
+            group_unit: GroupUnit = self._group_units[position][2]
+            yield group_unit
+            stack.append(iter(nonce_tree.get(self._nonce_key(group_unit.nonce), ())))
+
+    def _find_position(self, hash_: str, lookup: str = "all") -> int | None:
+        """Find the position of a GroupUnitEntry in the Pool from its hash
+
+        Args:
+            hash_ (str): The package_hash or nonce_hash to look up
+            lookup (str, optional): The lookup method to use. Defaults to "all".
+
+        Returns:
+            int | None: The position of the first matching entry, None if there is no match
+        """
+        package_position: int | None = self._package_index.get(hash_) if lookup in ('unit', 'all') else None
+        nonce_position: int | None = self._nonce_index.get(hash_) if lookup in ('nonce', 'all') else None
+
+        if package_position is None:
+            return nonce_position
+        if nonce_position is None:
+            return package_position
+        return min(package_position, nonce_position)
+
     def _check_if_hash_exists(self, hashs: tuple[str, ...], lookup: str = "all") -> bool:
         """Check if a GroupUnit exists in the Pool
 
@@ -71,12 +521,8 @@ class Pool:
         assert lookup in ('unit', 'nonce', 'all'), f'Expected lookup to be package_hash or nonce_hash, got {lookup}'
 
         for hash_item in hashs:
-            # print(f'hash_item: {hash_item}')
-            for item in iter(self):
-                if item[0] == hash_item and (lookup == 'unit' or lookup == 'all'):
-                    return True
-                if item[1] == hash_item and (lookup == 'nonce' or lookup == 'all'):
-                    return True
+            if self._find_position(hash_item, lookup) is not None:
+                return True
         return False
     
     def check_if_exists(self, group_unit: GroupUnit) -> bool:
@@ -88,8 +534,8 @@ class Pool:
         Returns:
             bool: True if the GroupUnit exists in the Pool, False otherwise
         """
-        package_hash: str = group_unit.data._hash().root()
-        nonce_hash: str = group_unit.nonce._hash().root()
+        package_hash: str = group_unit.data._hash_root()
+        nonce_hash: str = group_unit.nonce._hash_root()
 
         return self._check_if_hash_exists((package_hash, nonce_hash), lookup='all')
     
@@ -105,8 +551,8 @@ class Pool:
         if not isinstance(group_unit, GroupUnit):
             raise TypeError(f'Expected GroupUnit, got {type(group_unit)}')
 
-        group_unit_hash: str | None = group_unit.data._hash().root()
-        nonce_hash: str | None = group_unit.nonce._hash().root()
+        group_unit_hash: str | None = group_unit.data._hash_root()
+        nonce_hash: str | None = group_unit.nonce._hash_root()
 
         # print(f'group_unit_hash: {group_unit_hash}, nonce_hash: {nonce_hash}')
         assert group_unit_hash is not None, f'Expected group_unit_hash to be str, got {type(group_unit_hash)}'
@@ -115,7 +561,549 @@ class Pool:
         if self._check_if_hash_exists((group_unit_hash, nonce_hash), lookup='all'):
             raise ValueError(f'GroupUnit with package_hash {group_unit_hash} already exists in the Pool')
 
-        self.group_units += ((group_unit_hash, nonce_hash, group_unit), )
+        self._append_group_unit_entry(GroupUnitEntry(group_unit_hash, nonce_hash, group_unit))
+
+    def add_group_units(self, group_units: Iterable[GroupUnit]) -> None:
+        """Add a batch of GroupUnits to the Pool
+
+        The batch is hashed in a single pass and checked for duplicates, both inside the batch
+        and against the Pool, before any GroupUnit is added.
+
+        Args:
+            group_units (Iterable[GroupUnit]): The GroupUnits to add to the Pool
+
+        Raises:
+            TypeError: If an item of the batch is not a GroupUnit
+            ValueError: If a GroupUnit is duplicated in the batch or already exists in the Pool
+        """
+        entries: list[GroupUnitEntry] = []
+        seen: set[str] = set()
+
+        for group_unit in group_units:
+            if not isinstance(group_unit, GroupUnit):
+                raise TypeError(f'Expected GroupUnit, got {type(group_unit)}')
+
+            entry = GroupUnitEntry(group_unit.data._hash_root(), group_unit.nonce._hash_root(), group_unit)
+
+            if entry[0] in seen or entry[1] in seen or self._check_if_hash_exists((entry[0], entry[1]), lookup='all'):
+                raise ValueError(f'GroupUnit with package_hash {entry[0]} already exists in the Pool')
+
+            seen.update((entry[0], entry[1]))
+            entries.append(entry)
+
+        self._append_group_unit_entries(entries)
+
+    @staticmethod
+    def _entry_to_dict(item: GroupUnitEntry) -> dict:
+        return {
+            "package_hash": item[0],
+            "nonce_hash": item[1],
+            "group_unit": item[2].to_dict(),
+        }
+
+    @staticmethod
+    def _entry_from_dict(data: dict, trusted: bool = False) -> GroupUnitEntry:
+        """Restore a GroupUnitEntry from the output of _entry_to_dict()
+
+        Untrusted entries are checked against the hashes of their GroupUnit, see _check_entry_hashes().
+        Trusted entries are checked once the whole Pool is restored, against its stored root.
+        """
+        entry = GroupUnitEntry(data["package_hash"], data["nonce_hash"], GroupUnit.from_dict(data["group_unit"], trusted))
+        return entry if trusted else Pool._check_entry_hashes(entry)
+
+    @staticmethod
+    def _check_entry_hashes(entry: GroupUnitEntry) -> GroupUnitEntry:
+        """Check the stored package_hash and nonce_hash of an entry against the hashes of its GroupUnit
+
+        Args:
+            entry (GroupUnitEntry): The restored entry
+
+        Returns:
+            GroupUnitEntry: The entry
+
+        Raises:
+            ValueError: If a stored hash does not match the GroupUnit
+        """
+        if entry[0] != entry[2].data._hash_root():
+            raise ValueError(f'Expected package_hash {entry[2].data._hash_root()}, got {entry[0]}')
+        if entry[1] != entry[2].nonce._hash_root():
+            raise ValueError(f'Expected nonce_hash {entry[2].nonce._hash_root()}, got {entry[1]}')
+        return entry
+
+    @staticmethod
+    def _hash_group_unit(group_unit: GroupUnit) -> bytes:
+        """Hash a GroupUnit into a leaf of the Pool's Merkle Trie from its own hashes, not the stored ones
+
+        Args:
+            group_unit (GroupUnit): The GroupUnit to hash
+
+        Returns:
+            bytes: The digest of the package_hash followed by the nonce_hash of the GroupUnit
+        """
+        return MerkleTree._hash_func(group_unit.data._hash_root() + group_unit.nonce._hash_root())
+
+    def to_dict(self) -> dict:
+        """The entries of the Pool with their precomputed hashes
+
+        Returns:
+            dict: {"root": str | None, "group_units": [{"package_hash": str, "nonce_hash": str, "group_unit": dict}, ...]}
+        """
+        return self._snapshot_to_dict(*self._snapshot())
+
+    @staticmethod
+    def _snapshot_to_dict(entries: list[GroupUnitEntry], root: str | None) -> dict:
+        """The output of to_dict() for entries and their root taken by _snapshot()
+
+        Returns:
+            dict: {"root": str | None, "group_units": [{"package_hash": str, "nonce_hash": str, "group_unit": dict}, ...]}
+        """
+        return {
+            "root": root,
+            "group_units": [Pool._entry_to_dict(item) for item in entries],
+        }
+
+    def _snapshot(self) -> tuple[list[GroupUnitEntry], str | None]:
+        """The entries of the Pool and their root, taken together
+
+        Returns:
+            tuple[list[GroupUnitEntry], str | None]: A copy of the entries and the root over them
+        """
+        with self._lock:
+            return list(self._group_units), self.root()
+
+    @classmethod
+    def from_dict(cls, data: dict, trusted: bool = False) -> 'Pool':
+        """Restore a Pool from the output of to_dict()
+
+        The Group Units are rebuilt with their converters and validators, and the stored package_hash
+        and nonce_hash of each entry are checked against the hashes of its GroupUnit.
+        They are not checked for duplicates again.
+
+        Args:
+            data (dict): The Pool as returned by to_dict()
+            trusted (bool): Rebuild the Nonce and Data of the Group Units without their converters and
+                validators, then hash them once and check them against the stored root. Defaults to False.
+
+        Returns:
+            Pool: The restored Pool
+
+        Raises:
+            ValueError: If a stored hash does not match its GroupUnit, the restored entries do not match
+                the stored root, or trusted is set and there is no stored root
+        """
+        if trusted and "root" not in data:
+            raise ValueError('Expected a stored root to verify a trusted load')
+
+        pool = cls()
+        pool._append_group_unit_entries(cls._entry_from_dict(item, trusted) for item in data.get("group_units", ()))
+
+        if "root" in data and pool.root() != data["root"]:
+            raise ValueError(f'Expected Pool root {data["root"]}, got {pool.root()}')
+
+        if trusted:
+            tree = MerkleTrie(cls._hash_group_unit(item[2]) for item in pool._group_units)
+            if tree.root() != data["root"]:
+                raise ValueError(f'Expected the Group Units to hash to the Pool root {data["root"]}, got {tree.root()}')
+
+        return pool
+
+    def to_bytes(self) -> bytes:
+        """The binary snapshot of the Pool
+
+        Notes:
+            The snapshot is laid out as:
+                magic (4 bytes) | version (1 byte) | entry count (varint) | root flag (1 byte) [| root (32 bytes)]
+            followed by each entry:
+                GroupUnit length (varint) | GroupUnit.to_bytes()
+            then the index, one record per entry:
+                package_hash | nonce_hash | offset of the entry (varint)
+            and the footer:
+                offset of the index (8 bytes, big-endian) | magic (4 bytes)
+
+        Returns:
+            bytes: The snapshot with the precomputed hashes of every entry
+        """
+        entries, root = self._snapshot()
+
+        buffer = bytearray(__SNAPSHOT_MAGIC__)
+        buffer.append(__SNAPSHOT_VERSION__)
+        write_varint(buffer, len(entries))
+
+        if root is None:
+            buffer.append(0)
+        else:
+            buffer.append(1)
+            buffer += bytes.fromhex(root)
+
+        offsets: list[int] = []
+        unit_buffer = bytearray()
+        for item in entries:
+            offsets.append(len(buffer))
+            unit_buffer.clear()
+            item[2]._write_bytes(unit_buffer)
+            write_varint(buffer, len(unit_buffer))
+            buffer += unit_buffer
+
+        index_offset: int = len(buffer)
+        for item, offset in zip(entries, offsets):
+            write_hash(buffer, item[0])
+            write_hash(buffer, item[1])
+            write_varint(buffer, offset)
+
+        buffer += index_offset.to_bytes(8, 'big')
+        buffer += __SNAPSHOT_MAGIC__
+
+        return bytes(buffer)
+
+    @staticmethod
+    def _read_snapshot_header(reader: ByteReader) -> tuple[int, str | None]:
+        """Read the header of a binary snapshot
+
+        Args:
+            reader (ByteReader): A reader at the start of the snapshot
+
+        Returns:
+            tuple[int, str | None]: The number of entries and the root of the snapshot
+
+        Raises:
+            ValueError: If the data is not a snapshot of a supported version
+        """
+        if bytes(reader.read(len(__SNAPSHOT_MAGIC__))) != __SNAPSHOT_MAGIC__:
+            raise ValueError('Expected a Pool snapshot')
+
+        version: int = reader.read_byte()
+        if version != __SNAPSHOT_VERSION__:
+            raise ValueError(f'Expected snapshot version {__SNAPSHOT_VERSION__}, got {version}')
+
+        count: int = reader.read_varint()
+        root: str | None = reader.read(32).hex() if reader.read_byte() == 1 else None
+
+        return count, root
+
+    @staticmethod
+    def _read_snapshot_index(data: memoryview, count: int, entries_offset: int) -> tuple[list[tuple[str, str, int]], int]:
+        """Read the index of a binary snapshot from its footer, without reading the entries
+
+        Args:
+            data (memoryview): The snapshot
+            count (int): The number of entries, from the header
+            entries_offset (int): The offset of the first entry, right after the header
+
+        Returns:
+            tuple[list[tuple[str, str, int]], int]: The (package_hash, nonce_hash, offset) of each entry,
+                and the offset of the index
+
+        Raises:
+            ValueError: If the footer or the index is malformed
+        """
+        footer_offset: int = len(data) - __SNAPSHOT_FOOTER_SIZE__
+        if footer_offset < entries_offset or bytes(data[footer_offset + 8:]) != __SNAPSHOT_MAGIC__:
+            raise ValueError('Expected the snapshot to end with the footer of its index')
+
+        index_offset: int = int.from_bytes(data[footer_offset:footer_offset + 8], 'big')
+        if not entries_offset <= index_offset <= footer_offset:
+            raise ValueError(f'Expected the index offset {index_offset} to be between {entries_offset} and {footer_offset}')
+
+        reader = ByteReader(data, index_offset)
+        index: list[tuple[str, str, int]] = []
+        for _ in range(count):
+            package_hash: str = reader.read_hash()
+            nonce_hash: str = reader.read_hash()
+            offset: int = reader.read_varint()
+            if not entries_offset <= offset < index_offset:
+                raise ValueError(f'Expected the entry offset {offset} to be between {entries_offset} and {index_offset}')
+            index.append((package_hash, nonce_hash, offset))
+
+        if reader.offset != footer_offset:
+            raise ValueError(f'Expected the index to end at offset {footer_offset}, it ends at {reader.offset}')
+
+        return index, index_offset
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> 'Pool':
+        """Restore a Pool from the output of to_bytes()
+
+        The stored package_hash and nonce_hash are checked against each GroupUnit, like from_dict().
+
+        Args:
+            data (bytes | bytearray | memoryview): The binary snapshot
+
+        Returns:
+            Pool: The restored Pool
+
+        Raises:
+            ValueError: If the snapshot is malformed, a stored hash does not match its GroupUnit,
+                or the entries do not match the stored root
+        """
+        reader = ByteReader(data)
+        count, root = cls._read_snapshot_header(reader)
+        index, index_offset = cls._read_snapshot_index(reader.data, count, reader.offset)
+
+        entries: list[GroupUnitEntry] = []
+        for package_hash, nonce_hash, offset in index:
+            if offset != reader.offset:
+                raise ValueError(f'Expected the index to point at offset {reader.offset}, got {offset}')
+
+            unit_end: int = reader.read_varint() + reader.offset
+            entries.append(cls._check_entry_hashes(GroupUnitEntry(package_hash, nonce_hash, GroupUnit._read_bytes(reader))))
+
+            if reader.offset != unit_end:
+                raise ValueError(f'Expected the GroupUnit to end at offset {unit_end}, it ends at {reader.offset}')
+
+        if reader.offset != index_offset:
+            raise ValueError(f'Expected the entries to end at the index offset {index_offset}, they end at {reader.offset}')
+
+        pool = cls()
+        pool._append_group_unit_entries(entries)
+
+        if pool.root() != root:
+            raise ValueError(f'Expected Pool root {root}, got {pool.root()}')
+
+        return pool
+
+    def write_snapshot(self, path: str) -> None:
+        """Write the binary snapshot of the Pool to a file, replacing it atomically
+
+        Args:
+            path (str): The path of the snapshot file
+        """
+        temp_path: str = f'{path}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(self.to_bytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def read_snapshot(cls, path: str) -> 'Pool':
+        """Read a Pool from a binary snapshot file
+
+        Args:
+            path (str): The path of the snapshot file
+
+        Returns:
+            Pool: The restored Pool
+        """
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    @classmethod
+    def open_snapshot(cls, path: str) -> 'Pool':
+        """Open a binary snapshot file, decoding each GroupUnit only when it is read
+
+        The file is memory-mapped, only the index at the end of the snapshot is read to index the Pool
+        and check its root, the entries are not walked. get_group_unit() and iteration decode the
+        GroupUnits they return. close(), or leaving a with block, releases the memory map.
+
+        Args:
+            path (str): The path of the snapshot file
+
+        Returns:
+            Pool: The Pool backed by the snapshot
+
+        Raises:
+            ValueError: If the snapshot is malformed or its entries do not match the stored root
+        """
+        with open(path, 'rb') as f:
+            snapshot = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        reader = ByteReader(snapshot)
+        count, root = cls._read_snapshot_header(reader)
+        index, _ = cls._read_snapshot_index(reader.data, count, reader.offset)
+        del reader
+
+        entries = _SnapshotGroupUnitEntries(snapshot)
+        for package_hash, nonce_hash, offset in index:
+            entries._append_undecoded(package_hash, nonce_hash, offset)
+
+        pool = cls()
+        # Bypass the validators, they would decode every entry
+        object.__setattr__(pool, '_group_units', entries)
+        for position, hashes in enumerate(entries._iter_hashes()):
+            pool._package_index.setdefault(hashes[0], position)
+            pool._nonce_index.setdefault(hashes[1], position)
+        pool._tree.extend(pool._hash_group_unit_entry(hashes) for hashes in entries._iter_hashes())
+
+        if pool.root() != root:
+            raise ValueError(f'Expected Pool root {root}, got {pool.root()}')
+
+        return pool
+
+    def close(self) -> None:
+        """Release the memory-mapped snapshot the Pool was opened from, see open_snapshot()
+
+        The GroupUnits already read stay in the Pool, the others can no longer be decoded.
+        Pools that were not opened from a snapshot have nothing to release.
+        """
+        if isinstance(self._group_units, _SnapshotGroupUnitEntries):
+            self._group_units.close()
+
+    def __enter__(self) -> 'Pool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def set_on_change(self, callback: Optional[Callable[[], None]]) -> None:
+        """Call a callback after entries are added to the Pool, None removes the current one
+
+        Args:
+            callback (Optional[Callable[[], None]]): Called once per added entry or batch of entries
+        """
+        if callback is not None and not callable(callback):
+            raise TypeError(f'Expected a callable, got {type(callback)}')
+
+        self._on_change = callback
+
+    def attach_journal(self, journal: Optional[Journal]) -> None:
+        """Append every entry added from now on to a Journal, None detaches the current one
+
+        Args:
+            journal (Optional[Journal]): The Journal to write to
+        """
+        if journal is not None and not isinstance(journal, Journal):
+            raise TypeError(f'Expected Journal, got {type(journal)}')
+
+        self._journal = journal
+
+    def replay_journal(self, journal: Journal) -> int:
+        """Add the entries recorded in a Journal that are missing from the Pool
+
+        The recorded hashes are checked against each GroupUnit, and the replayed entries are not
+        written to a journal again.
+
+        Args:
+            journal (Journal): The Journal to replay
+
+        Returns:
+            int: The number of entries added
+
+        Raises:
+            ValueError: If a recorded hash does not match its GroupUnit
+        """
+        attached_journal: Optional[Journal] = self._journal
+        self._journal = None
+
+        count: int = 0
+        try:
+            for entry in journal.replay():
+                if self._check_if_hash_exists((entry[0], entry[1]), lookup='all'):
+                    continue
+                self._append_group_unit_entry(self._check_entry_hashes(GroupUnitEntry(*entry)))
+                count += 1
+        finally:
+            self._journal = attached_journal
+
+        return count
+
+    def _diff_positions(self, other: 'Pool') -> list[int]:
+        """Find the positions of the entries of another Pool that are missing from this Pool
+
+        The two Merkle Tries are walked from the root and every node they have in common is skipped,
+        so k differences take O(k log n) node comparisons, whatever order the entries were added in.
+
+        Args:
+            other (Pool): The Pool to compare against
+
+        Returns:
+            list[int]: The positions of the missing entries in the other Pool, in ascending order
+        """
+        return sorted(other._tree.index(leaf) for leaf in self._tree.missing(other._tree))
+
+    def diff(self, other: 'Pool') -> Tuple[GroupUnitEntry, ...]:
+        """Find the entries of another Pool that are missing from this Pool
+
+        An entry of the other Pool conflicts with this Pool when it is missing from it, but its
+        package_hash or nonce_hash is already held by another entry, like two replicas that created
+        different Group Units under the same nonce. The conflicts can not be synced, so they are raised.
+
+        Args:
+            other (Pool): The Pool to compare against
+
+        Returns:
+            Tuple[GroupUnitEntry, ...]: The missing entries, in the insertion order of the other Pool
+
+        Raises:
+            TypeError: If other is not a Pool
+            ValueError: If entries of the other Pool conflict with entries of this Pool
+        """
+        if not isinstance(other, Pool):
+            raise TypeError(f'Expected Pool, got {type(other)}')
+
+        missing: Tuple[GroupUnitEntry, ...] = ()
+        conflicts: Tuple[GroupUnitEntry, ...] = ()
+        for position in self._diff_positions(other):
+            entry: GroupUnitEntry = other._group_units[position]
+            if self._check_if_hash_exists((entry[0], entry[1]), lookup='all'):
+                conflicts += (entry, )
+            else:
+                missing += (entry, )
+
+        if len(conflicts) > 0:
+            raise ValueError(f'Expected the entries of the other Pool not to conflict, got {len(conflicts)} conflicting entries: '
+                             f'{[(item[0], item[1]) for item in conflicts]}')
+
+        return missing
+
+    def sync_from(self, other: 'Pool') -> Tuple[GroupUnitEntry, ...]:
+        """Add the entries of another Pool that are missing from this Pool
+
+        Only the differing entries are transferred, their hashes are reused as they are.
+        Nothing is added if any of them conflicts with this Pool, see diff().
+
+        Args:
+            other (Pool): The Pool to sync from
+
+        Returns:
+            Tuple[GroupUnitEntry, ...]: The entries that were added
+
+        Raises:
+            ValueError: If entries of the other Pool conflict with entries of this Pool
+        """
+        missing: Tuple[GroupUnitEntry, ...] = self.diff(other)
+        self._append_group_unit_entries(missing)
+
+        return missing
+
+    def _append_group_unit_entry(self, entry: GroupUnitEntry) -> None:
+        """Append an already hashed GroupUnitEntry to the Pool
+
+        Args:
+            entry (GroupUnitEntry): The entry to append
+        """
+        with self._lock:
+            self._group_units.append(entry)
+            self._index_group_unit_entry(entry, len(self._group_units) - 1)
+            self._tree.add(self._hash_group_unit_entry(entry))
+
+            if self._journal is not None:
+                self._journal.append(*entry)
+
+        if self._on_change is not None:
+            self._on_change()
+
+    def _append_group_unit_entries(self, entries: Iterable[GroupUnitEntry]) -> None:
+        """Append already hashed GroupUnitEntries to the Pool, extending the Merkle Trie once
+
+        Args:
+            entries (Iterable[GroupUnitEntry]): The entries to append
+        """
+        with self._lock:
+            start: int = len(self._group_units)
+            leaves: list[bytes] = []
+            for entry in entries:
+                self._group_units.append(entry)
+                self._index_group_unit_entry(entry, len(self._group_units) - 1)
+                leaves.append(self._hash_group_unit_entry(entry))
+
+            self._tree.extend(leaves)
+
+            # Journal once the Pool is consistent, a compaction may snapshot it
+            if self._journal is not None:
+                self._journal.extend(self._group_units[start:])
+
+        if self._on_change is not None and len(leaves) > 0:
+            self._on_change()
 
     def get_group_unit(self, hash_: str, lookup: str = "all") -> GroupUnit:
         """Get a GroupUnit from the Pool
@@ -134,12 +1122,11 @@ class Pool:
 
         assert lookup in ('unit', 'nonce', 'all'), f'Expected lookup to be package_hash or nonce_hash, got {lookup}'
 
-        for item in self.group_units:
-            if item[0] == hash_ and (lookup == 'unit' or lookup == 'all'):
-                return item[2]
-            if item[1] == hash_ and (lookup == 'nonce' or lookup == 'all'):
-                return item[2]
-        raise ValueError(f'GroupUnit with hash_ {hash_} does not exist in the Pool')
+        position: int | None = self._find_position(hash_, lookup)
+        if position is None:
+            raise ValueError(f'GroupUnit with hash_ {hash_} does not exist in the Pool')
+
+        return self._group_units[position][2]
     
     def _get_group_unit_from_nonce(self, nonce: Nonce) -> GroupUnit:
         """Get a GroupUnit from the Pool
@@ -155,7 +1142,7 @@ class Pool:
         """
         assert isinstance(nonce, Nonce), f'Expected nonce to be Nonce, got {type(nonce)}'
 
-        return self.get_group_unit(nonce._hash().root(), lookup='nonce')
+        return self.get_group_unit(nonce._hash_root(), lookup='nonce')
     
     def _get_super_nonce(self, nonce: Nonce) -> Nonce:
         """Get the super Nonce of a Nonce
@@ -168,9 +1155,7 @@ class Pool:
         """
         assert isinstance(nonce, Nonce), f'Expected nonce to be Nonce, got {type(nonce)}'
 
-        print(f'nonce: {nonce}')
         base_values: tuple[BaseValue, ...] = tuple(nonce._chain.items[:-1])
-        # print(f'base_values: {base_values}')
 
         return Nonce(BaseContainer(base_values))
 
@@ -181,7 +1166,7 @@ class Pool:
         Returns:
             iter: An iterator over the Group Units in the Pool
         """
-        return iter(self.group_units.__iter__())
+        return iter(self._group_units)
 
     def __repr__(self):
         """Return the representation of the Pool
@@ -6,6 +6,7 @@ from .credential import Credential
 from .data import Data
 from .owner import Owner
 from .nonce import Nonce
+from ..utils.encoding import ByteReader
 
 
 @define(frozen=True, slots=True, weakref_slot=False)
@@ -37,7 +38,22 @@ class GroupUnit(BaseInterface):
         return json.dumps(self.to_dict())
 
     @classmethod
-    def from_dict(cls, data: dict) -> "GroupUnit":
+    def from_dict(cls, data: dict, trusted: bool = False) -> "GroupUnit":
+        """Creates a GroupUnit from the output of to_dict()
+
+        Args:
+            data (dict): The GroupUnit as returned by to_dict()
+            trusted (bool): Skip the converters and validators of the Nonce and Data, the caller verifies
+                their hashes against a recorded root afterwards. The Owner and Credential are not covered
+                by those hashes and are always validated. Defaults to False.
+        """
+        if trusted:
+            return cls._from_trusted(
+                nonce=Nonce._from_dict(data["nonce"], trusted),
+                owner=Owner._from_dict(data["owner"], trusted),
+                credential=Credential._from_dict(data["credential"], trusted),
+                data=Data._from_dict(data["data"], trusted),
+            )
         return cls(
             nonce=Nonce._from_dict(data.get("nonce")),
             owner=Owner._from_dict(data["owner"]),
@@ -49,6 +65,28 @@ class GroupUnit(BaseInterface):
     def from_json(cls, json_data):
         data = json.loads(json_data)
         return cls.from_dict(data)
+
+    def _write_bytes(self, buffer: bytearray) -> None:
+        self.nonce._write_bytes(buffer)
+        self.owner._write_bytes(buffer)
+        self.credential._write_bytes(buffer)
+        self.data._write_bytes(buffer)
+
+    @classmethod
+    def _read_bytes(cls, reader: ByteReader) -> "GroupUnit":
+        return cls(
+            nonce=Nonce._read_bytes(reader),
+            owner=Owner._read_bytes(reader),
+            credential=Credential._read_bytes(reader),
+            data=Data._read_bytes(reader),
+        )
+
+    def to_bytes(self) -> bytes:
+        return self._to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> "GroupUnit":
+        return cls._from_bytes(data)
     
     def _print(self):
         return (f"Group Unit:\n"
@@ -1,8 +1,8 @@
-from unittest.mock import Base
 from attrs import define, field, validators
 from typing import Optional
 from ..base.interface import BaseInterface
 from ..base.container import BaseContainer
+from ..utils.encoding import ByteReader
 
 
 @define(frozen=True, slots=True, weakref_slot=False)
@@ -25,7 +25,15 @@ class Credential(BaseInterface):
         }
     
     @classmethod
-    def _from_dict(cls, data):
+    def _from_dict(cls, data, trusted: bool = False):
+        # Always validated, the credential is not covered by the hashes a trusted load is checked against
         return cls(
             credential=BaseContainer._from_dict(data["credential"])
-        )
\ No newline at end of file
+        )
+
+    def _write_bytes(self, buffer: bytearray) -> None:
+        self.credential._write_bytes(buffer)
+
+    @classmethod
+    def _read_bytes(cls, reader: ByteReader) -> 'Credential':
+        return cls(credential=BaseContainer._read_bytes(reader))
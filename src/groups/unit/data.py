@@ -8,6 +8,7 @@ from ..base.types import BaseContainerType, BaseValueTypes, BaseValueType
 from ..base.interface import BaseInterface
 from ..base.container import BaseContainer
 from ..base.schema import BaseSchema, SchemaEntry
+from ..utils.encoding import ByteReader
 
 
 def _convert_to_entry(item: BaseContainer | BaseValue | BaseContainerType | BaseValueTypes ) -> BaseContainer:
@@ -140,8 +141,28 @@ class Data(BaseInterface):
         )
     
     @classmethod
-    def _from_dict(cls, data: dict[str, BaseContainer | BaseSchema]) -> 'Data':
+    def _from_dict(cls, data: dict[str, BaseContainer | BaseSchema], trusted: bool = False) -> 'Data':
+        if trusted:
+            return cls._from_trusted(
+                entry=BaseContainer._from_dict(data["entry"], trusted),
+                schema=BaseSchema._from_dict(data["schema"], trusted) if data["schema"] is not None else None
+            )
         return Data._from(
             entry=BaseContainer._from_dict(data["entry"]),
             schema=BaseSchema._from_dict(data["schema"]) if data["schema"] is not None else None
-        )
\ No newline at end of file
+        )
+
+    def _write_bytes(self, buffer: bytearray) -> None:
+        self.entry._write_bytes(buffer)
+        if self.schema is None:
+            buffer.append(0)
+        else:
+            buffer.append(1)
+            self.schema._write_bytes(buffer)
+
+    @classmethod
+    def _read_bytes(cls, reader: ByteReader) -> 'Data':
+        entry: BaseContainer = BaseContainer._read_bytes(reader)
+        schema: Optional[BaseSchema] = BaseSchema._read_bytes(reader) if reader.read_byte() == 1 else None
+
+        return Data._from(entry=entry, schema=schema)
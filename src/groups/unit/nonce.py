@@ -7,9 +7,11 @@ from ..base.value import BaseValue
 from ..base.container import BaseContainer
 from ..base.exceptions import GroupBaseException
 from ..utils.crypto import MerkleTree
+from ..utils.encoding import ByteReader
 
 __DEFAULT_NONCE_SEPERATOR__ = '.'
 __SUPPORTED_NONCE_TYPES__ = (str, int)
+__FIRST_SUB_NONCES__ = {int: 0, str: 'a'}
 
 
 def _validate_nonce_type(instance, attribute, value):
@@ -79,13 +81,10 @@ class Nonce(BaseInterface):
     def _next_sub_nonce_chain(self, type_: type) -> BaseContainer:
         """Determines the next sub nonce chain
         """
-        match str(type_):
-            case "<class 'int'>":
-                return BaseContainer(self._chain.items + (BaseValue(0),))
-            case "<class 'str'>":
-                return BaseContainer(self._chain.items + (BaseValue('a'),))
-            case _:
-                raise NotImplementedError(f"Unsupported type {type_}")
+        if type_ not in __FIRST_SUB_NONCES__:
+            raise NotImplementedError(f"Unsupported type {type_}")
+
+        return BaseContainer(self._chain.items + (BaseValue(__FIRST_SUB_NONCES__[type_]),))
     
     def _next_sub_nonce(self, type_alias: Optional[str] = None) -> 'Nonce':
         """Determines the next sub nonce
@@ -133,7 +132,7 @@ class Nonce(BaseInterface):
     def _hash_nonce_units(self) -> tuple[str, ...]:
         nonce_units: tuple = ()
         for nonce_unit in self:
-            nonce_units = nonce_units + (nonce_unit._hash().root(), )
+            nonce_units = nonce_units + (nonce_unit._hash_root(), )
         return nonce_units
     
     def _hash(self) -> MerkleTree:
@@ -146,8 +145,17 @@ class Nonce(BaseInterface):
         }
     
     @classmethod
-    def _from_dict(cls, _dict: dict) -> 'Nonce':
+    def _from_dict(cls, _dict: dict, trusted: bool = False) -> 'Nonce':
         # parse the nonce chain
-        nonce_chain = BaseContainer._from_dict(_dict['chain'])
-        
-        return cls(nonce_chain)
\ No newline at end of file
+        nonce_chain = BaseContainer._from_dict(_dict['chain'], trusted)
+        if trusted:
+            return cls._from_trusted(_chain=nonce_chain)
+
+        return cls(nonce_chain)
+
+    def _write_bytes(self, buffer: bytearray) -> None:
+        self._chain._write_bytes(buffer)
+
+    @classmethod
+    def _read_bytes(cls, reader: ByteReader) -> 'Nonce':
+        return cls(BaseContainer._read_bytes(reader))
@@ -3,6 +3,7 @@ from typing import Optional
 
 from ..base.interface import BaseInterface
 from ..base.container import BaseContainer
+from ..utils.encoding import ByteReader
 
 
 @define(frozen=True, slots=True, weakref_slot=False)
@@ -24,8 +25,15 @@ class Owner(BaseInterface):
         }
     
     @classmethod
-    def _from_dict(cls, data):
+    def _from_dict(cls, data, trusted: bool = False):
+        # Always validated, the owner is not covered by the hashes a trusted load is checked against
         return cls(
             owner=BaseContainer._from_dict(data["owner"])
         )
 
+    def _write_bytes(self, buffer: bytearray) -> None:
+        self.owner._write_bytes(buffer)
+
+    @classmethod
+    def _read_bytes(cls, reader: ByteReader) -> 'Owner':
+        return cls(owner=BaseContainer._read_bytes(reader))
@@ -1,7 +1,8 @@
 import struct
-from typing import Any, TypeAlias
+from types import NoneType
+from typing import Any, Callable, TypeAlias
 
-from ..base.types import BaseTypes, BaseValueType, BaseContainerTypesTuple, BaseValueTypes
+from ..base.types import BaseType, BaseTypes, BaseValueType, BaseContainerTypesTuple, BaseValueTypes
 
 
 __ALLOW_NONE_VALUE__ = True
@@ -113,62 +114,145 @@ def convert_to_bool(value: Any) -> bool:
         raise TypeError(f"Could not convert {value} to bool")
 
 
-def force_value_type(value: BaseValueType, type_alias: str) -> BaseValueType:
-    assert isinstance(value, BaseValueType), f"Expected a value, but received {type(value)}"
-    assert isinstance(type_alias, str), f"Expected a string, but received {type(type_alias)}"
+def convert_to_dict(container: tuple[Any, ...]) -> dict:
+    """Converts a flat tuple of alternating keys and values to a dict
+
+    Args:
+        container (tuple[Any, ...]): The keys and values, (key, value, key, value, ...)
+    """
+    return dict(zip(container[::2], container[1::2]))
+
+
+# Dispatch tables keyed by the type object, see register_value_converter() and register_container_packer()
+__VALUE_CONVERTERS__: dict[type, Callable[[Any], BaseValueType]] = {
+    NoneType: lambda value: None,
+    bool: convert_to_bool,
+    int: convert_to_int,
+    float: convert_to_float,
+    str: convert_to_str,
+    bytes: convert_to_bytes,
+}
+
+__CONTAINER_PACKERS__: dict[type, Callable[[tuple[Any, ...]], Any]] = {
+    list: list,
+    tuple: tuple,
+    set: set,
+    frozenset: frozenset,
+    dict: convert_to_dict,
+}
+
+
+def _validate_new_type(type_: type) -> None:
+    """Checks that a type registered next to the system types can not be mistaken for one of them
+
+    Raises:
+        GroupBaseTypeException: If the name of the type is a system alias, or a substring of one
+    """
+    if type_ not in BaseTypes.all(format_="tuple"):
+        BaseTypes._validate_new_type(BaseType(aliases=(type_.__name__, ), type_class=type_))
+
+
+def register_value_converter(type_: type, converter: Callable[[Any], BaseValueType]) -> None:
+    """Registers the converter force_value_type() uses to force a value to a type
+
+    The system types are also reached through their BaseTypes aliases, a new type is passed to
+    force_value_type() as the type object itself.
+
+    Args:
+        type_ (type): The type to convert to
+        converter (Callable[[Any], BaseValueType]): Converts a value of another type to type_
+
+    Raises:
+        GroupBaseTypeException: If type_ is a new type named after a system alias, see BaseTypes._validate_new_type()
+
+    Examples:
+        >>> register_value_converter(int, lambda value: int(value, 16) if isinstance(value, str) else convert_to_int(value))
+        >>> register_value_converter(Decimal, lambda value: Decimal(str(value)))
+        >>> force_value_type(1.5, Decimal)
+        Decimal('1.5')
+    """
+    if not isinstance(type_, type):
+        raise TypeError(f"Expected a type, but received {type(type_)}")
+    if not callable(converter):
+        raise TypeError(f"Expected a callable, but received {type(converter)}")
+    _validate_new_type(type_)
+    __VALUE_CONVERTERS__[type_] = converter
+
+
+def register_container_packer(type_: type, packer: Callable[[tuple[Any, ...]], Any]) -> None:
+    """Registers the packer convert_tuple() and BaseContainer use to build a container of a type
+
+    The system types are also reached through their BaseTypes aliases, a new type is passed to
+    convert_tuple() as the type object itself.
+
+    Args:
+        type_ (type): The container type to build
+        packer (Callable[[tuple[Any, ...]], Any]): Builds the container from a flat tuple of values
+
+    Raises:
+        GroupBaseTypeException: If type_ is a new type named after a system alias, see BaseTypes._validate_new_type()
+    """
+    if not isinstance(type_, type):
+        raise TypeError(f"Expected a type, but received {type(type_)}")
+    if not callable(packer):
+        raise TypeError(f"Expected a callable, but received {type(packer)}")
+    _validate_new_type(type_)
+    __CONTAINER_PACKERS__[type_] = packer
+
+
+def force_value_type(value: BaseValueType, type_alias: str | type) -> BaseValueType:
+    """Forces a value to a type
+
+    Args:
+        value (BaseValueType): The value to force
+        type_alias (str | type): A BaseTypes alias, or a type registered with register_value_converter()
+
+    Raises:
+        TypeError: If there is no converter for the type
+    """
+    assert isinstance(value, BaseValueType) or type(value) in __VALUE_CONVERTERS__, \
+        f"Expected a value, but received {type(value)}"
 
     if value is None or type_alias == "None":
         return None
 
-    type_from_alias: TypeAlias | type = BaseTypes._get_type_from_alias(type_alias)
-    assert type_from_alias in BaseValueTypes, f"Expected a value type, but received {type_alias}"
+    if isinstance(type_alias, type) and type_alias in __VALUE_CONVERTERS__:
+        type_from_alias: TypeAlias | type = type_alias
+    else:
+        assert isinstance(type_alias, str), f"Expected a string, but received {type(type_alias)}"
+
+        type_from_alias = BaseTypes._get_type_from_alias(type_alias)
+        assert type_from_alias in BaseValueTypes, f"Expected a value type, but received {type_alias}"
 
     if isinstance(value, type_from_alias):
         return value
 
-    match (str(type_from_alias)):
-        case "<class 'NoneType'>":
-            return None
-        case "<class 'bool'>":
-            return convert_to_bool(value)
-        case "<class 'int'>":
-            return convert_to_int(value)
-        case "<class 'float'>":
-            return convert_to_float(value)
-        case "<class 'str'>":
-            return convert_to_str(value)
-        case "<class 'bytes'>":
-            return convert_to_bytes(value)
-        case _:
-            raise TypeError(f"Could not force value {value} to type {type_alias}")
-
-
-def convert_tuple(container: tuple[Any, ...], type_alias: str):
+    converter: Callable[[Any], BaseValueType] | None = __VALUE_CONVERTERS__.get(type_from_alias)
+    if converter is None:
+        raise TypeError(f"Could not force value {value} to type {type_alias}")
+
+    return converter(value)
+
+
+def convert_tuple(container: tuple[Any, ...], type_alias: str | type):
     """
     Args:
         container tuple(BaseValueType): The container to convert
+        type_alias (str | type): A BaseTypes alias, or a type registered with register_container_packer()
     """
     exc_msg: str = f"Expected a container, but received {type(container)}"
     assert isinstance(container, tuple), exc_msg
+
+    if isinstance(type_alias, type) and type_alias in __CONTAINER_PACKERS__:
+        return __CONTAINER_PACKERS__[type_alias](container)
+
     assert isinstance(type_alias, str), f"Expected a string, but received {type(type_alias)}"
 
     type_from_alias: TypeAlias | type = BaseTypes._get_type_from_alias(type_alias)
     assert type_from_alias in BaseContainerTypesTuple, exc_msg
 
-    match (str(type_from_alias)):
-        case("<class 'list'>"):
-            return [value for value in container]
-        case("<class 'tuple'>"):
-            return tuple([value for value in container])
-        case("<class 'set'>"):
-            return {value for value in container}
-        case("<class 'frozenset'>"):
-            return frozenset({value for value in container})
-        case("<class 'dict'>"):
-            keys: tuple[Any, ...] = container[::2]
-            values: tuple[Any, ...] = container[1::2]
-            return {key: value for key, value in zip(keys, values)}
-        case _:
-            raise TypeError(f"Expected a container, but received {type_alias}")
-
+    packer: Callable[[tuple[Any, ...]], Any] | None = __CONTAINER_PACKERS__.get(type_from_alias)
+    if packer is None:
+        raise TypeError(f"Expected a container, but received {type_alias}")
 
+    return packer(container)
@@ -1,10 +1,22 @@
 import hashlib
+import logging
+from binascii import hexlify
+from bisect import bisect_left
 from attrs import define, field, validators, Factory, converters
 from typing import Any, Iterable, NamedTuple, Tuple, override, Optional
 from .sha256 import SHA256Hash
 # from ..base.types import BaseValueType
 
 
+logger = logging.getLogger(__name__)
+
+DIGEST_SIZE = 32
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+__MERKLE_TREE_BACKENDS__ = ("flat", "levels")
+__DEFAULT_MERKLE_TREE_BACKEND__ = "flat"
+
+
 def _convert_hash(value: str | bytes | SHA256Hash) -> SHA256Hash:
     if isinstance(value, str):
         return SHA256Hash.from_str(value)
@@ -51,7 +63,8 @@ def convert_to_leaves(data: Tuple[str | bytes | SHA256Hash | Leaf, ...]) -> Tupl
         if isinstance(item, Leaf):
             sha256_objects.append(item)
 
-    print(f'{sha256_objects=}')
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('converted leaves: %r', sha256_objects)
     # raise ValueError(f"Expected data to be str or bytes or SHA256Hash, got {type(data)}")
     return tuple(sha256_objects)
 
@@ -86,6 +99,47 @@ class Leaves:
             yield leaf
 
 
+def convert_to_digest_bytes(item: str | bytes | SHA256Hash) -> bytes:
+    """Converts an already hashed item to its raw 32 byte digest without hashing it again
+
+    Notes:
+        Only a str of 64 hex digits is taken as a hex digest, any other str is hashed.
+        bytes carry no such marker, so 32 bytes are always taken as a raw digest and other lengths are hashed.
+        Pass a SHA256Hash to hand over a digest explicitly.
+
+    Args:
+        item (str | bytes | SHA256Hash): A hex digest, a raw 32 byte digest or a SHA256Hash
+
+    Returns:
+        bytes: The raw digest of the item
+    """
+    if isinstance(item, bytes) and len(item) == DIGEST_SIZE:
+        return item
+    if isinstance(item, str) and len(item) == DIGEST_SIZE * 2 and _HEX_DIGITS.issuperset(item):
+        return bytes.fromhex(item)
+    if isinstance(item, SHA256Hash):
+        return item.hash
+    if isinstance(item, str):
+        return hashlib.sha256(item.encode()).digest()
+    if isinstance(item, bytes):
+        return hashlib.sha256(item).digest()
+    raise ValueError(f"Expected data to be str or bytes, got {type(item)}")
+
+
+def convert_to_digest(item: str | bytes | SHA256Hash) -> SHA256Hash:
+    """Converts an already hashed item to a SHA256Hash without hashing it again
+
+    Args:
+        item (str | bytes | SHA256Hash): A hex digest, a raw 32 byte digest or a SHA256Hash
+
+    Returns:
+        SHA256Hash: The digest of the item
+    """
+    if isinstance(item, SHA256Hash):
+        return item
+    return SHA256Hash(convert_to_digest_bytes(item))
+
+
 def convert_loose_leaves_to_levels(data: Tuple[SHA256Hash, ...] | Tuple[str, ...] | Tuple[bytes, ...]) -> Leaves:
     leaf_hashes: list[SHA256Hash] = []
     if isinstance(data, tuple):
@@ -94,13 +148,8 @@ def convert_loose_leaves_to_levels(data: Tuple[SHA256Hash, ...] | Tuple[str, ...
         for item in data:
             if not isinstance(item, (SHA256Hash, str, bytes)):
                 raise ValueError(f"Expected data to be str or bytes, got {type(item)}")
-            if isinstance(item, str):
-                leaf_hashes.append(SHA256Hash.from_str(item))
-            if isinstance(item, bytes):
-                leaf_hashes.append(SHA256Hash.from_bytes(item))
-            if isinstance(item, SHA256Hash):
-                leaf_hashes.append(item)
-            
+            leaf_hashes.append(convert_to_digest(item))
+
         return Leaves(tuple(leaf_hashes))
     
 
@@ -154,56 +203,297 @@ def convert_tuple_to_levels(data: Tuple[SHA256Hash, ...] | Tuple[str, ...] | Tup
         return Levels(tuple(leaf_hashes))
 
 
+class FlatLevels:
+    """The levels of a Merkle Tree, each stored as one contiguous bytearray of 32 byte digests
+
+    Pairs are hashed straight from memoryview slices of the level below.
+    A parent is the hash of the hex digests of its children, the same as MerkleTree._hash_items().
+
+    Args:
+        leaves (bytes): The concatenated 32 byte digests of the leaves
+    """
+    __slots__ = ("levels", )
+
+    def __init__(self, leaves: bytes | bytearray = b"") -> None:
+        if len(leaves) % DIGEST_SIZE != 0:
+            raise ValueError(f"Expected leaves to be a multiple of {DIGEST_SIZE} bytes, got {len(leaves)}")
+
+        self.levels: list[bytearray] = [bytearray(leaves)]
+        self.build()
+
+    def build(self) -> None:
+        self.rehash(0)
+
+    def rehash(self, start: int) -> None:
+        """Rehashes the nodes above the leaves from position start onwards
+
+        Only the nodes on the right of start are hashed again, so appending leaves
+        touches O(log n) nodes per appended leaf.
+
+        Args:
+            start (int): The position of the first leaf that changed
+        """
+        if len(self.levels[0]) == 0:
+            del self.levels[1:]
+            return None
+
+        level: int = 0
+
+        # A single leaf is still hashed (with itself) into a root level
+        while True:
+            # Start from the left node of the pair holding start
+            start -= start % 2
+            hashed_level: bytearray = self.hash_level(memoryview(self.levels[level])[start * DIGEST_SIZE:])
+
+            if level + 1 == len(self.levels):
+                self.levels.append(bytearray())
+
+            start //= 2
+            level += 1
+            self.levels[level][start * DIGEST_SIZE:] = hashed_level
+
+            if len(self.levels[level]) == DIGEST_SIZE:
+                break
+
+        del self.levels[level + 1:]
+
+    def extend(self, leaves: bytes | bytearray) -> None:
+        """Appends the concatenated 32 byte digests of leaves and rehashes the right edge of the tree
+
+        Args:
+            leaves (bytes | bytearray): The concatenated digests to append
+        """
+        if len(leaves) % DIGEST_SIZE != 0:
+            raise ValueError(f"Expected leaves to be a multiple of {DIGEST_SIZE} bytes, got {len(leaves)}")
+
+        if len(leaves) == 0:
+            return None
+
+        start: int = self.size(0)
+        self.levels[0] += leaves
+        self.rehash(start)
+
+    def copy(self) -> 'FlatLevels':
+        flat_levels = FlatLevels()
+        flat_levels.levels = [bytearray(level) for level in self.levels]
+        return flat_levels
+
+    @staticmethod
+    def hash_level(level: bytes | bytearray | memoryview) -> bytearray:
+        """Hashes a level into the level above it
+
+        Args:
+            level (bytes | bytearray | memoryview): The concatenated digests of the level
+
+        Returns:
+            bytearray: The concatenated digests of the level above
+        """
+        view = memoryview(level)
+        pairs_end: int = len(view) - len(view) % (DIGEST_SIZE * 2)
+        hashed_level = bytearray()
+
+        for i in range(0, pairs_end, DIGEST_SIZE * 2):
+            hashed_level += hashlib.sha256(hexlify(view[i:i + DIGEST_SIZE * 2])).digest()
+
+        if pairs_end < len(view):
+            last: bytes = hexlify(view[pairs_end:])
+            hashed_level += hashlib.sha256(last + last).digest()
+
+        return hashed_level
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, FlatLevels):
+            return False
+        return self.levels == other.levels
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def size(self, level: int) -> int:
+        """The number of nodes in a level"""
+        return len(self.levels[level]) // DIGEST_SIZE
+
+    def node(self, level: int, index: int) -> bytes:
+        """The digest of a node in a level"""
+        return bytes(self.levels[level][index * DIGEST_SIZE:(index + 1) * DIGEST_SIZE])
+
+    def find(self, digest: bytes) -> int:
+        """The position of a leaf digest, -1 if it is not a leaf"""
+        leaves: bytearray = self.levels[0]
+        position: int = leaves.find(digest)
+        while position != -1 and position % DIGEST_SIZE != 0:
+            position = leaves.find(digest, position + 1)
+
+        return position if position == -1 else position // DIGEST_SIZE
+
+
 @define(slots=True)
 class MerkleTree:
     """A Merkle Tree object.
+
+    Notes:
+        The levels are built by a backend:
+            "flat" (default): each level is a contiguous bytearray of digests, see FlatLevels.
+            "levels": each node is a Leaf object held in Leaves and Levels objects.
+        Both backends produce the same roots, and trees with the same leaves are equal whatever their backend.
     """
 
-    # leaves: tuple[str, ...] = field(
-    #     default=Factory(Tuple),
-    #     validator=validators.deep_iterable(validators.instance_of(str),
-    #     iterable_validator=validators.instance_of(Tuple)))
+    _leaves: Optional[Leaves] = field(
+        default=None,
+        validator=validators.optional(validators.instance_of(Leaves)),
+        eq=False)
 
-    leaves: Optional[Leaves] = field(
+    _levels: Optional[Levels] = field(
         default=None,
-        # converter=convert_loose_leaves_to_levels,
-        validator=validators.optional(validators.instance_of(Leaves)))
-    
-    _levels: Optional[Levels | Tuple[Leaves, ...]] = field(
+        validator=validators.optional(validators.instance_of(Levels)),
+        eq=False)
+
+    _flat: Optional[FlatLevels] = field(
         default=None,
-        converter=convert_tuple_to_levels,
-        validator=validators.optional(validators.instance_of(Levels | tuple)))
+        validator=validators.optional(validators.instance_of(FlatLevels)),
+        eq=False)
+
+    def __init__(
+        self,
+        hashed_data: Tuple[SHA256Hash, ...] | Tuple[str, ...] | Tuple[bytes, ...] | Leaves = (),
+        use_all_bytes: bool = True,
+        backend: Optional[str] = None
+    ) -> None:
+        if backend is None:
+            backend = __DEFAULT_MERKLE_TREE_BACKEND__
+
+        if backend not in __MERKLE_TREE_BACKENDS__:
+            raise ValueError(f"Expected backend to be one of {__MERKLE_TREE_BACKENDS__}, got {backend}")
+
+        self._leaves = None
+        self._levels = None
+        self._flat = None
+
+        if backend == "flat":
+            if isinstance(hashed_data, Leaves):
+                self._leaves = hashed_data
+                leaves = b"".join(leaf.hash.hash for leaf in hashed_data)
+            else:
+                leaves = b"".join(convert_to_digest_bytes(item) for item in hashed_data)
+            self._flat = FlatLevels(leaves)
 
-    def __init__(self, hashed_data: Tuple[SHA256Hash, ...] | Tuple[str, ...] | Tuple[bytes, ...] | Leaves = (), use_all_bytes: bool = True) -> None:
-        self.leaves = hashed_data if isinstance(hashed_data, Leaves) else convert_loose_leaves_to_levels(hashed_data)
-        
-        if self.leaves is None:
-            self.leaves = Leaves(tuple())
-        _levels = Levels((self.leaves, ))
-        print(f'{_levels=}')
-        # self.levels = _levels
-        self._levels = _levels
-        print(f'{self._levels=}')
-        self.build()
+        else:
+            self._leaves = hashed_data if isinstance(hashed_data, Leaves) else convert_loose_leaves_to_levels(hashed_data)
+            if self._leaves is None:
+                self._leaves = Leaves(tuple())
+            self._levels = Levels((self._leaves, ))
+            self.build()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('built levels: %r', self._flat.levels if self._flat is not None else self._levels)
+
+    @classmethod
+    def _from_flat_leaves(cls, leaves: bytes | bytearray) -> 'MerkleTree':
+        """Creates a MerkleTree from the concatenated 32 byte digests of its leaves
+        """
+        tree = cls()
+        tree._flat = FlatLevels(leaves)
+        return tree
 
-    # def build(self) -> None:
+    @property
+    def leaves(self) -> Leaves:
+        """The leaves of the tree
+
+        The flat backend only materializes the Leaf objects when they are asked for.
+        """
+        if self._leaves is None:
+            self._leaves = Leaves(tuple(SHA256Hash(self._node(0, i)) for i in range(self._level_size(0))))
+        return self._leaves
 
     def build(self) -> None:
-        if self._levels is None:
+        if self._flat is not None:
+            return self._flat.build()
+
+        if self._levels is None or len(self._leaves) == 0:
             return None
 
-        level = self._levels
+        level = self._leaves
 
-        if len(self._levels) == 1:
-            self._levels = self._levels.levels + (self._hash_items(self._levels.levels), )
-        while len(level) > 1:
-            hashed_level = self.hash_level(level)
-            self._levels = self._levels + (hashed_level, )
+        # A single leaf is still hashed (with itself) into a root level
+        while True:
+            level = self.hash_level(level)
+            self._levels.append(level)
+
+            if len(level) == 1:
+                break
+
+    def _level_count(self) -> int:
+        if self._flat is not None:
+            return len(self._flat)
+        return len(self._levels)
 
-            level = (hashed_level, )
+    def _level_size(self, level: int) -> int:
+        if self._flat is not None:
+            return self._flat.size(level)
+        return len(self._levels.levels[level])
+
+    def _node(self, level: int, index: int) -> bytes:
+        if self._flat is not None:
+            return self._flat.node(level, index)
+        return self._levels.levels[level].leaves[index].hash.hash
+
+    def _leaf_digests(self) -> bytes:
+        """The concatenated 32 byte digests of the leaves"""
+        if self._flat is not None:
+            return bytes(self._flat.levels[0])
+        return b"".join(leaf.hash.hash for leaf in self._leaves)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, MerkleTree):
+            return False
+        return self._leaf_digests() == other._leaf_digests()
+
+    def __len__(self) -> int:
+        return self._level_size(0)
 
     def __add__(self, other: 'MerkleTree') -> 'MerkleTree':
-        return MerkleTree(self.leaves + other.leaves)
+        if self._flat is not None:
+            tree = MerkleTree()
+            tree._flat = self._flat.copy()
+            tree.extend(other)
+            return tree
+        return MerkleTree(self.leaves + other.leaves, backend="levels")
+
+    def append(self, leaf: str | bytes | SHA256Hash) -> None:
+        """Appends a hashed leaf to the tree
+
+        The flat backend only rehashes the nodes on the right edge of the tree.
+
+        Args:
+            leaf (str | bytes | SHA256Hash): The hex or raw digest of the leaf
+        """
+        self.extend((leaf, ))
+
+    def extend(self, leaves: Iterable[str | bytes | SHA256Hash] | 'MerkleTree') -> None:
+        """Appends hashed leaves to the tree
+
+        Args:
+            leaves (Iterable[str | bytes | SHA256Hash] | MerkleTree): The hex or raw digests of the leaves,
+                or another tree whose leaves are appended
+        """
+        if isinstance(leaves, MerkleTree):
+            if leaves._flat is not None:
+                digests = bytes(leaves._flat.levels[0])
+            else:
+                digests = b"".join(leaf.hash.hash for leaf in leaves.leaves)
+        else:
+            digests = b"".join(convert_to_digest_bytes(leaf) for leaf in leaves)
+
+        if self._flat is not None:
+            self._leaves = None
+            self._flat.extend(digests)
+            return None
+
+        # The Leaves and Levels objects are immutable, so the levels backend rebuilds
+        self._leaves = self.leaves + Leaves(tuple(
+            SHA256Hash(digests[i:i + DIGEST_SIZE]) for i in range(0, len(digests), DIGEST_SIZE)))
+        self._levels = Levels((self._leaves, ))
+        self.build()
 
     @staticmethod
     def _hash_func(data:  str | bytes | tuple | SHA256Hash) -> bytes:
@@ -218,7 +508,8 @@ class MerkleTree:
         # possible_multiple_data_items = MerkleTree._hash_func_iter(data)
 
         for item in MerkleTree._hash_func_iter(data):
-            print(f'{item=}')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('hashed item: %s', item.hex())
             return item
 
     @staticmethod
@@ -250,46 +541,408 @@ class MerkleTree:
 
     @staticmethod
     def _hash_items(item1: bytes | None = None, item2: bytes | None = None) -> bytes:
-        # assert ((type(item1) is str) or (type(item2) is None)), f"{type(item2)} must be str or None"
+        """Hashes a pair of digests into their parent digest
+
+        The parent is the hash of the concatenated hex digests, so the roots match
+        the hex string roots the Group Units have always been hashed to.
+        """
         if item1 is None:
             raise ValueError(f'item1 cannot be None, but received {type(item1)})')
 
         if item2 is None:
             return MerkleTree._hash_items(item1, item1)
 
-        return MerkleTree._hash_func(item1 + item2)
+        return MerkleTree._hash_func(item1.hex() + item2.hex())
 
     @staticmethod
-    def hash_level(level: tuple[str | bytes, ...]) -> tuple[str, ...]:
-        hashed_level = ()
-        for i in range(0, len(level), 2):
-            if (i + 1) % 2 != 0 and i == len(level) - 1:
-                hashed_level = hashed_level + (MerkleTree._hash_items(level[i]), )
-            elif (i + 1 <= len(level) - 1):
-                hashed_level = hashed_level + (MerkleTree._hash_items(level[i], level[i + 1]), )
+    def hash_level(level: Leaves) -> Leaves:
+        hashed_level: list[SHA256Hash] = []
+        digests: list[bytes] = [leaf.hash.hash for leaf in level]
+        for i in range(0, len(digests), 2):
+            if i == len(digests) - 1:
+                hashed_level.append(SHA256Hash(MerkleTree._hash_items(digests[i])))
             else:
-                raise Exception("This should never happen")
+                hashed_level.append(SHA256Hash(MerkleTree._hash_items(digests[i], digests[i + 1])))
 
-        return hashed_level
+        return Leaves(tuple(hashed_level))
 
     def _find_levels_count(self) -> int:
-        return len(self._levels)
-    
-    @property
+        return self._level_count()
+
     def root(self) -> str | None:
-        if not self._levels or len(self._levels) == 0:
-            return None
-        if self._levels.levels is None or len(self._levels.levels) == 0 or len(self.leaves.leaves) == 0:
+        """The hex digest of the root of the tree
+
+        Returns:
+            str | None: The root of the tree, or None if the tree has no leaves
+        """
+        top: int = self._level_count() - 1
+        if top < 1:
             return None
 
+        return self._node(top, 0).hex()
+
     def verify(self, leaf_hash: str | bytes) -> bool:
-        if leaf_hash not in self.leaves:
+        """Checks if a leaf hash is one of the leaves of the tree
+
+        Args:
+            leaf_hash (str | bytes): The hex or raw digest of the leaf
+
+        Returns:
+            bool: True if the leaf is in the tree, False otherwise
+        """
+        digest: bytes = convert_to_digest_bytes(leaf_hash)
+        if self._flat is not None:
+            return self._flat.find(digest) != -1
+
+        for leaf in self._leaves:
+            if leaf.hash.hash == digest:
+                return True
+        return False
+
+    def _proof_levels(self) -> list[list[bytes]]:
+        """The levels of the tree that proofs are checked against
+
+        Leaves are hashed as sha256(0x00 | leaf) and nodes as sha256(0x01 | left | right), and the
+        last node of an odd level is promoted as it is. A leaf can then never pass for a node, and
+        trees of different leaves, like [a, b, c] and [a, b, c, c], never share a proof root.
+
+        Returns:
+            list[list[bytes]]: The digests of each level, from the hashed leaves up to the proof root
+        """
+        level: list[bytes] = [hashlib.sha256(b"\x00" + self._node(0, i)).digest() for i in range(self._level_size(0))]
+        levels: list[list[bytes]] = [level]
+        while len(level) > 1:
+            level = [
+                hashlib.sha256(b"\x01" + level[i] + level[i + 1]).digest() if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ]
+            levels.append(level)
+
+        return levels
+
+    def proof_root(self) -> str | None:
+        """The hex digest of the root that proof() and verify_proof() work against
+
+        The tree is hashed with leaf and node prefixes for proofs, see _proof_levels(), so the proof root
+        differs from root(), which keeps the layout the content hashes are built from.
+
+        Returns:
+            str | None: The proof root of the tree, or None if the tree has no leaves
+        """
+        if self._level_size(0) == 0:
+            return None
+
+        return self._proof_levels()[-1][0].hex()
+
+    def proof(self, index: int) -> Tuple[Tuple[str, bool], ...]:
+        """Returns the audit path of a leaf, from the leaf up to the proof root
+
+        Args:
+            index (int): The position of the leaf in the leaves
+
+        Returns:
+            Tuple[Tuple[str, bool], ...]: The hex digest of the sibling on each level that has one,
+                paired with True if the sibling is on the right
+
+        Raises:
+            IndexError: If the index is not the position of a leaf
+        """
+        if index < 0 or index >= self._level_size(0):
+            raise IndexError(f'Expected index to be within the {self._level_size(0)} leaves, got {index}')
+
+        audit_path: Tuple[Tuple[str, bool], ...] = ()
+        for level in self._proof_levels()[:-1]:
+            sibling_index: int = index ^ 1
+            # The last node of an odd level is promoted without a sibling
+            if sibling_index < len(level):
+                audit_path += ((level[sibling_index].hex(), sibling_index > index), )
+            index //= 2
+
+        return audit_path
+
+    @staticmethod
+    def _fold_proof(leaf_hash: str | bytes | SHA256Hash, proof: Tuple[Tuple[str, bool], ...]) -> bytes:
+        """Hashes a leaf up its audit path
+
+        Returns:
+            bytes: The digest of the proof root the audit path leads to
+        """
+        node: bytes = hashlib.sha256(b"\x00" + convert_to_digest(leaf_hash).hash).digest()
+        for sibling, sibling_is_right in proof:
+            sibling_digest: bytes = convert_to_digest(sibling).hash
+            if sibling_is_right:
+                node = hashlib.sha256(b"\x01" + node + sibling_digest).digest()
+            else:
+                node = hashlib.sha256(b"\x01" + sibling_digest + node).digest()
+
+        return node
+
+    @staticmethod
+    def verify_proof(leaf_hash: str | bytes | SHA256Hash, proof: Tuple[Tuple[str, bool], ...], root: str) -> bool:
+        """Verifies a leaf against a proof root with the audit path returned by proof()
+
+        Args:
+            leaf_hash (str | bytes | SHA256Hash): The hex or raw digest of the leaf
+            proof (Tuple[Tuple[str, bool], ...]): The audit path of the leaf
+            root (str): The hex digest of the proof root, see proof_root()
+
+        Returns:
+            bool: True if the leaf hashes up to the root, False otherwise
+        """
+        if root is None:
             return False
-        else:
+
+        return MerkleTree._fold_proof(leaf_hash, proof).hex() == root
+
+    def __str__(self) -> str:
+        return f"{self.root()}"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(root={self.root()})"
+
+
+class _TrieNode:
+    """A node of a MerkleTrie whose leaves fall on both sides of the bit at depth
+
+    Args:
+        depth (int): The number of leading bits the leaves of the node have in common
+        key (int): The digest of one of the leaves, as an int, its first depth bits are the prefix of the node
+        left (_TrieNode | bytes): The leaves whose bit at depth is clear, a single leaf is its digest
+        right (_TrieNode | bytes): The leaves whose bit at depth is set
+    """
+    __slots__ = ("depth", "key", "left", "right", "digest")
+
+    def __init__(self, depth: int, key: int, left: '_TrieNode | bytes', right: '_TrieNode | bytes') -> None:
+        self.depth: int = depth
+        self.key: int = key
+        self.left: _TrieNode | bytes = left
+        self.right: _TrieNode | bytes = right
+        self.digest: bytes | None = None
+
+
+class MerkleTrie:
+    """A Merkle Tree over a set of 32 byte digests, shaped by the bits of the digests instead of their order
+
+    Notes:
+        Each node splits its leaves on the next bit of their digests, so the root only depends on
+        which leaves are held, not on the order they were added in.
+        A node holding a single leaf is that leaf, and a node whose leaves all fall on one side is that side,
+        so only the nodes with leaves on both sides are stored, and hashed as sha256(0x01 | left | right).
+        Their digests are cached, adding a leaf links in one node and drops the digests of the O(log n) nodes above it.
+        Adding a leaf that is already held is a no-op.
+
+    Args:
+        leaves (Iterable[bytes]): The 32 byte digests of the leaves
+    """
+    __slots__ = ("_root", "_order", "_added")
+
+    def __init__(self, leaves: Iterable[bytes] = ()) -> None:
+        self._root: _TrieNode | bytes | None = None
+        self._order: dict[bytes, int] = {}
+        self._added: int = 0
+        self.extend(leaves)
+
+    @staticmethod
+    def _common_bits(a: int, b: int) -> int:
+        """The number of leading bits two digests have in common"""
+        return DIGEST_SIZE * 8 - (a ^ b).bit_length()
+
+    @staticmethod
+    def _bit(key: int, depth: int) -> int:
+        """The bit of a digest at depth, counted from the most significant bit"""
+        return (key >> (DIGEST_SIZE * 8 - 1 - depth)) & 1
+
+    @staticmethod
+    def _boundary(depth: int, prefix: int) -> bytes:
+        """The smallest digest under a prefix whose bit at depth is set"""
+        return (((prefix << 1) | 1) << (DIGEST_SIZE * 8 - 1 - depth)).to_bytes(DIGEST_SIZE, "big")
+
+    @staticmethod
+    def _key(node: '_TrieNode | bytes') -> int:
+        """The digest of a leaf of a node, as an int"""
+        return node.key if isinstance(node, _TrieNode) else int.from_bytes(node, "big")
+
+    def _register(self, leaf: bytes) -> bool:
+        if len(leaf) != DIGEST_SIZE:
+            raise ValueError(f"Expected a {DIGEST_SIZE} byte digest, got {len(leaf)} bytes")
+
+        self._added += 1
+        if leaf in self._order:
+            return False
+        self._order[leaf] = self._added - 1
+        return True
+
+    def add(self, leaf: bytes) -> bool:
+        """Adds a leaf and drops the cached digests of the nodes above it
+
+        Args:
+            leaf (bytes): The 32 byte digest of the leaf
+
+        Returns:
+            bool: True if the leaf was added, False if it was already held
+        """
+        if not self._register(leaf):
+            return False
+
+        if self._root is None:
+            self._root = leaf
             return True
 
+        key: int = int.from_bytes(leaf, "big")
+        top: int = DIGEST_SIZE * 8 - 1
+
+        # Follow the bits of the leaf down to the closest held leaf, it shares the most leading bits with it
+        node: _TrieNode | bytes = self._root
+        while isinstance(node, _TrieNode):
+            node = node.right if (key >> (top - node.depth)) & 1 else node.left
+        depth: int = self._common_bits(key, int.from_bytes(node, "big"))
+
+        # The new node goes above the first node that splits deeper than the leaf does
+        parent: _TrieNode | None = None
+        node = self._root
+        while isinstance(node, _TrieNode) and node.depth < depth:
+            node.digest = None
+            parent = node
+            node = node.right if (key >> (top - node.depth)) & 1 else node.left
+
+        if (key >> (top - depth)) & 1:
+            branch = _TrieNode(depth, key, node, leaf)
+        else:
+            branch = _TrieNode(depth, key, leaf, node)
+
+        if parent is None:
+            self._root = branch
+        elif (key >> (top - parent.depth)) & 1:
+            parent.right = branch
+        else:
+            parent.left = branch
+
+        return True
+
+    def extend(self, leaves: Iterable[bytes]) -> None:
+        """Adds leaves, building the trie from the sorted leaves once when there are many of them
+
+        Args:
+            leaves (Iterable[bytes]): The 32 byte digests of the leaves
+        """
+        leaves = list(leaves)
+        if len(leaves) * 16 < len(self._order):
+            for leaf in leaves:
+                self.add(leaf)
+            return None
+
+        for leaf in leaves:
+            self._register(leaf)
+
+        self._root = self._build(sorted(self._order), 0, len(self._order))
+
+    @classmethod
+    def _build(cls, leaves: list[bytes], start: int, end: int) -> '_TrieNode | bytes | None':
+        """Builds the node holding the sorted leaves from start to end"""
+        if end - start == 0:
+            return None
+        if end - start == 1:
+            return leaves[start]
+
+        first: int = int.from_bytes(leaves[start], "big")
+        depth: int = cls._common_bits(first, int.from_bytes(leaves[end - 1], "big"))
+        split: int = bisect_left(leaves, cls._boundary(depth, first >> (DIGEST_SIZE * 8 - depth)), start, end)
+
+        return _TrieNode(depth, first, cls._build(leaves, start, split), cls._build(leaves, split, end))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, leaf: bytes) -> bool:
+        return leaf in self._order
+
+    def index(self, leaf: bytes) -> int:
+        """The number of leaves added before a leaf was first added, duplicates included
+
+        Raises:
+            KeyError: If the leaf is not held
+        """
+        return self._order[leaf]
+
+    @classmethod
+    def _digest(cls, node: '_TrieNode | bytes') -> bytes:
+        """The digest of a node, hashing the nodes below it whose digest was dropped"""
+        if not isinstance(node, _TrieNode):
+            return node
+
+        if node.digest is None:
+            node.digest = hashlib.sha256(b"\x01" + cls._digest(node.left) + cls._digest(node.right)).digest()
+
+        return node.digest
+
+    @staticmethod
+    def _iter_leaves(node: '_TrieNode | bytes | None') -> Iterable[bytes]:
+        """The leaves of a node, in sorted order"""
+        nodes: list[_TrieNode | bytes | None] = [node]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if isinstance(node, _TrieNode):
+                nodes.append(node.right)
+                nodes.append(node.left)
+            elif node is not None:
+                yield node
+
+    def root(self) -> str | None:
+        """The hex digest of the root of the trie
+
+        Returns:
+            str | None: The root of the trie, or None if the trie has no leaves
+        """
+        return None if self._root is None else self._digest(self._root).hex()
+
+    def missing(self, other: 'MerkleTrie') -> list[bytes]:
+        """Finds the leaves of another trie that this trie does not hold
+
+        Both tries are walked from the root, skipping every node they have in common,
+        so k differences take O(k log n) node comparisons.
+
+        Args:
+            other (MerkleTrie): The trie to compare against
+
+        Returns:
+            list[bytes]: The missing leaves, in the sorted order of the other trie
+        """
+        missing: list[bytes] = []
+        nodes: list[tuple[_TrieNode | bytes | None, _TrieNode | bytes | None]] = [(self._root, other._root)]
+        while len(nodes) > 0:
+            node, other_node = nodes.pop()
+            if other_node is None:
+                continue
+
+            if not isinstance(node, _TrieNode) or not isinstance(other_node, _TrieNode):
+                missing.extend(leaf for leaf in self._iter_leaves(other_node) if leaf not in self._order)
+                continue
+
+            if self._digest(node) == other._digest(other_node):
+                continue
+
+            depth: int = min(node.depth, other_node.depth)
+            if self._common_bits(node.key, other_node.key) < depth:
+                # The leaves sit under different prefixes, none of the other leaves are held
+                missing.extend(self._iter_leaves(other_node))
+            elif node.depth == other_node.depth:
+                nodes.append((node.right, other_node.right))
+                nodes.append((node.left, other_node.left))
+            elif node.depth < other_node.depth:
+                # The other leaves all sit on one side of the node
+                nodes.append((node.right if self._bit(other_node.key, depth) else node.left, other_node))
+            elif self._bit(node.key, depth):
+                # The leaves all sit on one side of the other node, its other side is missing
+                nodes.append((node, other_node.right))
+                nodes.append((None, other_node.left))
+            else:
+                nodes.append((None, other_node.right))
+                nodes.append((node, other_node.left))
+
+        return missing
+
     def __str__(self) -> str:
-        return f"{self.root}"
+        return f"{self.root()}"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(root={self.root})"
+        return f"{self.__class__.__name__}(root={self.root()})"
@@ -0,0 +1,196 @@
+"""Primitives of the compact binary encoding of the base classes
+
+The encoding is written into a bytearray and read back with a ByteReader:
+    1. Lengths and counts are unsigned LEB128 varints.
+    2. Values start with a one byte tag, followed by their payload:
+        NONE, FALSE, TRUE: no payload
+        INT: a zigzag varint
+        FLOAT: 8 bytes, big-endian IEEE 754
+        STR: a varint length and the utf-8 bytes
+        BYTES: a varint length and the bytes
+    3. Container type names are interned, a single byte indexes CONTAINER_TYPE_NAMES.
+    4. Hashes that are 64 character hex digests are stored as their 32 raw bytes.
+"""
+import struct
+from typing import Any
+
+
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_BYTES = 6
+
+CONTAINER_TYPE_NAMES: tuple[str, ...] = ("tuple", "list", "set", "frozenset", "dict")
+CONTAINER_TYPE_INDEX: dict[str, int] = {name: index for index, name in enumerate(CONTAINER_TYPE_NAMES)}
+
+_FLOAT = struct.Struct(">d")
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def write_varint(buffer: bytearray, number: int) -> None:
+    """Writes an unsigned int as a LEB128 varint
+
+    Raises:
+        ValueError: If the number is negative
+    """
+    if number < 0:
+        raise ValueError(f"Expected an unsigned int, got {number}")
+
+    while number > 0x7f:
+        buffer.append((number & 0x7f) | 0x80)
+        number >>= 7
+    buffer.append(number)
+
+
+def write_str(buffer: bytearray, text: str) -> None:
+    encoded: bytes = text.encode()
+    write_varint(buffer, len(encoded))
+    buffer += encoded
+
+
+def write_bytes(buffer: bytearray, data: bytes) -> None:
+    write_varint(buffer, len(data))
+    buffer += data
+
+
+def write_value(buffer: bytearray, value: Any) -> None:
+    """Writes a tagged base value
+
+    Raises:
+        TypeError: If the value is not a base value type
+    """
+    if value is None:
+        buffer.append(TAG_NONE)
+    elif value is True:
+        buffer.append(TAG_TRUE)
+    elif value is False:
+        buffer.append(TAG_FALSE)
+    elif isinstance(value, int):
+        buffer.append(TAG_INT)
+        write_varint(buffer, (value << 1) if value >= 0 else ((-value << 1) - 1))
+    elif isinstance(value, float):
+        buffer.append(TAG_FLOAT)
+        buffer += _FLOAT.pack(value)
+    elif isinstance(value, str):
+        buffer.append(TAG_STR)
+        write_str(buffer, value)
+    elif isinstance(value, bytes):
+        buffer.append(TAG_BYTES)
+        write_bytes(buffer, value)
+    else:
+        raise TypeError(f"Expected a base value type, got {type(value)}")
+
+
+def write_container_type(buffer: bytearray, type_name: str) -> None:
+    """Writes an interned container type name
+
+    Raises:
+        ValueError: If the type name is not a container type
+    """
+    if type_name not in CONTAINER_TYPE_INDEX:
+        raise ValueError(f"Expected one of {CONTAINER_TYPE_NAMES}, got {type_name}")
+    buffer.append(CONTAINER_TYPE_INDEX[type_name])
+
+
+def write_hash(buffer: bytearray, hash_: str) -> None:
+    """Writes a hash, 64 character hex digests take 33 bytes
+    """
+    if len(hash_) == 64 and _HEX_DIGITS.issuperset(hash_):
+        buffer.append(0)
+        buffer += bytes.fromhex(hash_)
+    else:
+        buffer.append(1)
+        write_str(buffer, hash_)
+
+
+class ByteReader:
+    """Reads the binary encoding back from a bytes-like object
+
+    Args:
+        data (bytes | bytearray | memoryview): The encoded data
+        offset (int): The position to start reading from. Defaults to 0.
+
+    Raises:
+        ValueError: If the data ends before a read is complete
+    """
+    __slots__ = ("data", "offset")
+
+    def __init__(self, data: bytes | bytearray | memoryview, offset: int = 0) -> None:
+        self.data = memoryview(data)
+        self.offset = offset
+
+    def at_end(self) -> bool:
+        return self.offset >= len(self.data)
+
+    def read(self, size: int) -> memoryview:
+        end: int = self.offset + size
+        if end > len(self.data):
+            raise ValueError(f"Expected {size} more bytes at offset {self.offset}, the data ends at {len(self.data)}")
+
+        chunk: memoryview = self.data[self.offset:end]
+        self.offset = end
+        return chunk
+
+    def read_byte(self) -> int:
+        if self.offset >= len(self.data):
+            raise ValueError(f"Expected a byte at offset {self.offset}, the data ends at {len(self.data)}")
+
+        byte: int = self.data[self.offset]
+        self.offset += 1
+        return byte
+
+    def read_varint(self) -> int:
+        number: int = 0
+        shift: int = 0
+        while True:
+            byte: int = self.read_byte()
+            number |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return number
+            shift += 7
+
+    def read_str(self) -> str:
+        return str(self.read(self.read_varint()), "utf-8")
+
+    def read_bytes(self) -> bytes:
+        return bytes(self.read(self.read_varint()))
+
+    def read_value(self) -> Any:
+        """Reads a tagged base value
+
+        Raises:
+            ValueError: If the tag is not a value tag
+        """
+        tag: int = self.read_byte()
+        match tag:
+            case 0:
+                return None
+            case 1:
+                return False
+            case 2:
+                return True
+            case 3:
+                number: int = self.read_varint()
+                return (number >> 1) if number & 1 == 0 else -((number + 1) >> 1)
+            case 4:
+                return _FLOAT.unpack(self.read(8))[0]
+            case 5:
+                return self.read_str()
+            case 6:
+                return self.read_bytes()
+            case _:
+                raise ValueError(f"Unknown value tag {tag} at offset {self.offset - 1}")
+
+    def read_container_type(self) -> str:
+        index: int = self.read_byte()
+        if index >= len(CONTAINER_TYPE_NAMES):
+            raise ValueError(f"Unknown container type {index} at offset {self.offset - 1}")
+        return CONTAINER_TYPE_NAMES[index]
+
+    def read_hash(self) -> str:
+        if self.read_byte() == 0:
+            return self.read(32).hex()
+        return self.read_str()
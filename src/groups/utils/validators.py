@@ -2,16 +2,17 @@ from types import NoneType
 from typing import Any
 from ..base.types import BaseValueType, LinearContainer, NamedContainer, BaseContainerType
 from ..base.exceptions import GroupBaseValueException
+from .converters import __VALUE_CONVERTERS__
 
 
 def _is_base_value_type(item: Any) -> bool:
     """
-    Checks if item is a base value
+    Checks if item is a base value, or a value of a type registered with register_value_converter()
 
     Args:
         item (BaseValueTypes): The item to check
     """
-    return isinstance(item, BaseValueType)
+    return isinstance(item, BaseValueType) or type(item) in __VALUE_CONVERTERS__
 
 
 def validate_base_value_type(instance, attribute, value) -> None:
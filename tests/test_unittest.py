@@ -8,6 +8,7 @@ from tests_utils_merkle_tree import TestLeaf
 from tests_utils_merkle_tree import TestLeaves
 from tests_utils_merkle_tree import TestLevel
 from tests_utils_merkle_tree import TestMerkleTree
+from tests_utils_merkle_tree import TestMerkleTrie
 from tests_utils_ipfs import TestIPFS
 from tests_utils_ipfs_cid import TestIPFSCID
 from tests_base_interface import TestBaseInterface
@@ -21,8 +22,10 @@ from tests_unit_data import TestData
 from tests_unit_owner import TestOwner
 from tests_group_unit import TestGroupUnit
 from tests_pool import TestPool
+from tests_journal import TestJournal
 from tests_controller import TestController
 from tests_groups import TestGroups
+from tests_persistence import TestPersistenceWorker
 
 
 def main():
@@ -38,6 +41,7 @@ def main():
     test_suite.addTest(loader.loadTestsFromTestCase(TestLeaves))
     test_suite.addTest(loader.loadTestsFromTestCase(TestLevel))
     test_suite.addTest(loader.loadTestsFromTestCase(TestMerkleTree))
+    test_suite.addTest(loader.loadTestsFromTestCase(TestMerkleTrie))
     test_suite.addTest(loader.loadTestsFromTestCase(TestIPFS))
     test_suite.addTest(loader.loadTestsFromTestCase(TestIPFSCID))
 
@@ -58,9 +62,15 @@ def main():
     # # Pool tests
     test_suite.addTest(loader.loadTestsFromTestCase(TestPool))
 
+    # # Journal tests
+    test_suite.addTest(loader.loadTestsFromTestCase(TestJournal))
+
     # # Controller tests
     test_suite.addTest(loader.loadTestsFromTestCase(TestController))
 
+    # # Persistence tests
+    test_suite.addTest(loader.loadTestsFromTestCase(TestPersistenceWorker))
+
     # # Groups tests
     # test_suite.addTest(loader.loadTestsFromTestCase(TestGroups))
 
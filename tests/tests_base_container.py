@@ -79,6 +79,17 @@ class TestBaseContainer(unittest.TestCase):
         container = BaseContainer((1, 2, 3), "tuple")
         hash_repre_item_one = container.items[0]
         self.assertTrue(container._verify_item(item=hash_repre_item_one))
+        self.assertFalse(container._verify_item(item=BaseValue(4)))
+        proof = container._item_proof(0)
+        self.assertTrue(BaseContainer._verify_item_proof(hash_repre_item_one, proof, container._items_proof_root()))
+
+    def test_hash_item_proof(self):
+        container = BaseContainer((1, 2, 3), "tuple")
+        items_root = container._hash_items().proof_root()
+        for index, item in enumerate(container.items):
+            proof = container._item_proof(index)
+            self.assertTrue(BaseContainer._verify_item_proof(item, proof, items_root))
+            self.assertFalse(BaseContainer._verify_item_proof(BaseValue(4), proof, items_root))
 
     def test_hash_pack_unpack2(self):
         container = BaseContainer((1, 2, 3), "tuple")
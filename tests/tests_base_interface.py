@@ -1,9 +1,13 @@
 import unittest
 import sys
-from attrs import define
+from attrs import define, fields
 
 sys.path.append("../forme-groups-python-3-12/")
 from src.groups.base.interface import BaseInterface
+from src.groups.base.value import BaseValue
+from src.groups.base.container import BaseContainer
+from src.groups.base.schema import BaseSchema, SchemaEntry
+from src.groups.unit import GroupUnit, Nonce, Owner, Credential, Data
 
 
 class TestBaseInterface(unittest.TestCase):
@@ -107,3 +111,42 @@ class TestBaseInterface(unittest.TestCase):
         self.assertEqual(self.base_interface2._hash_private_slots().root(), '32ee78186a3407f4f288673b1a7dca6154c294f435f444ee3ba054356a88a1e8')
         self.assertEqual(self.base_interface2._hash_package().root(), 'a4ad9b7196e928dd5b02374a2ddea89260fafe65cc84378451c06fd96b02c4fc')
 
+
+
+    def test_base_interface_slot_proof(self):
+        package_root = self.base_interface2._proof_root()
+        for slot in self.base_interface2.__slots__:
+            proof = self.base_interface2._slot_proof(slot)
+            self.assertTrue(self.base_interface2._verify_slot_proof(slot, proof, package_root))
+            self.assertTrue(self.base_interface2._verify_item_in_hash_package(slot))
+            self.assertFalse(self.base_interface2._verify_slot_proof(slot, proof, self.base_interface._proof_package().proof_root()))
+            self.assertFalse(self.base_interface2._verify_slot_proof(slot, proof, self.base_interface2._hash_package().root()))
+
+    def test_base_interface_bytes_not_implemented(self):
+        self.assertRaises(NotImplementedError, self.base_interface._write_bytes, bytearray())
+        self.assertRaises(NotImplementedError, type(self.base_interface)._read_bytes, None)
+
+    def test_group_unit_classes_have_bytes(self):
+        def classes(item):
+            if isinstance(item, BaseInterface):
+                yield type(item)
+                for attribute in fields(type(item)):
+                    yield from classes(getattr(item, attribute.name))
+            elif isinstance(item, (tuple, list)):
+                for child in item:
+                    yield from classes(child)
+
+        schema = BaseSchema((SchemaEntry("name", "string"), SchemaEntry("age", "integer")))
+        group_unit = GroupUnit(
+            Nonce(BaseContainer((1, 0), "tuple")),
+            Owner(),
+            Credential(),
+            Data(BaseContainer((BaseValue("test_user"), BaseValue(31)), "tuple"), schema))
+
+        found = set(classes(group_unit))
+        self.assertTrue({GroupUnit, Nonce, Owner, Credential, Data, BaseContainer, BaseValue, BaseSchema, SchemaEntry} <= found)
+        for cls in found:
+            self.assertIsNot(cls._write_bytes, BaseInterface._write_bytes, cls.__name__)
+            self.assertIsNot(cls._read_bytes.__func__, BaseInterface._read_bytes.__func__, cls.__name__)
+
+        self.assertEqual(GroupUnit.from_bytes(group_unit.to_bytes()), group_unit)
@@ -2,7 +2,7 @@ import unittest
 import sys
 
 sys.path.append("../forme-groups-python-3-12/")
-from src.groups.base.types import BaseTypes
+from src.groups.base.types import BaseTypes, BaseType, _BaseTypes
 from src.groups.base.exceptions import GroupBaseTypeException
 
 class TestBaseTypes(unittest.TestCase):
@@ -12,16 +12,45 @@ class TestBaseTypes(unittest.TestCase):
     def test_system_type_pool_get_type_from_alias_raises(self):
         self.assertRaises(GroupBaseTypeException, self.system_pool._get_type_from_alias, "I")
 
+    def test_system_type_pool_alias_table(self):
+        for alias in self.system_pool.aliases:
+            self.assertEqual(self.system_pool._get_type_from_alias(alias), self.system_pool._get_type("aliases", alias).type_class)
+
+        self.assertEqual(self.system_pool._get_type_from_alias("set"), set)
+        self.assertEqual(self.system_pool._get_name_from_type(int), "Integer")
+        self.assertEqual(self.system_pool._get_name_from_type(frozenset), "FrozenSet")
+        self.assertRaises(GroupBaseTypeException, self.system_pool._get_name_from_type, complex)
+
     
     def test_system_type_pool_validate_types(self):
 
         self.assertTrue(self.system_pool._validate_types())
 
+    def test_system_type_pool_validate_types_rejects_duplicates(self):
+        duplicate_alias = _BaseTypes(Bytes=BaseType(aliases=("Bytes", "int"), type_class=bytes))
+        self.assertRaises(GroupBaseTypeException, duplicate_alias._validate_types)
+
+        duplicate_type = _BaseTypes(Bytes=BaseType(aliases=("Bytes", ), type_class=str))
+        self.assertRaises(GroupBaseTypeException, duplicate_type._validate_types)
+
+    def test_system_type_pool_validate_new_type(self):
+        self.assertTrue(self.system_pool._validate_new_type(BaseType(aliases=("Complex", "complex"), type_class=complex)))
+        self.assertRaises(GroupBaseTypeException, self.system_pool._validate_new_type, BaseType(aliases=("Complex", "int"), type_class=complex))
+        self.assertRaises(GroupBaseTypeException, self.system_pool._validate_new_type, BaseType(aliases=("Text", ), type_class=str))
+        self.assertRaises(GroupBaseTypeException, self.system_pool._validate_new_type, BaseType(aliases=("Integ", ), type_class=complex))
+        self.assertRaises(GroupBaseTypeException, self.system_pool._get_type, "aliases", "Integ")
+
     def test_system_type_pool_all(self):
 
         self.assertEqual(self.system_pool.all(), int | float | bool | str | bytes | dict | list | tuple | set | frozenset | None)
         self.assertEqual(self.system_pool.all(type_="value"), int | float | bool | str | bytes | None)
 
+    def test_system_type_pool_all_is_cached(self):
+        self.assertIs(self.system_pool.all("linear", "tuple"), self.system_pool.all("linear", "tuple"))
+        self.assertIs(self.system_pool.value_types, self.system_pool.all("value"))
+        self.assertIs(self.system_pool.aliases, self.system_pool.aliases)
+        self.assertEqual(self.system_pool.all("linear", "tuple"), (list, tuple, set, frozenset))
+
     def test_system_type_pool_hash_public(self):
 
         self.assertEqual(self.system_pool._hash_public_slots().root(), "23d98887145a93576a9ab6dd0403311dcf6560b059bb35d9fe033ed2b22136c0")
@@ -6,6 +6,7 @@ import uuid
 sys.path.append("../forme-groups-python-3-12/")
 from src.groups.utils.crypto import MerkleTree
 from src.groups.base.value import BaseValue
+from src.groups.base.interface import set_hash_root_cache
 from src.groups.base.exceptions import GroupBaseValueException
 
 __RANGE__ = 10000
@@ -321,6 +322,13 @@ class TestBaseValue(unittest.TestCase):
             value = BaseValue(random_value)
             self.assertEqual(value._hash_repr(), value._hash_repr())
 
+    @staticmethod
+    def _levels(tree: MerkleTree) -> tuple[tuple[str, ...], ...]:
+        # Read the levels through the accessors of the tree, they work for both backends
+        return tuple(
+            tuple(tree._node(level, index).hex() for index in range(tree._level_size(level)))
+            for level in range(tree._level_count()))
+
     def test_hash_tree(self):
         value = BaseValue(1)
 
@@ -328,12 +336,12 @@ class TestBaseValue(unittest.TestCase):
         self.assertEqual(value._hash_tree().root(), '3eff7c5314a5ed2d5d8fdad16bbc4851cd98b9861c950854246318c5576a37fd')
         
         # The levels of the tree are the hashes of the slots, public followed by private
-        self.assertEqual(value._hash_tree()._levels, (('6b86b273ff34fce19d6b804eff5a3f5747ada4eaa22f1d49c01e52ddb7875b4b', ),  ('3eff7c5314a5ed2d5d8fdad16bbc4851cd98b9861c950854246318c5576a37fd', )))
+        self.assertEqual(self._levels(value._hash_tree()), (('6b86b273ff34fce19d6b804eff5a3f5747ada4eaa22f1d49c01e52ddb7875b4b', ),  ('3eff7c5314a5ed2d5d8fdad16bbc4851cd98b9861c950854246318c5576a37fd', )))
         
         # the re
-        self.assertEqual(value._hash_repr(), '5176a0db25fa8911b84f16b90d6c02d56d0c983122bc26fd137713aa0ede123f')
+        self.assertEqual(value._hash_repr().hex(), '5176a0db25fa8911b84f16b90d6c02d56d0c983122bc26fd137713aa0ede123f')
         self.assertEqual(value._hash_package().root(), "e3b86cc738e1a9efa32e5f4761f3382236f7200abc8811f671a33074c93f9ec2")
-        self.assertEqual(value._hash_package()._levels, (('3eff7c5314a5ed2d5d8fdad16bbc4851cd98b9861c950854246318c5576a37fd',), ('e3b86cc738e1a9efa32e5f4761f3382236f7200abc8811f671a33074c93f9ec2', ),))
+        self.assertEqual(self._levels(value._hash_package()), (('3eff7c5314a5ed2d5d8fdad16bbc4851cd98b9861c950854246318c5576a37fd',), ('e3b86cc738e1a9efa32e5f4761f3382236f7200abc8811f671a33074c93f9ec2', ),))
         # print(value._hash_package().leaves)
 
     def test_hash_public_init_n_base_values(self):
@@ -429,4 +437,30 @@ class TestBaseValue(unittest.TestCase):
         value_dict: dict = {"value": b'0x0000', "type": "int"}
         base_value = BaseValue._from_dict(value_dict)
         print(base_value)
-        
\ No newline at end of file
+        
+
+    def test_hash_root_is_cached(self):
+        value = BaseValue(1)
+        self.assertIsNone(value._hash_root_cache)
+        self.assertEqual(value._hash_root(), value._hash().root())
+        self.assertEqual(value._hash_root_cache, value._hash().root())
+        self.assertEqual(value.__slots__, ('_value', ))
+        self.assertEqual(value, BaseValue(1))
+        self.assertEqual(repr(value), "BaseValue(value=1, type=int)")
+
+    def test_hash_root_cache_disabled(self):
+        set_hash_root_cache(False)
+        try:
+            value = BaseValue(1)
+            self.assertEqual(value._hash_root(), value._hash().root())
+            self.assertIsNone(value._hash_root_cache)
+        finally:
+            set_hash_root_cache(True)
+
+    def test_base_value_to_bytes_from_bytes(self):
+        for value in (0, 1, -1, 2 ** 64, -2 ** 64, 1.5, -0.0, True, False, "test", "ünïcode", b"", b"\x00\xff"):
+            base_value = BaseValue(value)
+            self.assertEqual(BaseValue._from_bytes(base_value._to_bytes()), base_value)
+            self.assertEqual(type(BaseValue._from_bytes(base_value._to_bytes()).value), type(value))
+        self.assertRaises(ValueError, BaseValue._from_bytes, b"\x7f")
+
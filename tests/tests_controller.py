@@ -9,6 +9,7 @@ from src.groups.base.schema import BaseSchema, SchemaEntry
 from src.groups.unit.nonce import Nonce
 from src.groups.unit.data import Data
 from src.groups.controller import Controller
+from src.groups.pool import Pool
 
 
 class TestController(unittest.TestCase):
@@ -35,4 +36,61 @@ class TestController(unittest.TestCase):
 
     def test_controller_add_data_nonce(self):
         self.assertEqual(self.controller.active.nonce._hash().root(), '3eff7c5314a5ed2d5d8fdad16bbc4851cd98b9861c950854246318c5576a37fd')
-        self.assertEqual(self.controller.active.nonce, self.defualt_nonce)
\ No newline at end of file
+        self.assertEqual(self.controller.active.nonce, self.defualt_nonce)
+
+    def test_controller_create_group_units(self):
+        datas = [Data(BaseContainer((BaseValue(f"user_{i}"), BaseValue(i)), "tuple")) for i in range(3)]
+        group_units = self.controller.create_group_units(datas)
+
+        self.assertEqual([str(group_unit.nonce) for group_unit in group_units], ['2', '3', '4'])
+        self.assertEqual(self.controller.active, group_units[-1])
+        self.assertEqual(tuple(item[2] for item in self.controller.pool.group_units[-3:]), group_units)
+
+    def test_controller_create_group_units_with_schema(self):
+        self.assertRaises(TypeError, self.controller.create_group_units, [self.data_real, self.data_bad], None, self.schema_real)
+        self.assertEqual(self.controller.active.data.entry, self.data_real.entry)
+
+    def test_controller_root(self):
+        root = self.controller.root()
+        self.assertEqual(root, self.controller.pool.root())
+
+        self.controller._create_group_unit(self.data_bad)
+        self.assertNotEqual(self.controller.root(), root)
+
+    def test_controller_active_for(self):
+        self.assertEqual(self.controller.active_for(), self.controller.active)
+
+        group_unit = self.controller._create_group_unit(Data(BaseContainer((BaseValue("a"), BaseValue("b")), "tuple"), self.schema_real))
+        sub_unit = self.controller._create_group_unit(Data(BaseContainer((BaseValue("sub_user"), BaseValue(20)), "tuple")), True)
+        self.assertEqual(str(sub_unit.nonce), '2.0')
+        self.assertEqual(self.controller.active_for(group_unit.nonce), sub_unit)
+        self.assertEqual(self.controller.active_for(), group_unit)
+
+        self.assertEqual(self.controller.active, group_unit)
+        next_sub_unit = self.controller._create_group_unit(Data(BaseContainer((BaseValue("other_user"), BaseValue(30)), "tuple")), True)
+        self.assertEqual(str(next_sub_unit.nonce), '2.1')
+        self.assertEqual(self.controller.active, group_unit)
+        self.assertEqual(self.controller.active_for(group_unit.nonce), next_sub_unit)
+        self.assertIsNone(self.controller.active_for(sub_unit.nonce))
+
+    def test_controller_pool_out_of_nonce_order(self):
+        group_units = Controller().create_group_units([Data(BaseContainer((BaseValue(i), ), "tuple")) for i in range(1, 4)])
+        pool = Pool()
+        pool.add_group_units([group_units[2], group_units[0], group_units[1]])
+
+        controller = Controller(pool)
+        self.assertEqual(controller.active, group_units[1])
+        self.assertEqual(controller.active_for(), group_units[2])
+        next_unit = controller._create_group_unit(Data(BaseContainer((BaseValue(4), ), "tuple")))
+        self.assertEqual(str(next_unit.nonce), '4')
+
+    def test_controller_top_sub_top(self):
+        controller = Controller()
+        top_unit = controller._create_group_unit(Data(BaseContainer((BaseValue("a"), BaseValue("b")), "tuple"), self.schema_real))
+        sub_unit = controller._create_group_unit(Data(BaseContainer((BaseValue("sub_user"), BaseValue(20)), "tuple")), True)
+        next_unit = controller._create_group_unit(Data(BaseContainer((BaseValue("next_user"), BaseValue(40)), "tuple")))
+
+        self.assertEqual(str(top_unit.nonce), '1')
+        self.assertEqual(str(sub_unit.nonce), '1.0')
+        self.assertEqual(str(next_unit.nonce), '2')
+        self.assertEqual(controller.active, next_unit)
@@ -90,6 +90,14 @@ class TestGroupUnit(unittest.TestCase):
         group_unit = GroupUnit.from_dict(group_unit_dict)
         self.assertEqual(group_unit, GroupUnit.from_dict(group_unit.to_dict()))
 
+    def test_from_dict_trusted(self):
+        self.group_unit = GroupUnit(self.nonce, self.owner, self.credential, self.data)
+        group_unit = GroupUnit.from_dict(self.group_unit.to_dict(), trusted=True)
+        self.assertEqual(group_unit, self.group_unit)
+        self.assertEqual(repr(group_unit), repr(self.group_unit))
+        self.assertEqual(group_unit.data._hash_root(), self.group_unit.data._hash_root())
+        self.assertEqual(group_unit.nonce._hash_root(), self.group_unit.nonce._hash_root())
+
     def test_print(self):
         self.group_unit = GroupUnit(self.nonce, self.owner, self.credential, self.data)
         self.assertEqual(str(self.group_unit._print()), "Group Unit:\nNonce: 0\nOwner: (1,)\nCredential: (1,)\nData: {'items': [{'value': 1, 'type': 'int'}], 'type': 'tuple'}")
@@ -97,4 +105,12 @@ class TestGroupUnit(unittest.TestCase):
     def test_to_json(self):
         self.maxDiff = None
         self.group_unit = GroupUnit(self.nonce, self.owner, self.credential, self.data)
-        self.assertEqual(self.group_unit.to_json(), '{"nonce": {"chain": {"items": [{"value": 0, "type": "int"}], "type": "tuple"}}, "owner": {"owner": {"items": [{"value": 1, "type": "int"}], "type": "tuple"}}, "credential": {"credential": {"items": [{"value": 1, "type": "int"}], "type": "tuple"}}, "data": {"entry": {"items": [{"value": 1, "type": "int"}], "type": "tuple"}, "schema": {"entries": [{"key": "test", "value": "int"}]}}}')
\ No newline at end of file
+        self.assertEqual(self.group_unit.to_json(), '{"nonce": {"chain": {"items": [{"value": 0, "type": "int"}], "type": "tuple"}}, "owner": {"owner": {"items": [{"value": 1, "type": "int"}], "type": "tuple"}}, "credential": {"credential": {"items": [{"value": 1, "type": "int"}], "type": "tuple"}}, "data": {"entry": {"items": [{"value": 1, "type": "int"}], "type": "tuple"}, "schema": {"entries": [{"key": "test", "value": "int"}]}}}')
+
+    def test_to_bytes_from_bytes(self):
+        self.group_unit = GroupUnit(self.nonce, self.owner, self.credential, self.data)
+        encoded = self.group_unit.to_bytes()
+        self.assertEqual(GroupUnit.from_bytes(encoded), self.group_unit)
+        self.assertLess(len(encoded), len(self.group_unit.to_json()))
+        self.assertRaises(ValueError, GroupUnit.from_bytes, encoded[:-1])
+        self.assertRaises(ValueError, GroupUnit.from_bytes, encoded + b'\x00')
@@ -1,6 +1,12 @@
 import unittest
 import sys
 import json
+import gc
+import logging
+import os
+import tempfile
+import subprocess
+import threading
 
 sys.path.append("../forme-groups-python-3-12/")
 from src.groups.unit.credential import Credential
@@ -10,6 +16,9 @@ from src.groups.unit.nonce import Nonce
 from src.groups.unit.data import Data
 from src.groups import Groups
 from src.groups.unit import GroupUnit
+from src.groups.pool import Pool
+from src.groups.base.value import BaseValue
+from src.groups.base.schema import BaseSchema, SchemaEntry
 
 
 class TestGroups(unittest.TestCase):
@@ -22,15 +31,202 @@ class TestGroups(unittest.TestCase):
         self.group_unit = GroupUnit(self.nonce, self.owner, self.credentials, self.data)
         # with open('state-test.json', 'w') as f:
         #     f.write(json.dumps(self.group_unit.to_dict()))
+        self.directory = tempfile.TemporaryDirectory()
+        self.state_file = os.path.join(self.directory.name, 'state-test.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
 
     def test_groups_creation_init(self):
-        groups = Groups(state_file='state-test.json')
+        groups = Groups(state_file=self.state_file)
         print(groups.controller.active)
 
     def test_groups_creation(self):
-        groups = Groups(state_file='state-test.json')
+        groups = Groups(state_file=self.state_file)
         self.assertEqual(groups.controller.pool.group_units[-1][2].owner, self.owner)
 
     def test_groups_has_slots(self):
-        groups = Groups(state_file='state-test.json')
-        self.assertEqual(groups.__slots__, ('controller', 'state_file'))
+        groups = Groups(state_file=self.state_file)
+        self.assertEqual(groups.__slots__, ('controller', 'state_file', 'journal', 'worker'))
+
+
+    def test_groups_log_level(self):
+        logger = logging.getLogger('src.groups')
+        try:
+            groups = Groups(state_file=self.state_file, log_level='debug')
+            self.assertTrue(logging.getLogger('src.groups.utils.crypto').isEnabledFor(logging.DEBUG))
+        finally:
+            logger.setLevel(logging.NOTSET)
+        self.assertFalse(logging.getLogger('src.groups.utils.crypto').isEnabledFor(logging.DEBUG))
+
+    def test_groups_save_load_pool(self):
+        groups = Groups(state_file=self.state_file)
+        groups.controller.create_group_units([Data(BaseContainer((BaseValue(i), ), "tuple")) for i in range(1, 4)])
+        groups.save_state()
+
+        loaded = Groups(state_file=self.state_file)
+        loaded.load_state()
+        self.assertEqual(loaded.controller.pool.group_units, groups.controller.pool.group_units)
+        self.assertEqual(loaded.controller.root(), groups.controller.root())
+        self.assertEqual(loaded.controller.active, groups.controller.active)
+
+    def test_groups_save_state_snapshot(self):
+        groups = Groups(state_file=self.state_file)
+        groups.controller.pool.add_group_unit(GroupUnit(Nonce(BaseContainer((5, ))), self.owner, self.credentials, self.data))
+        tracked = groups.controller._tracked
+        groups.save_state()
+        self.assertEqual(groups.controller._tracked, tracked)
+
+        with open(self.state_file, 'r') as f:
+            self.assertEqual(json.load(f)['active'], groups.controller.active.to_dict())
+
+    def test_groups_load_tampered_state(self):
+        groups = Groups(state_file=self.state_file)
+        groups.controller.create_group_units([Data(BaseContainer((BaseValue(i), ), "tuple")) for i in range(1, 4)])
+        groups.save_state()
+
+        with open(self.state_file, 'r') as f:
+            state = json.load(f)
+        state['pool']['group_units'][2]['group_unit']['data']['entry']['items'][0]['value'] = 99
+        with open(self.state_file, 'w') as f:
+            json.dump(state, f)
+
+        self.assertRaises(ValueError, Groups(state_file=self.state_file).load_state)
+
+    def test_groups_save_load_after_sub_unit(self):
+        schema = BaseSchema((SchemaEntry("name", "string"), SchemaEntry("age", "integer")))
+        for state_file in (self.state_file, os.path.join(self.directory.name, 'state-test.jsonl')):
+            groups = Groups(state_file=state_file)
+            top_unit = groups.controller._create_group_unit(Data(BaseContainer((BaseValue("a"), BaseValue("b")), "tuple"), schema))
+            sub_unit = groups.controller._create_group_unit(Data(BaseContainer((BaseValue("sub_user"), BaseValue(20)), "tuple")), True)
+            self.assertEqual(str(sub_unit.nonce), '1.0')
+            groups.save_state()
+
+            loaded = Groups(state_file=state_file)
+            loaded.load_state()
+            self.assertEqual(loaded.controller.active, top_unit)
+            next_unit = loaded.controller._create_group_unit(Data(BaseContainer((BaseValue("next_user"), BaseValue(40)), "tuple")))
+            self.assertEqual(str(next_unit.nonce), '2')
+
+    def test_groups_load_saved_active(self):
+        schema = BaseSchema((SchemaEntry("name", "string"), SchemaEntry("age", "integer")))
+        groups = Groups(state_file=self.state_file)
+        groups.controller._create_group_unit(Data(BaseContainer((BaseValue("a"), BaseValue("b")), "tuple"), schema))
+        sub_unit = groups.controller._create_group_unit(Data(BaseContainer((BaseValue("sub_user"), BaseValue(20)), "tuple")), True)
+        groups.controller._create_group_unit(Data(BaseContainer((BaseValue("c"), BaseValue(30)), "tuple"), schema))
+        groups.controller.active = sub_unit
+        groups.save_state()
+
+        loaded = Groups(state_file=self.state_file)
+        loaded.load_state()
+        self.assertEqual(loaded.controller.active, sub_unit)
+        self.assertIs(loaded.controller.active, loaded.controller.pool.get_group_unit(sub_unit.nonce._hash_root(), lookup='nonce'))
+        next_unit = loaded.controller._create_group_unit(Data(BaseContainer((BaseValue("next_user"), BaseValue(40)), "tuple")))
+        self.assertEqual(str(next_unit.nonce), '1.1')
+
+    def test_groups_journal(self):
+        groups = Groups(state_file=self.state_file, journal=True, compact_every=3)
+        groups.controller.create_group_units([Data(BaseContainer((BaseValue(i), ), "tuple")) for i in range(1, 3)])
+        self.assertFalse(os.path.exists(self.state_file))
+        groups.controller._create_group_unit(Data(BaseContainer((BaseValue(3), ), "tuple")))
+        self.assertTrue(os.path.exists(self.state_file))
+        groups.controller._create_group_unit(Data(BaseContainer((BaseValue(4), ), "tuple")))
+        groups.close()
+
+        loaded = Groups(state_file=self.state_file, journal=True)
+        loaded.load_state()
+        self.assertEqual(loaded.controller.pool.group_units, groups.controller.pool.group_units)
+        self.assertEqual(loaded.controller.root(), groups.controller.root())
+
+        loaded.controller._create_group_unit(Data(BaseContainer((BaseValue(5), ), "tuple")))
+        loaded.close()
+
+        reloaded = Groups(state_file=self.state_file, journal=True)
+        reloaded.load_state()
+        self.assertEqual(len(reloaded.controller.pool.group_units), 6)
+        reloaded.close()
+
+    def test_groups_json_lines_state(self):
+        state_file = os.path.join(self.directory.name, 'state-test.jsonl')
+        groups = Groups(state_file=state_file)
+        groups.controller.create_group_units([Data(BaseContainer((BaseValue(i), ), "tuple")) for i in range(1, 4)])
+        groups.save_state()
+
+        with open(state_file) as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(json.loads(lines[0]), {'root': groups.controller.root(), 'count': 4})
+
+        loaded = Groups(state_file=state_file)
+        self.assertEqual(tuple(loaded.iter_state()), tuple(groups.controller.pool.group_units))
+        loaded.load_state()
+        self.assertEqual(loaded.controller.root(), groups.controller.root())
+
+        with open(state_file, 'w') as f:
+            f.writelines(lines[:1] + lines[2:])
+        with self.assertRaises(ValueError):
+            tuple(loaded.iter_state())
+
+        # A truncated state file is caught by its count, even with a root that matches the entries left
+        with open(state_file, 'w') as f:
+            f.write(json.dumps({'root': Pool(tuple(groups.controller.pool.group_units)[:-1]).root(), 'count': 4}) + '\n')
+            f.writelines(lines[1:-1])
+        with self.assertRaisesRegex(ValueError, 'Expected 4 state entries, got 3'):
+            tuple(loaded.iter_state())
+
+    def test_groups_background_save(self):
+        groups = Groups(state_file=self.state_file, background_save=True, save_delay=10)
+        groups.controller.create_group_units([Data(BaseContainer((BaseValue(i), ), "tuple")) for i in range(1, 4)])
+        groups.flush()
+        self.assertTrue(os.path.exists(self.state_file))
+
+        groups.controller._create_group_unit(Data(BaseContainer((BaseValue(4), ), "tuple")))
+        groups.close()
+
+        loaded = Groups(state_file=self.state_file)
+        loaded.load_state()
+        self.assertEqual(loaded.controller.root(), groups.controller.root())
+
+    def test_groups_del_stops_worker(self):
+        threads = []
+        with self.assertLogs('src.groups.persistence', 'WARNING') as logs:
+            for _ in range(5):
+                groups = Groups(state_file=self.state_file, background_save=True, save_delay=10)
+                groups.controller._create_group_unit(Data(BaseContainer((BaseValue(1), ), "tuple")))
+                threads.append(groups.worker._thread)
+                del groups
+            gc.collect()
+        self.assertEqual(len(logs.records), 5)
+
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual([thread for thread in threading.enumerate() if thread.name == 'groups-persistence'], [])
+        self.assertFalse(os.path.exists(self.state_file))
+
+    def test_groups_del_does_not_save(self):
+        groups = Groups(state_file=self.state_file)
+        groups.controller._create_group_unit(Data(BaseContainer((BaseValue(1), ), "tuple")))
+        del groups
+        gc.collect()
+        self.assertFalse(os.path.exists(self.state_file))
+
+    def test_groups_exit_saves_worker(self):
+        code = '\n'.join((
+            'import sys',
+            'from src.groups import Groups',
+            'from src.groups.base import BaseContainer, BaseValue',
+            'from src.groups.unit import Data',
+            'groups = Groups(state_file=sys.argv[1], background_save=True, save_delay=10)',
+            'groups.controller._create_group_unit(Data(BaseContainer((BaseValue(1), ), "tuple")))'))
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, '-c', code, self.state_file], cwd=root, check=True)
+
+        loaded = Groups(state_file=self.state_file)
+        loaded.load_state()
+        self.assertEqual(len(loaded.controller.pool.group_units), 2)
+
+    def test_groups_import_is_light(self):
+        code = 'import sys, src.groups; print(sorted(m for m in ("unittest", "asyncio", "ipfs_api") if m in sys.modules))'
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), '[]')
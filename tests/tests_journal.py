@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+import tempfile
+
+sys.path.append("../forme-groups-python-3-12/")
+from src.groups.base.value import BaseValue
+from src.groups.base.container import BaseContainer
+from src.groups.journal import Journal
+from src.groups.pool import Pool
+from src.groups.unit import GroupUnit
+from src.groups.unit.data import Data
+from src.groups.unit.credential import Credential
+from src.groups.unit.owner import Owner
+from src.groups.unit.nonce import Nonce
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'pool.journal')
+        self.group_units = [
+            GroupUnit(Nonce(BaseContainer((i, ), "tuple")), Owner(), Credential(), Data(BaseContainer((BaseValue(i), ), "tuple")))
+            for i in range(5)
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_journal_replay(self):
+        journal = Journal(self.path, sync_every=2)
+        pool = Pool()
+        pool.attach_journal(journal)
+        pool.add_group_unit(self.group_units[0])
+        pool.add_group_units(self.group_units[1:])
+        journal.close()
+
+        replayed = Pool()
+        self.assertEqual(replayed.replay_journal(Journal(self.path)), 5)
+        self.assertEqual(replayed.group_units, pool.group_units)
+        self.assertEqual(replayed.root(), pool.root())
+        self.assertEqual(replayed.replay_journal(Journal(self.path)), 0)
+
+    def test_journal_torn_record(self):
+        journal = Journal(self.path)
+        for group_unit in self.group_units[:2]:
+            journal.append(group_unit.data._hash_root(), group_unit.nonce._hash_root(), group_unit)
+        journal.close()
+        with open(self.path, 'ab') as f:
+            f.write(b'{"package_hash": "torn')
+
+        with self.assertLogs('src.groups.journal', level='WARNING'):
+            self.assertEqual(len(list(journal.replay())), 2)
+
+        group_unit = self.group_units[2]
+        journal.append(group_unit.data._hash_root(), group_unit.nonce._hash_root(), group_unit)
+        journal.close()
+        self.assertEqual([item[2] for item in journal.replay()], self.group_units[:3])
+
+    def test_journal_corrupt_record(self):
+        journal = Journal(self.path)
+        for group_unit in self.group_units[:3]:
+            journal.append(group_unit.data._hash_root(), group_unit.nonce._hash_root(), group_unit)
+        journal.close()
+
+        with open(self.path, 'rb') as f:
+            lines = f.readlines()
+        with open(self.path, 'wb') as f:
+            f.writelines([lines[0], b'{"package_hash": "corrupt\n'] + lines[2:])
+        size = os.path.getsize(self.path)
+
+        with self.assertRaises(ValueError):
+            list(journal.replay())
+        self.assertEqual(os.path.getsize(self.path), size)
+
+    def test_journal_compact(self):
+        snapshots = []
+        pool = Pool()
+        journal = Journal(self.path, compact_every=3, compactor=lambda: snapshots.append(len(pool.group_units)))
+        pool.attach_journal(journal)
+        pool.add_group_units(self.group_units[:4])
+        pool.add_group_unit(self.group_units[4])
+
+        self.assertEqual(snapshots, [4])
+        journal.close()
+        self.assertEqual([item[2] for item in journal.replay()], self.group_units[4:])
+        self.assertRaises(ValueError, Journal(self.path).compact)
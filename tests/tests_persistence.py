@@ -0,0 +1,73 @@
+import unittest
+import sys
+import asyncio
+import gc
+import threading
+
+sys.path.append("../forme-groups-python-3-12/")
+from src.groups.persistence import PersistenceWorker
+
+
+class TestPersistenceWorker(unittest.TestCase):
+    def setUp(self):
+        self.saves = 0
+
+    def save(self):
+        self.saves += 1
+
+    def test_persistence_worker_coalesces(self):
+        worker = PersistenceWorker(self.save, delay=10)
+        for _ in range(100):
+            worker.mark_dirty()
+        worker.flush(timeout=5)
+        self.assertEqual(self.saves, 1)
+        worker.flush(timeout=5)
+        self.assertEqual(self.saves, 1)
+        worker.close()
+
+    def test_persistence_worker_delay(self):
+        saved = threading.Event()
+        worker = PersistenceWorker(saved.set, delay=0)
+        worker.mark_dirty()
+        self.assertTrue(saved.wait(5))
+        worker.close()
+
+    def test_persistence_worker_aflush(self):
+        worker = PersistenceWorker(self.save, delay=10)
+        worker.mark_dirty()
+        asyncio.run(worker.aflush(timeout=5))
+        self.assertEqual(self.saves, 1)
+        worker.close()
+
+    def test_persistence_worker_close(self):
+        worker = PersistenceWorker(self.save, delay=10)
+        worker.mark_dirty()
+        worker.close()
+        self.assertEqual(self.saves, 1)
+        worker.close()
+        self.assertEqual(self.saves, 1)
+
+        worker.mark_dirty()
+        self.assertEqual(self.saves, 2)
+
+    def test_persistence_worker_error(self):
+        def fail():
+            raise OSError('disk full')
+
+        worker = PersistenceWorker(fail, delay=0)
+        worker.mark_dirty()
+        with self.assertRaises(OSError):
+            worker.flush(timeout=5)
+        worker.close()
+
+    def test_persistence_worker_collected(self):
+        worker = PersistenceWorker(self.save, delay=10)
+        worker.mark_dirty()
+        thread = worker._thread
+        with self.assertLogs('src.groups.persistence', 'WARNING'):
+            del worker
+            gc.collect()
+
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.saves, 0)
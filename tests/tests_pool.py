@@ -2,16 +2,19 @@ import unittest
 import sys
 import random
 import uuid
+import os
+import tempfile
 
 sys.path.append("../forme-groups-python-3-12/")
 from src.groups.base.value import BaseValue
 from src.groups.base.container import BaseContainer
-from src.groups.pool import Pool
+from src.groups.pool import Pool, GroupUnitEntries
 from src.groups.unit import GroupUnit
 from src.groups.unit.data import Data
 from src.groups.unit.credential import Credential
 from src.groups.unit.owner import Owner
 from src.groups.unit.nonce import Nonce
+from src.groups.utils.crypto import MerkleTree, MerkleTrie
 
 
 __RANGE__ = 1000
@@ -38,7 +41,7 @@ class TestPool(unittest.TestCase):
 
     def test_pool_has_slots(self):
         self.pool = Pool(((self.group_unit.data._hash().root(), self.group_unit.nonce._hash().root(), self.group_unit), ))
-        self.assertEqual(self.pool.__slots__, ('group_units', ))
+        self.assertEqual(self.pool.__slots__, ('_group_units', '_package_index', '_nonce_index', '_nonce_tree', '_nonce_order', '_tree', '_journal', '_on_change', '_lock'))
 
     def test_create_random_group_units(self):
         group_units = []
@@ -78,4 +81,335 @@ class TestPool(unittest.TestCase):
         self.pool.add_group_unit(self.group_unit)
         self.assertEqual(self.pool.group_units, ((self.group_unit.data._hash().root(), self.group_unit.nonce._hash().root(), self.group_unit), ))
 
-        self.assertRaises(TypeError, self.pool.add_group_unit, (self.group_unit.data._hash().root(), self.group_unit.nonce._hash().root(), self.group_unit))
\ No newline at end of file
+        self.assertRaises(TypeError, self.pool.add_group_unit, (self.group_unit.data._hash().root(), self.group_unit.nonce._hash().root(), self.group_unit))
+
+    def test_get_group_unit_by_lookup(self):
+        self.pool = Pool()
+        self.pool.add_group_unit(self.group_unit)
+        package_hash = self.group_unit.data._hash().root()
+        nonce_hash = self.group_unit.nonce._hash().root()
+
+        self.assertEqual(self.pool.get_group_unit(package_hash, lookup='unit'), self.group_unit)
+        self.assertEqual(self.pool.get_group_unit(nonce_hash, lookup='nonce'), self.group_unit)
+        self.assertEqual(self.pool.get_group_unit(nonce_hash), self.group_unit)
+        self.assertRaises(ValueError, self.pool.get_group_unit, package_hash, 'nonce')
+        self.assertRaises(ValueError, self.pool.get_group_unit, nonce_hash, 'unit')
+
+    def test_index_keeps_insertion_order(self):
+        self.pool = Pool()
+        group_units = []
+        for i in range(10):
+            data = Data(BaseContainer((BaseValue(i), ), "tuple"))
+            group_unit = GroupUnit(Nonce(BaseContainer((i, ), "tuple")), self.owner, self.credential, data)
+            self.pool.add_group_unit(group_unit)
+            group_units.append(group_unit)
+
+        self.assertEqual([item[2] for item in self.pool], group_units)
+        for group_unit in group_units:
+            self.assertEqual(self.pool.get_group_unit(group_unit.nonce._hash().root(), lookup='nonce'), group_unit)
+
+        self.assertRaises(ValueError, self.pool.add_group_unit, group_units[3])
+
+    def test_group_units_is_read_only_view(self):
+        self.pool = Pool()
+        group_units = self.pool.group_units
+        self.pool.add_group_unit(self.group_unit)
+
+        self.assertIsInstance(group_units, GroupUnitEntries)
+        self.assertEqual(len(group_units), 1)
+        self.assertEqual(group_units[-1][2], self.group_unit)
+        with self.assertRaises(TypeError):
+            group_units[0] = group_units[0]
+        self.assertFalse(hasattr(group_units, 'append'))
+
+    def test_add_group_units(self):
+        self.pool = Pool()
+        group_units = [
+            GroupUnit(Nonce(BaseContainer((i, ), "tuple")), self.owner, self.credential, Data(BaseContainer((BaseValue(i), ), "tuple")))
+            for i in range(5)
+        ]
+        self.pool.add_group_units(group_units)
+        self.assertEqual([item[2] for item in self.pool], group_units)
+        self.assertTrue(all(self.pool.check_if_exists(group_unit) for group_unit in group_units))
+
+    def test_add_group_units_rejects_duplicates(self):
+        self.pool = Pool()
+        self.assertRaises(ValueError, self.pool.add_group_units, (self.group_unit, self.group_unit))
+        self.assertEqual(len(self.pool.group_units), 0)
+
+        self.pool.add_group_unit(self.group_unit)
+        self.assertRaises(ValueError, self.pool.add_group_units, (self.group_unit, ))
+        self.assertRaises(TypeError, self.pool.add_group_units, (self.data, ))
+        self.assertEqual(len(self.pool.group_units), 1)
+
+    def test_pool_root(self):
+        self.pool = Pool()
+        self.assertIsNone(self.pool.root())
+
+        group_units = [
+            GroupUnit(Nonce(BaseContainer((i, ), "tuple")), self.owner, self.credential, Data(BaseContainer((BaseValue(i), ), "tuple")))
+            for i in range(6)
+        ]
+        for group_unit in group_units[:3]:
+            self.pool.add_group_unit(group_unit)
+        self.pool.add_group_units(group_units[3:])
+
+        leaves = tuple(MerkleTree._hash_func(item[0] + item[1]) for item in self.pool)
+        self.assertEqual(self.pool.root(), MerkleTrie(leaves).root())
+
+        replica = Pool(tuple(self.pool.group_units))
+        self.assertEqual(replica.root(), self.pool.root())
+
+        shuffled = Pool()
+        shuffled.add_group_units(group_units[::-1])
+        self.assertEqual(shuffled.root(), self.pool.root())
+
+        replica.add_group_unit(GroupUnit(Nonce(BaseContainer((6, ), "tuple")), self.owner, self.credential, Data(BaseContainer((BaseValue(6), ), "tuple"))))
+        self.assertNotEqual(replica.root(), self.pool.root())
+
+    def _group_units(self, start: int, stop: int) -> list[GroupUnit]:
+        return [
+            GroupUnit(Nonce(BaseContainer((i, ), "tuple")), self.owner, self.credential, Data(BaseContainer((BaseValue(i), ), "tuple")))
+            for i in range(start, stop)
+        ]
+
+    def test_pool_diff(self):
+        group_units = self._group_units(0, 11)
+        self.pool = Pool()
+        self.pool.add_group_units(group_units[:6])
+        other = Pool()
+        other.add_group_units(group_units)
+
+        self.assertEqual(self.pool.diff(self.pool), ())
+        self.assertEqual(tuple(item[2] for item in self.pool.diff(other)), tuple(group_units[6:]))
+        self.assertEqual(other.diff(self.pool), ())
+        self.assertEqual(self.pool._diff_positions(other), list(range(6, 11)))
+        self.assertRaises(TypeError, self.pool.diff, group_units)
+
+    def test_pool_sync_from(self):
+        shared = self._group_units(0, 5)
+        self.pool = Pool()
+        self.pool.add_group_units(shared + self._group_units(5, 7))
+        other = Pool()
+        other.add_group_units(shared + self._group_units(7, 10))
+
+        added = self.pool.sync_from(other)
+        self.assertEqual(tuple(item[2] for item in added), tuple(self._group_units(7, 10)))
+        self.assertTrue(all(self.pool.check_if_exists(item[2]) for item in other))
+        self.assertEqual(self.pool.sync_from(other), ())
+
+        replica = Pool()
+        replica.sync_from(other)
+        self.assertEqual(replica.root(), other.root())
+
+    def test_pool_sync_both_ways(self):
+        shared = self._group_units(0, 40)
+        random.shuffle(shared)
+        self.pool = Pool()
+        self.pool.add_group_units(shared[:20] + self._group_units(40, 43) + shared[20:])
+        other = Pool()
+        other.add_group_units(self._group_units(43, 45) + shared[::-1])
+
+        self.assertEqual(len(self.pool.diff(other)), 2)
+        self.assertEqual(len(other.diff(self.pool)), 3)
+        self.assertEqual(self.pool._diff_positions(other), [0, 1])
+        self.assertEqual(other._diff_positions(self.pool), [20, 21, 22])
+
+        self.pool.sync_from(other)
+        other.sync_from(self.pool)
+        self.assertEqual(self.pool.root(), other.root())
+        self.assertEqual(self.pool.diff(other), ())
+        self.assertEqual(other.diff(self.pool), ())
+
+    def test_pool_sync_diverged(self):
+        shared = self._group_units(0, 3)
+        self.pool = Pool()
+        self.pool.add_group_units(shared + self._group_units(3, 4))
+        other = Pool()
+        # Both replicas created a GroupUnit under nonce 3, with different data
+        diverged = GroupUnit(Nonce(BaseContainer((3, ), "tuple")), self.owner, self.credential, Data(BaseContainer((BaseValue(30), ), "tuple")))
+        other.add_group_units(shared + [diverged] + self._group_units(4, 5))
+
+        self.assertRaises(ValueError, self.pool.diff, other)
+        self.assertRaises(ValueError, self.pool.sync_from, other)
+        self.assertRaises(ValueError, other.sync_from, self.pool)
+        self.assertEqual(len(self.pool.group_units), 4)
+        self.assertFalse(self.pool.check_if_exists(self._group_units(4, 5)[0]))
+        self.assertNotEqual(self.pool.root(), other.root())
+
+    def test_pool_to_dict_from_dict(self):
+        self.pool = Pool()
+        self.pool.add_group_units(self._group_units(0, 5))
+
+        restored = Pool.from_dict(self.pool.to_dict())
+        self.assertEqual(restored.group_units, self.pool.group_units)
+        self.assertEqual(restored.root(), self.pool.root())
+        self.assertTrue(all(restored.check_if_exists(item[2]) for item in self.pool))
+
+        data = self.pool.to_dict()
+        data["group_units"][0]["nonce_hash"] = data["group_units"][1]["nonce_hash"]
+        self.assertRaises(ValueError, Pool.from_dict, data)
+
+    def test_pool_to_bytes_from_bytes(self):
+        self.pool = Pool()
+        self.assertEqual(Pool.from_bytes(self.pool.to_bytes()).root(), None)
+
+        self.pool.add_group_units(self._group_units(0, 5))
+        snapshot = self.pool.to_bytes()
+        restored = Pool.from_bytes(snapshot)
+        self.assertEqual(restored.group_units, self.pool.group_units)
+        self.assertEqual(restored.root(), self.pool.root())
+
+        self.assertRaises(ValueError, Pool.from_bytes, b'JSON' + snapshot[4:])
+        self.assertRaises(ValueError, Pool.from_bytes, snapshot[:-1])
+        self.assertRaises(ValueError, Pool.from_bytes, snapshot[:6] + b'\x00' * 32 + snapshot[38:])
+
+    def test_pool_write_read_snapshot(self):
+        self.pool = Pool()
+        self.pool.add_group_units(self._group_units(0, 3))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'pool.snapshot')
+            self.pool.write_snapshot(path)
+            self.assertEqual(Pool.read_snapshot(path).root(), self.pool.root())
+
+    def test_pool_open_snapshot(self):
+        self.pool = Pool()
+        group_units = self._group_units(0, 6)
+        self.pool.add_group_units(group_units)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'pool.snapshot')
+            self.pool.write_snapshot(path)
+
+            opened = Pool.open_snapshot(path)
+            self.assertEqual(opened.root(), self.pool.root())
+            self.assertTrue(all(item[2] is None for item in list.__iter__(opened._group_units)))
+
+            self.assertEqual(opened.get_group_unit(group_units[3].nonce._hash_root(), lookup='nonce'), group_units[3])
+            self.assertEqual(sum(item[2] is not None for item in list.__iter__(opened._group_units)), 1)
+
+            self.assertEqual([item[2] for item in opened], group_units)
+            self.assertEqual(opened.group_units, self.pool.group_units)
+
+            new_group_unit = self._group_units(6, 7)[0]
+            opened.add_group_unit(new_group_unit)
+            self.assertEqual(opened.group_units[-1][2], new_group_unit)
+            self.assertEqual(opened.group_units[-2:][0][2], group_units[-1])
+            opened.close()
+            self.assertEqual(opened.group_units[3][2], group_units[3])
+
+    def test_pool_open_snapshot_close(self):
+        self.pool = Pool()
+        group_units = self._group_units(0, 4)
+        self.pool.add_group_units(group_units)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'pool.snapshot')
+            self.pool.write_snapshot(path)
+
+            with Pool.open_snapshot(path) as opened:
+                self.assertEqual(opened.group_units[1][2], group_units[1])
+                snapshot = opened._group_units._snapshot
+
+            self.assertTrue(snapshot.closed)
+            self.assertEqual(opened.group_units[1][2], group_units[1])
+            self.assertRaises(ValueError, opened.group_units.__getitem__, 2)
+            Pool().close()
+
+    def test_pool_open_snapshot_reads_index(self):
+        self.pool = Pool()
+        group_units = self._group_units(0, 4)
+        self.pool.add_group_units(group_units)
+        snapshot = bytearray(self.pool.to_bytes())
+
+        # Corrupting the length of the first entry does not stop the index from being read
+        snapshot[39] = 0x7f
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'pool.snapshot')
+            with open(path, 'wb') as f:
+                f.write(snapshot)
+
+            with Pool.open_snapshot(path) as opened:
+                self.assertEqual(opened.root(), self.pool.root())
+                self.assertEqual(opened.group_units[1][2], group_units[1])
+
+        self.assertRaises(ValueError, Pool.from_bytes, bytes(snapshot))
+        self.assertRaises(ValueError, Pool.from_bytes, bytes(snapshot[:-12]))
+
+    def test_pool_from_dict_trusted(self):
+        self.pool = Pool()
+        self.pool.add_group_units(self._group_units(0, 5))
+        data = self.pool.to_dict()
+
+        restored = Pool.from_dict(data, trusted=True)
+        self.assertEqual(restored.group_units, self.pool.group_units)
+        self.assertEqual(restored.root(), self.pool.root())
+
+        data["group_units"][2]["group_unit"]["data"]["entry"]["items"][0]["value"] = 99
+        self.assertRaises(ValueError, Pool.from_dict, data)
+        self.assertRaises(ValueError, Pool.from_dict, data, True)
+
+        del data["root"]
+        self.assertRaises(ValueError, Pool.from_dict, data, True)
+
+    def test_pool_from_dict_checks_hashes(self):
+        self.pool = Pool()
+        self.pool.add_group_units(self._group_units(0, 3))
+
+        data = self.pool.to_dict()
+        data["group_units"][1]["package_hash"] = data["group_units"][0]["package_hash"]
+        del data["root"]
+        self.assertRaises(ValueError, Pool.from_dict, data)
+
+        data = self.pool.to_dict()
+        data["group_units"][1]["nonce_hash"] = data["group_units"][2]["nonce_hash"]
+        del data["root"]
+        self.assertRaises(ValueError, Pool.from_dict, data)
+
+    def test_pool_from_dict_trusted_validates_owner(self):
+        self.pool = Pool()
+        self.pool.add_group_units(self._group_units(0, 3))
+        data = self.pool.to_dict()
+
+        data["group_units"][1]["group_unit"]["owner"]["owner"]["items"][0] = {"value": [1], "type": "list"}
+        self.assertRaises(TypeError, Pool.from_dict, data, True)
+
+        data = self.pool.to_dict()
+        data["group_units"][1]["group_unit"]["credential"]["credential"]["items"][0] = {"value": [1], "type": "list"}
+        self.assertRaises(TypeError, Pool.from_dict, data, True)
+
+    def test_pool_nonce_tree(self):
+        chains = ((1, ), (1, 0), (1, 1), (1, 0, 0), (2, ))
+        group_units = [
+            GroupUnit(Nonce(BaseContainer(chain, "tuple")), self.owner, self.credential, Data(BaseContainer((BaseValue(i), ), "tuple")))
+            for i, chain in enumerate(chains, start=1)
+        ]
+        self.pool = Pool()
+        self.pool.add_group_units(group_units[:3])
+        self.assertEqual(self.pool.children(group_units[0].nonce), tuple(group_units[1:3]))
+
+        self.pool.add_group_units(group_units[3:])
+        self.assertEqual(self.pool.children(group_units[1].nonce), (group_units[3], ))
+        self.assertEqual(self.pool.children(group_units[4].nonce), ())
+        self.assertEqual(self.pool.parent(group_units[3].nonce), group_units[1])
+        self.assertIsNone(self.pool.parent(group_units[0].nonce))
+        self.assertEqual(list(self.pool.subtree(group_units[0].nonce)), [group_units[0], group_units[1], group_units[3], group_units[2]])
+        self.assertEqual(list(self.pool.subtree(Nonce(BaseContainer((1, 0), "tuple")))), [group_units[1], group_units[3]])
+
+    def test_pool_nonce_range_prefix(self):
+        chains = ((3, ), (3, 1), (100, ), (3, 0), (150, 2), ("a", ), (200, ), (3, "a"), (30, ))
+        group_units = {
+            chain: GroupUnit(Nonce(BaseContainer(chain, "tuple")), self.owner, self.credential, Data(BaseContainer((BaseValue(i), ), "tuple")))
+            for i, chain in enumerate(chains, start=1)
+        }
+        self.pool = Pool()
+        self.pool.add_group_units(tuple(group_units.values())[:4])
+        self.assertEqual(list(self.pool.prefix(Nonce(BaseContainer((3, ), "tuple")))), [group_units[(3, )], group_units[(3, 0)], group_units[(3, 1)]])
+
+        self.pool.add_group_units(tuple(group_units.values())[4:])
+        self.assertEqual(
+            list(self.pool.prefix(Nonce(BaseContainer((3, ), "tuple")))),
+            [group_units[(3, )], group_units[(3, 0)], group_units[(3, 1)], group_units[(3, "a")]])
+        self.assertEqual(
+            list(self.pool.range(Nonce(BaseContainer((100, ), "tuple")), Nonce(BaseContainer((200, ), "tuple")))),
+            [group_units[(100, )], group_units[(150, 2)]])
+        self.assertEqual(list(self.pool.range(Nonce(BaseContainer((200, ), "tuple")), Nonce(BaseContainer(("a", ), "tuple")))), [group_units[(200, )]])
+        self.assertEqual(list(self.pool.prefix(Nonce(BaseContainer((4, ), "tuple")))), [])
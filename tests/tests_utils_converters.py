@@ -1,5 +1,7 @@
 import sys
 import unittest
+from collections import deque
+from decimal import Decimal
 
 sys.path.append("../forme-groups-python-3-12/")
 from src.groups.utils.converters import (
@@ -9,8 +11,14 @@ from src.groups.utils.converters import (
     convert_to_bool,
     convert_to_float,
     force_value_type,
-    convert_tuple)
+    convert_tuple,
+    register_value_converter,
+    register_container_packer,
+    __VALUE_CONVERTERS__,
+    __CONTAINER_PACKERS__)
 from src.groups.base.value import BaseValue
+from src.groups.base.container import BaseContainer
+from src.groups.base.exceptions import GroupBaseTypeException
 
 class TestConverters(unittest.TestCase):
     def test_convert_to_bytes(self):
@@ -105,9 +113,49 @@ class TestConverters(unittest.TestCase):
     def test_convert_tuple(self):
         value = (1, 2, 3)
         self.assertEqual(convert_tuple(value, type_alias="tuple"), (1, 2, 3))
-
-
-
-
-
-
+        self.assertEqual(convert_tuple(value, type_alias="list"), [1, 2, 3])
+        self.assertEqual(convert_tuple(("a", 1, "b", 2), type_alias="dict"), {"a": 1, "b": 2})
+
+    def test_register_value_converter(self):
+        converter = __VALUE_CONVERTERS__[int]
+        try:
+            register_value_converter(int, lambda value: int(value, 16))
+            self.assertEqual(force_value_type("ff", "int"), 255)
+        finally:
+            register_value_converter(int, converter)
+        self.assertEqual(force_value_type("10", "int"), 10)
+        self.assertRaises(TypeError, register_value_converter, int, None)
+
+    def test_register_new_type(self):
+        try:
+            register_value_converter(Decimal, lambda value: Decimal(str(value)))
+            register_container_packer(deque, deque)
+            self.assertEqual(force_value_type(1.5, Decimal), Decimal('1.5'))
+            self.assertEqual(force_value_type("2", Decimal), Decimal('2'))
+            self.assertEqual(convert_tuple((1, 2), deque), deque([1, 2]))
+        finally:
+            del __VALUE_CONVERTERS__[Decimal]
+            del __CONTAINER_PACKERS__[deque]
+        self.assertRaises(TypeError, register_value_converter, "Decimal", str)
+        self.assertRaises(GroupBaseTypeException, register_value_converter, type("Str", (), {}), str)
+        self.assertRaises(GroupBaseTypeException, register_container_packer, type("Integ", (), {}), tuple)
+
+    def test_registered_type_in_base_classes(self):
+        self.assertIsNone(force_value_type(None, Decimal))
+        try:
+            register_value_converter(Decimal, lambda value: Decimal(str(value)))
+            register_container_packer(deque, deque)
+            self.assertIsNone(force_value_type(None, Decimal))
+            value = BaseValue(Decimal('1.5'))
+            self.assertEqual(value.value, Decimal('1.5'))
+            self.assertEqual(value.get_type_str(), "Decimal")
+            container = BaseContainer((Decimal('1.5'), 2), deque)
+            self.assertEqual(container.type, "deque")
+            self.assertEqual(container.items, (BaseValue(Decimal('1.5')), BaseValue(2)))
+            self.assertEqual(str(container), str(deque([Decimal('1.5'), 2])))
+            self.assertEqual(len(container._hash_root()), len(BaseContainer((1, 2))._hash_root()))
+        finally:
+            del __VALUE_CONVERTERS__[Decimal]
+            del __CONTAINER_PACKERS__[deque]
+        self.assertRaises(Exception, BaseValue, Decimal('1.5'))
+        self.assertRaises(Exception, BaseContainer, (1, 2), deque)
@@ -1,9 +1,10 @@
 from cgi import test
 import unittest
 import sys
+import logging
 
 sys.path.append("../forme-groups-python-3-12/")
-from src.groups.utils.crypto import MerkleTree, SHA256Hash, Leaf, Leaves, Levels
+from src.groups.utils.crypto import MerkleTree, MerkleTrie, SHA256Hash, Leaf, Leaves, Levels, convert_to_digest_bytes
 
 
 class TestSHA256Hash(unittest.TestCase):
@@ -101,6 +102,20 @@ class TestLevel(unittest.TestCase):
         with self.assertRaises(AssertionError):
             Levels((Leaves((SHA256Hash.from_str(""), SHA256Hash.from_str("test2"))), Leaves((SHA256Hash.from_str("test3"), SHA256Hash.from_str("test4")))))
 
+    def test_eq(self):
+        leaves = tuple(MerkleTree._hash_func(f"test{i}") for i in range(5))
+        for backend in ("flat", "levels"):
+            self.assertEqual(MerkleTree(leaves, backend=backend), MerkleTree(leaves, backend=backend))
+            self.assertEqual(MerkleTree(leaves, backend=backend), MerkleTree(leaves, backend="flat"))
+            self.assertNotEqual(MerkleTree(leaves, backend=backend), MerkleTree(leaves[:4], backend=backend))
+            self.assertNotEqual(MerkleTree(leaves, backend=backend), MerkleTree(leaves[::-1], backend=backend))
+
+        # Materializing the leaves of a flat tree does not change its equality
+        flat = MerkleTree(leaves)
+        flat.leaves
+        self.assertEqual(flat, MerkleTree(leaves))
+        self.assertEqual(MerkleTree(), MerkleTree(backend="levels"))
+
     def test_append(self):
         self.level.append(Leaves((SHA256Hash.from_str("test5"), SHA256Hash.from_str("test6"))))
         self.assertEqual(self.level, Levels((Leaves((SHA256Hash.from_str("test"), SHA256Hash.from_str("test2"))), Leaves((SHA256Hash.from_str("test3"), SHA256Hash.from_str("test4"))), Leaves((SHA256Hash.from_str("test5"), SHA256Hash.from_str("test6"))))))
@@ -109,9 +124,105 @@ class TestLevel(unittest.TestCase):
 class TestMerkleTree(unittest.TestCase):
     def test_init(self):
         mt = MerkleTree()
-        self.assertEqual(mt.root, None)
+        self.assertEqual(mt.root(), None)
         self.assertEqual(mt.leaves, Leaves(leaves=()))
 
+    def test_debug_logging(self):
+        logger = logging.getLogger('src.groups.utils.crypto')
+        self.assertFalse(logger.isEnabledFor(logging.DEBUG))
+
+        with self.assertLogs(logger, level='DEBUG') as logs:
+            MerkleTree((SHA256Hash.from_str("test"), ))
+        self.assertTrue(any('built levels' in line for line in logs.output))
+
+    def test_convert_to_digest_bytes(self):
+        digest = MerkleTree._hash_func("test")
+        self.assertEqual(convert_to_digest_bytes(digest), digest)
+        self.assertEqual(convert_to_digest_bytes(digest.hex()), digest)
+        self.assertEqual(convert_to_digest_bytes(digest.hex().upper()), digest)
+
+        # 64 characters that are not hex are hashed, not parsed
+        text = "g" * 64
+        self.assertEqual(convert_to_digest_bytes(text), MerkleTree._hash_func(text))
+        spaced = " ".join(digest.hex()[i:i + 2] for i in range(0, 44, 2))[:64]
+        self.assertEqual(len(convert_to_digest_bytes(spaced)), 32)
+        self.assertEqual(convert_to_digest_bytes("test"), digest)
+
+    def test_proof(self):
+        for count in range(1, 10):
+            leaves = tuple(MerkleTree._hash_func(f"test{i}") for i in range(count))
+            mt = MerkleTree(leaves)
+            for index, leaf in enumerate(leaves):
+                self.assertTrue(MerkleTree.verify_proof(leaf, mt.proof(index), mt.proof_root()))
+                self.assertFalse(MerkleTree.verify_proof(MerkleTree._hash_func("bad"), mt.proof(index), mt.proof_root()))
+                self.assertFalse(MerkleTree.verify_proof(leaf, mt.proof(index), mt.root()))
+
+    def test_proof_odd_leaf(self):
+        leaves = tuple(MerkleTree._hash_func(f"test{i}") for i in range(3))
+        mt = MerkleTree(leaves)
+        padded = MerkleTree(leaves + leaves[-1:])
+
+        # The last leaf is promoted, not paired with itself
+        self.assertEqual(mt.root(), padded.root())
+        self.assertNotEqual(mt.proof_root(), padded.proof_root())
+        self.assertFalse(MerkleTree.verify_proof(leaves[2], padded.proof(3), mt.proof_root()))
+        self.assertFalse(MerkleTree.verify_proof(leaves[2], padded.proof(2), mt.proof_root()))
+
+        # A node can not be proven as a leaf
+        node = MerkleTree(leaves[:2]).proof_root()
+        self.assertFalse(MerkleTree.verify_proof(node, mt.proof(2)[-1:], mt.proof_root()))
+        self.assertIsNone(MerkleTree().proof_root())
+
+    def test_backends_match(self):
+        for count in range(0, 18):
+            leaves = tuple(MerkleTree._hash_func(f"test{i}") for i in range(count))
+            flat = MerkleTree(leaves)
+            legacy = MerkleTree(leaves, backend="levels")
+            self.assertEqual(flat.root(), legacy.root())
+            self.assertEqual(flat.leaves, legacy.leaves)
+            self.assertEqual(flat.proof_root(), legacy.proof_root())
+            for index in range(count):
+                self.assertEqual(flat.proof(index), legacy.proof(index))
+
+    def test_append(self):
+        for backend in ("flat", "levels"):
+            mt = MerkleTree(backend=backend)
+            leaves = ()
+            for i in range(18):
+                leaf = MerkleTree._hash_func(f"test{i}")
+                leaves += (leaf, )
+                mt.append(leaf)
+                self.assertEqual(mt.root(), MerkleTree(leaves).root())
+                self.assertEqual(len(mt), len(leaves))
+
+    def test_extend(self):
+        leaves = tuple(MerkleTree._hash_func(f"test{i}") for i in range(23))
+        for split in (0, 1, 2, 5, 8, 16, 23):
+            mt = MerkleTree(leaves[:split])
+            mt.extend(leaves[split:])
+            self.assertEqual(mt.root(), MerkleTree(leaves).root())
+            self.assertEqual(mt.leaves, MerkleTree(leaves).leaves)
+
+    def test_add(self):
+        leaves = tuple(MerkleTree._hash_func(f"test{i}") for i in range(7))
+        left = MerkleTree(leaves[:3])
+        left_root = left.root()
+        self.assertEqual((left + MerkleTree(leaves[3:])).root(), MerkleTree(leaves).root())
+        self.assertEqual(left.root(), left_root)
+
+    def test_backend_invalid(self):
+        self.assertRaises(ValueError, MerkleTree, (), True, "tree")
+
+    def test_proof_out_of_range(self):
+        mt = MerkleTree((MerkleTree._hash_func("test"), ))
+        self.assertRaises(IndexError, mt.proof, 1)
+
+    def test_verify(self):
+        mt = MerkleTree((MerkleTree._hash_func("test"), MerkleTree._hash_func("test2")))
+        self.assertTrue(mt.verify(MerkleTree._hash_func("test2")))
+        self.assertTrue(mt.verify(MerkleTree._hash_func("test2").hex()))
+        self.assertFalse(mt.verify(MerkleTree._hash_func("test3")))
+
     def test_hash_single_value(self):
         hash_test_func = MerkleTree._hash_func("test")
         self.assertEqual(hash_test_func.hex(), "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08")
@@ -207,4 +318,35 @@ class TestMerkleTree(unittest.TestCase):
             
     # def test_sha256_hash(self):
     #     hash_test_func = SHA256Hash.from_str("test")
-    #     self.assertEqual(hash_test_func, "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08")
\ No newline at end of file
+    #     self.assertEqual(hash_test_func, "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08")
+
+class TestMerkleTrie(unittest.TestCase):
+    def setUp(self):
+        self.leaves = tuple(MerkleTree._hash_func(f"test{i}") for i in range(12))
+
+    def test_root(self):
+        self.assertIsNone(MerkleTrie().root())
+        self.assertEqual(MerkleTrie(self.leaves[:1]).root(), self.leaves[0].hex())
+        self.assertEqual(MerkleTrie(self.leaves).root(), MerkleTrie(self.leaves[::-1]).root())
+        self.assertNotEqual(MerkleTrie(self.leaves).root(), MerkleTrie(self.leaves[1:]).root())
+
+    def test_add(self):
+        trie = MerkleTrie()
+        for i, leaf in enumerate(self.leaves):
+            self.assertTrue(trie.add(leaf))
+            self.assertEqual(trie.root(), MerkleTrie(self.leaves[:i + 1]).root())
+
+        self.assertFalse(trie.add(self.leaves[3]))
+        self.assertEqual(len(trie), len(self.leaves))
+        self.assertEqual(trie.index(self.leaves[3]), 3)
+        self.assertIn(self.leaves[3], trie)
+        self.assertRaises(ValueError, trie.add, b"short")
+
+    def test_missing(self):
+        trie = MerkleTrie(self.leaves[:8])
+        other = MerkleTrie(self.leaves[4:][::-1])
+
+        self.assertEqual(trie.missing(other), sorted(self.leaves[8:]))
+        self.assertEqual(other.missing(trie), sorted(self.leaves[:4]))
+        self.assertEqual(trie.missing(trie), [])
+        self.assertEqual(MerkleTrie().missing(trie), sorted(self.leaves[:8]))